@@ -0,0 +1,9 @@
+"""
+Django Suit5 benchmarks
+
+Benchmarks are plain scripts which configure their own Django settings
+(in-memory SQLite), so they can be run offline from repository root::
+
+    python -m benchmarks.inline_formsets
+    python -m benchmarks.suite --json results.json
+"""
@@ -0,0 +1,165 @@
+"""
+Render-blocking resources and first contentful paint of admin index page
+with and without PERFORMANCE_MODE
+
+    python -m benchmarks.first_paint [repeat]
+
+First contentful paint is measured in headless Chromium with throttled
+network, when Playwright is installed (pip install playwright && playwright
+install chromium). Otherwise only render-blocking resources are reported.
+"""
+import sys
+from html.parser import HTMLParser
+
+from benchmarks.utils import setup, report
+
+setup()
+
+from django.contrib.auth.models import User
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.handlers import StaticFilesHandler
+from django.core.management import call_command
+from django.db import connections
+from django.test import Client, override_settings
+from django.test.testcases import LiveServerThread
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    sync_playwright = None
+
+CONFIGS = (
+    ('default', {}),
+    ('ASSET_BUNDLES', {'ASSET_BUNDLES': True}),
+    ('PERFORMANCE_MODE', {'PERFORMANCE_MODE': True}),
+    ('PERFORMANCE_MODE + ASSET_BUNDLES',
+     {'PERFORMANCE_MODE': True, 'ASSET_BUNDLES': True}),
+)
+
+# Roughly "Fast 3G", so differences are visible on localhost
+NETWORK = {
+    'offline': False,
+    'latency': 150,
+    'downloadThroughput': 1.6 * 1024 * 1024 / 8,
+    'uploadThroughput': 750 * 1024 / 8,
+}
+
+
+class BlockingResources(HTMLParser):
+    """
+    Collect stylesheets and scripts in <head>, which block rendering
+    """
+
+    def __init__(self):
+        HTMLParser.__init__(self)
+        self.in_head = False
+        self.stylesheets = []
+        self.scripts = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'head':
+            self.in_head = True
+        elif not self.in_head:
+            return
+        elif tag == 'link' and attrs.get('rel') == 'stylesheet' \
+                and attrs.get('href') and attrs.get('media') != 'print':
+            self.stylesheets.append(attrs['href'])
+        elif tag == 'script' and attrs.get('src') \
+                and 'defer' not in attrs and 'async' not in attrs:
+            self.scripts.append(attrs['src'])
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.in_head = False
+
+
+def static_size(url):
+    path = finders.find(url.split('?')[0].replace('/static/', '', 1))
+    if not path:
+        return 0
+    with open(path, 'rb') as f:
+        return len(f.read())
+
+
+def blocking_resources(html):
+    parser = BlockingResources()
+    parser.feed(html)
+    urls = parser.stylesheets + parser.scripts
+    return len(urls), sum(static_size(url) for url in urls)
+
+
+def start_server():
+    # Share in-memory database with server thread
+    connection = connections['default']
+    connection.inc_thread_sharing()
+    server = LiveServerThread('localhost', StaticFilesHandler,
+                              connections_override={'default': connection})
+    server.daemon = True
+    server.start()
+    server.is_ready.wait()
+    if server.error:
+        raise server.error
+    return server
+
+
+def measure_paint(browser, url, session_id, repeat):
+    timings = []
+    for i in range(repeat):
+        context = browser.new_context()
+        context.add_cookies([{'name': 'sessionid', 'value': session_id,
+                              'url': url}])
+        page = context.new_page()
+        cdp = context.new_cdp_session(page)
+        cdp.send('Network.enable')
+        cdp.send('Network.setCacheDisabled', {'cacheDisabled': True})
+        cdp.send('Network.emulateNetworkConditions', NETWORK)
+        page.goto(url, wait_until='load')
+        timings.append(page.evaluate(
+            "performance.getEntriesByName('first-contentful-paint')[0]"
+            ".startTime"))
+        context.close()
+    return {
+        'min': min(timings),
+        'mean': sum(timings) / len(timings),
+        'max': max(timings),
+        'repeat': repeat,
+    }
+
+
+def main(repeat=5):
+    call_command('migrate', verbosity=0)
+    user = User.objects.create_superuser('admin', 'admin@example.com',
+                                         'password')
+    client = Client()
+    client.force_login(user)
+    session_id = client.cookies['sessionid'].value
+
+    print('Render-blocking resources in <head> of admin index:')
+    for name, config in CONFIGS:
+        with override_settings(SUIT_CONFIG=config):
+            html = client.get('/admin/').content.decode('utf-8')
+        count, size = blocking_resources(html)
+        print('%-40s %2d files %10d bytes' % (name, count, size))
+
+    if sync_playwright is None:
+        print('Playwright is not installed, first contentful paint skipped')
+        return
+
+    server = start_server()
+    url = 'http://localhost:%d/admin/' % server.port
+    print('First contentful paint of admin index (throttled network):')
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch()
+            for name, config in CONFIGS:
+                with override_settings(SUIT_CONFIG=config):
+                    report(name, measure_paint(browser, url, session_id,
+                                               repeat))
+            browser.close()
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
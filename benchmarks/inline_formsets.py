@@ -0,0 +1,46 @@
+"""
+Sortable inline formset construction with many rows
+
+    python -m benchmarks.inline_formsets [rows]
+"""
+import sys
+
+from benchmarks.utils import setup, measure, report
+
+setup()
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+from suit5.admin import SortableTabularInline, SortableStackedInline
+from benchmarks.models import Continent, Country
+
+
+def make_inline(base, rows):
+    inline_class = type('Country%s' % base.__name__, (base,), {
+        'model': Country,
+        'extra': rows,
+    })
+    return inline_class(Continent, admin.site)
+
+
+def build_formset(inline, request, continent):
+    formset_class = inline.get_formset(request, continent)
+    formset = formset_class(instance=continent,
+                            queryset=Country.objects.none())
+    return formset.forms
+
+
+def main(rows=200):
+    request = RequestFactory().get('/admin/')
+    request.user = User(is_active=True, is_staff=True, is_superuser=True)
+    continent = Continent(name='Europe')
+
+    for base in (SortableTabularInline, SortableStackedInline):
+        inline = make_inline(base, rows)
+        stats = measure(lambda: build_formset(inline, request, continent))
+        report('%s (%d rows)' % (base.__name__, rows), stats)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class Continent(models.Model):
+    name = models.CharField(max_length=64)
+
+    def __str__(self):
+        return self.name
+
+
+class Country(models.Model):
+    continent = models.ForeignKey(Continent, on_delete=models.CASCADE)
+    name = models.CharField(max_length=64)
+    code = models.CharField(max_length=2)
+    order = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,170 @@
+"""
+Suit template tags and admin page renders with synthetic apps, models,
+menu entries and change list rows
+
+    python -m benchmarks.suite [--apps 20] [--models 10] [--menu 100]
+                               [--rows 200] [--columns 10] [--repeat 10]
+                               [--json results.json]
+
+Results are printed and, with --json, written as JSON to compare between
+releases (``-`` writes JSON to stdout).
+"""
+import argparse
+import json
+import platform
+import sys
+
+from benchmarks import synthetic
+from benchmarks.utils import setup, measure, report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--apps', type=int, default=20,
+                        help='Synthetic apps registered in admin')
+    parser.add_argument('--models', type=int, default=10,
+                        help='Models registered per synthetic app')
+    parser.add_argument('--menu', type=int, default=100,
+                        help="Entries in SUIT_CONFIG['MENU']")
+    parser.add_argument('--rows', type=int, default=200,
+                        help='Change list rows')
+    parser.add_argument('--columns', type=int, default=10,
+                        help='Change list columns')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--json', metavar='FILE',
+                        help='Write results as JSON to FILE')
+    return parser.parse_args(argv)
+
+
+def run(args):
+    app_labels = synthetic.install_apps(args.apps)
+    setup(app_labels)
+
+    import django
+    from django.contrib import admin
+    from django.contrib.admin.templatetags.admin_list import results
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.template import Context
+    from django.test import Client, RequestFactory, override_settings
+    from suit5 import VERSION
+    from suit5.templatetags.suit_list import cells_handler, \
+        result_row_attrs, suit_list_filter_select, pagination
+    from suit5.templatetags.suit_menu import get_menu
+
+    call_command('migrate', verbosity=0)
+    user = User.objects.create_superuser('admin', 'admin@example.com',
+                                         'password')
+
+    for model in synthetic.make_models(app_labels, args.models):
+        admin.site.register(model)
+
+    # Change list model in first synthetic app
+    columns = ['column%d' % i for i in range(args.columns)]
+    row_model = synthetic.make_model(app_labels[0], 'Row', args.columns)
+    synthetic.create_tables(row_model)
+    row_model.objects.bulk_create([
+        row_model(**dict(('column%d' % i, 'value %d-%d' % (row, i % 5))
+                         for i in range(args.columns)))
+        for row in range(args.rows)])
+
+    class RowAdmin(admin.ModelAdmin):
+        list_display = ['id'] + columns
+        list_filter = columns[:2]
+        list_per_page = args.rows
+
+        def suit_row_attributes(self, obj, request):
+            return {'class': 'row-%d' % (obj.pk % 3)}
+
+        def suit_cell_attributes(self, obj, column):
+            return {'class': 'cell-' + column}
+
+    admin.site.register(row_model, RowAdmin)
+    row_admin = admin.site._registry[row_model]
+    changelist_url = '/admin/%s/row/' % app_labels[0]
+    row = row_model.objects.first()
+
+    request = RequestFactory().get(changelist_url)
+    request.user = user
+    request.current_app = admin.site.name
+    context = Context({'request': request})
+    cl = row_admin.get_changelist_instance(request)
+    cl.formset = None
+    rows = list(results(cl))
+
+    # Many pages for pagination, 5 rows per page, middle page
+    row_admin.list_per_page = 5
+    paged_request = RequestFactory().get(changelist_url,
+                                         {'p': args.rows // 10})
+    paged_request.user = user
+    paged_cl = row_admin.get_changelist_instance(paged_request)
+    row_admin.list_per_page = args.rows
+
+    def all_row_attrs():
+        for i in range(1, len(rows) + 1):
+            result_row_attrs(context, cl, i)
+
+    def all_filter_selects():
+        for spec in cl.filter_specs:
+            suit_list_filter_select(cl, spec)
+
+    client = Client()
+    client.force_login(user)
+
+    menu = synthetic.make_menu(app_labels, args.models, args.menu)
+    registered = len(admin.site._registry)
+    benchmarks = [
+        ('get_menu (%d models)' % registered,
+         {}, lambda: get_menu(context, request)),
+        ('get_menu (%d MENU entries)' % args.menu,
+         {'MENU': menu}, lambda: get_menu(context, request)),
+        ('cells_handler (%dx%d)' % (args.rows, args.columns + 1),
+         {}, lambda: cells_handler(rows, cl)),
+        ('result_row_attrs (%d rows)' % args.rows,
+         {}, all_row_attrs),
+        ('suit_list_filter_select (%d filters)' % len(cl.filter_specs),
+         {}, all_filter_selects),
+        ('pagination (%d pages)' % paged_cl.paginator.num_pages,
+         {}, lambda: pagination(paged_cl)),
+        ('admin index', {}, lambda: client.get('/admin/')),
+        ('change list (%dx%d)' % (args.rows, args.columns + 1),
+         {}, lambda: client.get(changelist_url)),
+        ('change form (%d fields)' % args.columns,
+         {}, lambda: client.get('%s%d/change/' % (changelist_url, row.pk))),
+    ]
+
+    output = {
+        'meta': {
+            'suit': VERSION,
+            'django': django.get_version(),
+            'python': platform.python_version(),
+            'parameters': dict((key, value) for key, value in
+                               vars(args).items() if key != 'json'),
+        },
+        'results': {},
+    }
+    for name, config, func in benchmarks:
+        with override_settings(SUIT_CONFIG=config):
+            # Warm up template loaders and caches
+            func()
+            stats = measure(func, args.repeat)
+        output['results'][name] = stats
+        if args.json != '-':
+            report(name, stats)
+    return output
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    output = run(args)
+    if args.json == '-':
+        json.dump(output, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+    elif args.json:
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
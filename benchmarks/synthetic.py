@@ -0,0 +1,76 @@
+"""
+Synthetic apps and models, so benchmarks can scale number of registered
+models, menu entries and change list columns
+"""
+import sys
+import tempfile
+import types
+
+APP_PREFIX = 'benchmarks_app'
+
+
+def install_apps(count):
+    """
+    Create ``count`` empty app modules, return their names for
+    ``setup(extra_apps)``
+    """
+    # Empty path, so Django finds no models/admin/templatetags modules
+    path = tempfile.mkdtemp(prefix='suit5-benchmarks-')
+    names = []
+    for i in range(count):
+        name = '%s%d' % (APP_PREFIX, i)
+        module = types.ModuleType(name)
+        module.__path__ = [path]
+        sys.modules[name] = module
+        names.append(name)
+    return names
+
+
+def make_model(app_label, name, columns=0):
+    """
+    Create model class with ``columns`` char fields
+    """
+    from django.db import models
+
+    attrs = {
+        '__module__': __name__,
+        'Meta': type('Meta', (), {'app_label': app_label}),
+        '__str__': lambda self: '%s #%s' % (name, self.pk),
+    }
+    for i in range(columns):
+        attrs['column%d' % i] = models.CharField(max_length=32, default='',
+                                                 db_index=i < 2)
+    return type(name, (models.Model,), attrs)
+
+
+def make_models(app_labels, per_app):
+    return [make_model(app_label, 'Model%d' % i)
+            for app_label in app_labels for i in range(per_app)]
+
+
+def create_tables(*model_classes):
+    from django.db import connection
+
+    with connection.schema_editor() as editor:
+        for model in model_classes:
+            editor.create_model(model)
+
+
+def make_menu(app_labels, models_per_app, entries):
+    """
+    Return SUIT_CONFIG['MENU'] with given number of entries, alternating
+    app entries with custom links to models
+    """
+    menu = []
+    for i in range(entries):
+        app_label = app_labels[i % len(app_labels)]
+        model_names = ['model%d' % j for j in range(models_per_app)]
+        if i % 2:
+            menu.append({'app': app_label, 'models': model_names})
+        else:
+            menu.append({
+                'label': 'Link %d' % i, 'url': '/link/%d/' % i,
+                'models': ['%s.%s' % (app_label, model_name)
+                           for model_name in model_names[:3]],
+            })
+    return menu
@@ -0,0 +1,163 @@
+"""
+Compile and render cost of Suit template overrides with and without
+cached template loader
+
+    python -m benchmarks.templates [prefix ...] [--repeat 20]
+                                   [--json results.json]
+
+For every template in ``suit5/templates`` (or only names starting with
+given prefixes) reports milliseconds to load and compile it, and to render
+it with its ``{% extends %}``/``{% include %}`` chain using loaders without
+and with ``django.template.loaders.cached.Loader``. Templates of apps, which
+are not installed (filer, cms, ...), are reported as skipped.
+"""
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.utils import setup, measure
+
+LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('prefixes', nargs='*', metavar='prefix',
+                        help='Only templates starting with prefix, '
+                             'e.g. admin/change_')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--json', metavar='FILE',
+                        help='Write results as JSON to FILE')
+    return parser.parse_args(argv)
+
+
+def template_names(prefixes=()):
+    import suit5
+    root = os.path.join(os.path.dirname(suit5.__file__), 'templates')
+    names = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith('.html'):
+                name = os.path.relpath(os.path.join(dirpath, filename), root)
+                names.append(name.replace(os.sep, '/'))
+    return sorted(name for name in names
+                  if not prefixes or name.startswith(tuple(prefixes)))
+
+
+def make_engine(cached):
+    """
+    Django template engine with all installed template tag libraries
+    """
+    from django.conf import settings
+    from django.template.backends.django import DjangoTemplates
+
+    options = dict(settings.TEMPLATES[0]['OPTIONS'])
+    options['loaders'] = [('django.template.loaders.cached.Loader',
+                           LOADERS)] if cached else LOADERS
+    return DjangoTemplates({
+        'NAME': 'cached' if cached else 'uncached',
+        'DIRS': [],
+        'APP_DIRS': False,
+        'OPTIONS': options,
+    }).engine
+
+
+def run(args):
+    setup()
+
+    import django
+    from django.contrib import admin
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.template import RequestContext, TemplateSyntaxError
+    from django.test import RequestFactory
+    from suit5 import VERSION
+
+    call_command('migrate', verbosity=0)
+    user = User.objects.create_superuser('admin', 'admin@example.com',
+                                         'password')
+    request = RequestFactory().get('/admin/')
+    request.user = user
+    request.current_app = admin.site.name
+
+    uncached = make_engine(cached=False)
+    cached = make_engine(cached=True)
+
+    def render(engine, name):
+        context = RequestContext(request, admin.site.each_context(request))
+        engine.get_template(name).render(context)
+
+    output = {
+        'meta': {
+            'suit': VERSION,
+            'django': django.get_version(),
+            'python': '%d.%d.%d' % sys.version_info[:3],
+            'parameters': {'repeat': args.repeat,
+                           'prefixes': args.prefixes},
+        },
+        'results': {},
+        'skipped': {},
+    }
+    columns = ('compile', 'render uncached', 'render cached')
+    if args.json != '-':
+        print('%-56s %10s %16s %14s' % (('template',) + columns))
+    totals = dict((column, 0.0) for column in columns)
+    for name in template_names(args.prefixes):
+        try:
+            uncached.get_template(name)
+        except TemplateSyntaxError as e:
+            # Template tags of app, which is not installed
+            output['skipped'][name] = str(e).split('\n')[0]
+            continue
+        result = {'compile': measure(lambda: uncached.get_template(name),
+                                     args.repeat)}
+        try:
+            # Warm up cached loader
+            render(cached, name)
+        except Exception as e:
+            # Template needs context of its view
+            result['render error'] = '%s: %s' % (type(e).__name__, e)
+        else:
+            result['render uncached'] = measure(
+                lambda: render(uncached, name), args.repeat)
+            result['render cached'] = measure(
+                lambda: render(cached, name), args.repeat)
+        output['results'][name] = result
+
+        cells = []
+        for column in columns:
+            if column in result:
+                totals[column] += result[column]['mean']
+                cells.append('%.3fms' % result[column]['mean'])
+            else:
+                cells.append('-')
+        if args.json != '-':
+            print('%-56s %10s %16s %14s' % tuple([name] + cells))
+
+    output['totals'] = totals
+    if args.json != '-':
+        print('%-56s %10s %16s %14s' % tuple(
+            ['total (mean)'] + ['%.3fms' % totals[c] for c in columns]))
+        for name, reason in sorted(output['skipped'].items()):
+            print('skipped %s: %s' % (name, reason))
+    return output
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    output = run(args)
+    if args.json == '-':
+        json.dump(output, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+    elif args.json:
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
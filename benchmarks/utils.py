@@ -0,0 +1,37 @@
+import os
+import time
+
+
+def setup(extra_apps=()):
+    """
+    Configure Django with benchmark settings
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+    import django
+    if extra_apps:
+        from django.conf import settings
+        settings.INSTALLED_APPS = list(settings.INSTALLED_APPS) + \
+            list(extra_apps)
+    django.setup()
+
+
+def measure(func, repeat=10):
+    """
+    Call func ``repeat`` times and return timings in milliseconds
+    """
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'min': min(timings),
+        'mean': sum(timings) / len(timings),
+        'max': max(timings),
+        'repeat': repeat,
+    }
+
+
+def report(name, stats):
+    print('%-40s min %8.2fms  mean %8.2fms  max %8.2fms' % (
+        name, stats['min'], stats['mean'], stats['max']))
@@ -0,0 +1,64 @@
+"""
+Generated apps with generated models, to test Suit menu with many apps.
+
+Enabled with environment variables (tables are created by
+``migrate --run-syncdb``, which setup_demo.py runs)::
+
+    DEMO_EXTRA_APPS=50 DEMO_EXTRA_MODELS=20 python setup_demo.py
+    DEMO_EXTRA_APPS=50 DEMO_EXTRA_MODELS=20 python manage.py runserver
+"""
+import os
+import sys
+import types
+
+from django.apps import AppConfig
+
+APP_PREFIX = 'demo_extra'
+
+
+class ExtraAppConfig(AppConfig):
+    models_count = 0
+    # Apps have no templates or static files
+    path = os.path.dirname(os.path.abspath(__file__))
+
+    def import_models(self):
+        from django.db import models
+
+        self.models = self.apps.all_models[self.label]
+        # Models are listed as unmigrated app models by migrate --run-syncdb
+        self.models_module = self.module
+        for i in range(self.models_count):
+            type('Item%d' % i, (models.Model,), {
+                '__module__': self.name,
+                'name': models.CharField(max_length=100),
+                'created_at': models.DateTimeField(auto_now_add=True),
+                '__str__': lambda obj: obj.name,
+            })
+
+    def ready(self):
+        from django.contrib import admin
+
+        for model in self.get_models():
+            admin.site.register(model, list_display=('name', 'created_at'))
+
+
+def install(apps_count, models_count):
+    """
+    Create app modules and config classes, return INSTALLED_APPS entries
+    """
+    entries = []
+    for i in range(apps_count):
+        name = '%s%d' % (APP_PREFIX, i)
+        module = types.ModuleType(name)
+        # No submodules, so Django doesn't find models/admin/templatetags
+        module.__path__ = []
+        sys.modules[name] = module
+        config_name = 'ExtraApp%dConfig' % i
+        setattr(sys.modules[__name__], config_name, type(
+            config_name, (ExtraAppConfig,), {
+                'name': name,
+                'verbose_name': 'Extra app %d' % i,
+                'models_count': models_count,
+            }))
+        entries.append('%s.%s' % (__name__, config_name))
+    return entries
@@ -31,6 +31,12 @@ INSTALLED_APPS = [
     'testapp',
 ]
 
+# Many generated apps and models to test menu scaling, see demo/extra_apps.py
+from demo import extra_apps  # noqa: E402
+INSTALLED_APPS += extra_apps.install(
+    int(os.environ.get('DEMO_EXTRA_APPS', 0)),
+    int(os.environ.get('DEMO_EXTRA_MODELS', 10)))
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -2,7 +2,13 @@
 """
 Setup script for the Django Suit5 demo project.
 Creates database, superuser, and sample data.
+
+Large synthetic dataset for profiling can be added with scale factor
+(see testapp/management/commands/seed_demo.py)::
+
+    python setup_demo.py --scale 100 --seed 1
 """
+import argparse
 import os
 import sys
 import django
@@ -292,11 +298,21 @@ def create_site_settings():
 
 def main():
     """Run all setup tasks."""
+    parser = argparse.ArgumentParser(description='Django Suit5 demo setup')
+    parser.add_argument('--scale', type=float, default=0,
+                        help='Also seed synthetic data, 1 = 1,000 products '
+                             'and 2,000 orders')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed of synthetic data')
+    parser.add_argument('--batch-size', type=int, default=5000)
+    args = parser.parse_args()
+
     print("\n=== Django Suit5 Demo Setup ===\n")
 
     from django.core.management import call_command
     print("Running migrations...")
-    call_command('migrate', verbosity=0)
+    # Syncdb creates tables of generated apps (DEMO_EXTRA_APPS)
+    call_command('migrate', run_syncdb=True, verbosity=0)
 
     create_superuser()
     create_categories()
@@ -305,6 +321,11 @@ def main():
     create_orders()
     create_site_settings()
 
+    if args.scale:
+        print(f"Seeding synthetic data (scale {args.scale})...")
+        call_command('seed_demo', scale=args.scale, seed=args.seed,
+                     batch_size=args.batch_size)
+
     print("\n=== Setup Complete ===")
     print("\nRun the development server with:")
     print("  cd example && python manage.py runserver")
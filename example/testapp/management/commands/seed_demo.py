@@ -0,0 +1,230 @@
+"""
+Bulk synthetic data for profiling Suit change lists and menu.
+
+    python manage.py seed_demo --scale 100 --seed 1
+
+Scale 1 creates 1,000 products, 200 customers, 2,000 orders and ~5,000
+order items, so scale 1000 gives millions of rows. Rows are numbered and
+every row is generated with its own deterministic seed, so running command
+again with larger scale only adds missing rows, same as a single run with
+that scale would create them, regardless of --batch-size.
+"""
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from testapp.models import Category, Product, Customer, Order, OrderItem
+
+PREFIX = 'seed'
+PER_SCALE = {
+    'product': 1000,
+    'customer': 200,
+    'order': 2000,
+}
+CATEGORIES = 50
+MAX_ITEMS = 4
+CITIES = ('Berlin', 'Chicago', 'Lisbon', 'Osaka', 'Riga', 'Toronto',
+          'Sydney', 'Nairobi', 'Lima', 'Oslo')
+WORDS = ('alpha', 'basic', 'classic', 'deluxe', 'eco', 'flex', 'giga',
+         'hyper', 'lite', 'max', 'nano', 'pro', 'smart', 'ultra', 'zen')
+
+
+def existing(kind, order_number):
+    """
+    Number of rows of kind, which exist at every scale with this order, so
+    orders reference the same rows whatever scale they were seeded with
+    """
+    return max(1, PER_SCALE[kind] * (order_number + 1) // PER_SCALE['order'])
+
+
+def product_price(number):
+    """
+    Price of product is derived from its number, so order items don't need
+    to load products
+    """
+    return Decimal(5 + number * 7919 % 1995) - Decimal('0.01')
+
+
+class Command(BaseCommand):
+    help = 'Create large synthetic dataset of products, customers and orders.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1,
+                            help='Scale factor, 1 = 1,000 products and '
+                                 '2,000 orders (default: 1)')
+        parser.add_argument('--seed', type=int, default=0,
+                            help='Random seed (default: 0)')
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help='Rows per bulk_create (default: 5000)')
+        parser.add_argument('--clear', action='store_true',
+                            help='Delete previously seeded rows first')
+
+    def handle(self, *args, **options):
+        if options['scale'] <= 0 or options['batch_size'] <= 0:
+            raise CommandError('--scale and --batch-size must be positive.')
+        self.seed = options['seed']
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        counts = dict((kind, int(per_scale * options['scale']))
+                      for kind, per_scale in PER_SCALE.items())
+
+        if options['clear']:
+            self.clear()
+
+        self.categories = self.seed_categories()
+        self.seed_rows(Product, 'product', counts['product'],
+                       self.make_products)
+        self.seed_rows(Customer, 'customer', counts['customer'],
+                       self.make_customers)
+        self.seed_rows(Order, 'order', counts['order'], self.make_orders)
+        self.reset_sequences()
+
+    def rng(self, kind, number):
+        # Independent of rows created before, so seeding can resume anywhere
+        return random.Random('%s-%s-%d' % (self.seed, kind, number))
+
+    def seeded(self, model):
+        field, prefix = {
+            Category: ('slug', PREFIX),
+            Product: ('sku', PREFIX.upper()),
+            Customer: ('email', PREFIX),
+            Order: ('order_number', PREFIX.upper()),
+        }[model]
+        # Matched exactly as stored, LIKE is case sensitive on PostgreSQL
+        return model.objects.filter(**{field + '__startswith': prefix + '-'})
+
+    def clear(self):
+        OrderItem.objects.filter(order__in=self.seeded(Order)).delete()
+        for model in (Order, Customer, Product):
+            self.seeded(model).delete()
+        self.seeded(Category).delete()
+        self.stdout.write('Deleted seeded rows')
+
+    def seed_categories(self):
+        existing = set(self.seeded(Category).values_list('slug', flat=True))
+        Category.objects.bulk_create([
+            Category(name='Seeded %d' % i, slug='%s-category-%d' % (PREFIX, i))
+            for i in range(CATEGORIES)
+            if '%s-category-%d' % (PREFIX, i) not in existing])
+        return list(self.seeded(Category).order_by('slug')
+                    .values_list('pk', flat=True))
+
+    def seed_rows(self, model, kind, total, make_batch):
+        """
+        Create rows numbered from 0 to ``total`` which don't exist yet
+        """
+        start = self.seeded(model).count()
+        if start >= total:
+            self.stdout.write('%d seeded %s rows exist' % (start, kind))
+            return
+        next_pk = (model.objects.aggregate(pk=Max('pk'))['pk'] or 0) + 1
+        number = start
+        while number < total:
+            end = min(total, number + self.batch_size)
+            with transaction.atomic():
+                make_batch(kind, number, end, next_pk)
+            next_pk += end - number
+            number = end
+            self.stdout.write('%s: %d/%d' % (kind, number, total))
+
+    def make_products(self, kind, start, end, first_pk):
+        products = []
+        for number in range(start, end):
+            rng = self.rng(kind, number)
+            name = '%s %s %d' % (rng.choice(WORDS).title(),
+                                 rng.choice(WORDS), number)
+            price = product_price(number)
+            products.append(Product(
+                pk=first_pk + number - start,
+                name=name,
+                slug='%s-product-%d' % (PREFIX, number),
+                sku='%s-%08d' % (PREFIX.upper(), number),
+                category_id=rng.choice(self.categories),
+                price=price,
+                sale_price=price * Decimal('0.9') if rng.random() < 0.2
+                else None,
+                stock_quantity=rng.randint(0, 500),
+                is_featured=rng.random() < 0.05,
+                status=rng.choice(('draft', 'published', 'published',
+                                   'archived')),
+                tags=', '.join(rng.sample(WORDS, 3)),
+            ))
+        Product.objects.bulk_create(products)
+
+    def make_customers(self, kind, start, end, first_pk):
+        customers = []
+        for number in range(start, end):
+            rng = self.rng(kind, number)
+            customers.append(Customer(
+                pk=first_pk + number - start,
+                first_name=rng.choice(WORDS).title(),
+                last_name='Customer%d' % number,
+                email='%s-%d@example.com' % (PREFIX, number),
+                city=rng.choice(CITIES),
+                country='Country %d' % rng.randint(1, 30),
+                membership=rng.choice(('basic', 'basic', 'silver', 'gold',
+                                       'platinum')),
+                date_joined=self.now - timedelta(days=rng.randint(0, 2000)),
+            ))
+        Customer.objects.bulk_create(customers)
+
+    def make_orders(self, kind, start, end, first_pk):
+        if not hasattr(self, 'product_pks'):
+            # Index in list is number of product (sku is zero padded) or
+            # customer (primary keys are assigned in order of numbers)
+            self.product_pks = list(self.seeded(Product).order_by('sku')
+                                    .values_list('pk', flat=True))
+            self.customer_pks = list(self.seeded(Customer).order_by('pk')
+                                     .values_list('pk', flat=True))
+        if not self.product_pks or not self.customer_pks:
+            raise CommandError('Seed products and customers first.')
+
+        orders, items = [], []
+        for number in range(start, end):
+            rng = self.rng(kind, number)
+            pk = first_pk + number - start
+            subtotal = Decimal('0.00')
+            products = min(existing('product', number), len(self.product_pks))
+            for i in range(rng.randint(1, MAX_ITEMS)):
+                product_number = rng.randrange(products)
+                quantity = rng.randint(1, 5)
+                price = product_price(product_number)
+                items.append(OrderItem(
+                    order_id=pk, product_id=self.product_pks[product_number],
+                    quantity=quantity, unit_price=price,
+                    total_price=price * quantity))
+                subtotal += price * quantity
+            status = rng.choice(('pending', 'processing', 'shipped',
+                                 'delivered', 'delivered', 'cancelled'))
+            tax = (subtotal * Decimal('0.08')).quantize(Decimal('0.01'))
+            is_paid = status in ('shipped', 'delivered')
+            orders.append(Order(
+                pk=pk,
+                order_number='%s-%09d' % (PREFIX.upper(), number),
+                customer_id=self.customer_pks[rng.randrange(min(
+                    existing('customer', number), len(self.customer_pks)))],
+                status=status,
+                payment_method=rng.choice(('credit_card', 'paypal',
+                                           'bank_transfer', 'cash')),
+                subtotal=subtotal, tax=tax, total=subtotal + tax,
+                shipping_address='Seeded address %d' % number,
+                is_paid=is_paid,
+                paid_at=self.now - timedelta(minutes=rng.randint(0, 10 ** 6))
+                if is_paid else None,
+            ))
+        Order.objects.bulk_create(orders)
+        OrderItem.objects.bulk_create(items)
+
+    def reset_sequences(self):
+        # Primary keys were set explicitly
+        sql = connection.ops.sequence_reset_sql(
+            no_style(), [Product, Customer, Order, OrderItem])
+        with connection.cursor() as cursor:
+            for statement in sql:
+                cursor.execute(statement)
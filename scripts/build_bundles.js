@@ -0,0 +1,120 @@
+#!/usr/bin/env node
+/**
+ * Build content-hashed Suit asset bundles
+ *
+ * Combines Bootstrap 5, Bootstrap Icons and Suit stylesheets into one CSS
+ * bundle and jQuery, Bootstrap 5 and suit.js into one JS bundle. Output goes
+ * to suit5/static/suit5/dist/ together with manifest.json, which is read by
+ * {% suit_bundle_url %} template tag.
+ *
+ * Usage:
+ *   node scripts/build_bundles.js     (or: npm run build:bundles)
+ *
+ * JavaScript is minified with terser (devDependency, npm install), build
+ * fails when it is missing.
+ */
+'use strict';
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+
+const STATIC_DIR = path.join(__dirname, '..', 'suit5', 'static', 'suit5');
+const DIST_DIR = path.join(STATIC_DIR, 'dist');
+const MANIFEST = path.join(DIST_DIR, 'manifest.json');
+
+const BUNDLES = {
+    'suit.css': [
+        'bootstrap5/css/bootstrap.min.css',
+        'icons/bootstrap-icons.min.css',
+        'css/suit.css',
+    ],
+    // Same with purged Bootstrap and subsetted icons (scripts/build_vendor.js)
+    'suit.subset.css': [
+        'bootstrap5/css/bootstrap.purged.min.css',
+        'icons/bootstrap-icons.subset.css',
+        'css/suit.css',
+    ],
+    'suit.js': [
+        'js/jquery-3.7.1.min.js',
+        'js/suit-namespace.js',
+        'bootstrap5/js/bootstrap.bundle.min.js',
+        'js/suit.js',
+    ],
+};
+
+/**
+ * Rewrite relative url(...) references, so they keep pointing to the same
+ * files when stylesheet is moved to dist/ directory
+ */
+function rebaseUrls(css, source) {
+    const sourceDir = path.dirname(path.join(STATIC_DIR, source));
+    const pattern = /url\(\s*(?:"([^"]*)"|'([^']*)'|([^'")\s]+))\s*\)/g;
+    return css.replace(pattern, (match, double, single, bare) => {
+        const url = double || single || bare;
+        if (/^(data:|https?:|\/|#)/.test(url)) {
+            return match;
+        }
+        const rebased = path.relative(DIST_DIR, path.join(sourceDir, url));
+        return 'url("' + rebased.split(path.sep).join('/') + '")';
+    });
+}
+
+function stripSourceMaps(code) {
+    return code.replace(/^\s*\/[/*][#@]\s*sourceMappingURL=.*$/gm, '');
+}
+
+function readSource(item, type) {
+    let code = stripSourceMaps(fs.readFileSync(path.join(STATIC_DIR, item), 'utf8'));
+    if (type === 'css') {
+        code = rebaseUrls(code, item);
+    }
+    return code;
+}
+
+function requireTerser() {
+    try {
+        return require('terser');
+    } catch (e) {
+        throw new Error('terser is not installed, run npm install first');
+    }
+}
+
+async function minifyJs(terser, code) {
+    const result = await terser.minify(code, {compress: true, mangle: true});
+    return result.code;
+}
+
+async function build() {
+    // Fail before previous bundles are removed
+    const terser = requireTerser();
+    fs.mkdirSync(DIST_DIR, {recursive: true});
+
+    // Remove previously built bundles
+    for (const file of fs.readdirSync(DIST_DIR)) {
+        fs.unlinkSync(path.join(DIST_DIR, file));
+    }
+
+    const manifest = {};
+    for (const [name, sources] of Object.entries(BUNDLES)) {
+        const ext = path.extname(name);
+        const type = ext.slice(1);
+        let code = sources.map(item => readSource(item, type))
+            .join(type === 'js' ? ';\n' : '\n');
+        if (type === 'js') {
+            code = await minifyJs(terser, code);
+        }
+        const hash = crypto.createHash('md5').update(code).digest('hex').slice(0, 12);
+        const hashedName = path.basename(name, ext) + '.' + hash + ext;
+        fs.writeFileSync(path.join(DIST_DIR, hashedName), code);
+        manifest[name] = hashedName;
+        console.log(name + ' -> dist/' + hashedName + ' (' + code.length + ' bytes)');
+    }
+
+    fs.writeFileSync(MANIFEST, JSON.stringify(manifest, null, 2) + '\n');
+}
+
+build().catch(err => {
+    console.error(err);
+    process.exit(1);
+});
@@ -0,0 +1,250 @@
+#!/usr/bin/env node
+/**
+ * Build purged Bootstrap CSS and subsetted Bootstrap Icons
+ *
+ * Scans Suit templates, scripts, SCSS and Python sources (and Bootstrap JS,
+ * for classes it toggles at runtime) for words which may be CSS class names
+ * and removes all Bootstrap and Bootstrap Icons rules, which use other
+ * classes. Output is used when SUIT_CONFIG['VENDOR_SUBSET'] is enabled:
+ *
+ *   suit5/static/suit5/bootstrap5/css/bootstrap.purged.min.css
+ *   suit5/static/suit5/icons/bootstrap-icons.subset.css
+ *   suit5/static/suit5/icons/fonts/bootstrap-icons.subset.woff2
+ *
+ * Usage:
+ *   node scripts/build_vendor.js [extra paths...]   (or: npm run build:vendor)
+ *
+ * Extra paths (e.g. your project templates) are scanned too. Icon font is
+ * subsetted with pyftsubset (pip install fonttools brotli), when it is
+ * installed, otherwise subset CSS keeps using full font.
+ */
+'use strict';
+
+const childProcess = require('child_process');
+const fs = require('fs');
+const path = require('path');
+
+const ROOT = path.join(__dirname, '..');
+const STATIC_DIR = path.join(ROOT, 'suit5', 'static', 'suit5');
+
+const SOURCES = [path.join(ROOT, 'suit5')];
+const SOURCE_EXTENSIONS = ['.html', '.js', '.scss', '.py', '.txt'];
+// Legacy and vendor files, which would only add noise
+const SKIP_SOURCES = /\/(bootstrap|less|dist|jquery-[\d.]+\.min\.js)$/;
+// Scanned for classes toggled by Bootstrap plugins (show, collapsing etc.)
+const BOOTSTRAP_JS = path.join(STATIC_DIR, 'bootstrap5', 'js', 'bootstrap.bundle.min.js');
+
+const BOOTSTRAP = {
+    source: 'bootstrap5/css/bootstrap.min.css',
+    output: 'bootstrap5/css/bootstrap.purged.min.css',
+};
+const ICONS = {
+    source: 'icons/bootstrap-icons.min.css',
+    output: 'icons/bootstrap-icons.subset.css',
+    font: 'icons/fonts/bootstrap-icons.woff2',
+    fontOutput: 'icons/fonts/bootstrap-icons.subset.woff2',
+};
+
+// At-rules, which contain other rules and are purged recursively
+const NESTED_AT_RULES = /^@(media|supports|layer|container)\b/;
+
+function collectFiles(source, files) {
+    if (SKIP_SOURCES.test(source.split(path.sep).join('/'))) {
+        return files;
+    }
+    const stat = fs.statSync(source);
+    if (stat.isDirectory()) {
+        for (const name of fs.readdirSync(source)) {
+            collectFiles(path.join(source, name), files);
+        }
+    } else if (SOURCE_EXTENSIONS.includes(path.extname(source))) {
+        files.add(source);
+    }
+    return files;
+}
+
+function collectWords(sources) {
+    const files = new Set();
+    sources.forEach(source => collectFiles(path.resolve(source), files));
+    files.add(BOOTSTRAP_JS);
+
+    const words = new Set();
+    for (const file of files) {
+        const content = fs.readFileSync(file, 'utf8');
+        for (const word of content.match(/[A-Za-z0-9_-]+/g) || []) {
+            words.add(word);
+        }
+    }
+    return words;
+}
+
+/**
+ * Return index of first char from `chars` at nesting level 0, skipping
+ * strings, comments and parentheses
+ */
+function findTopLevel(css, start, chars) {
+    let depth = 0;
+    for (let i = start; i < css.length; i++) {
+        const c = css[i];
+        if (c === '"' || c === "'") {
+            i = css.indexOf(c, i + 1);
+            if (i === -1) {
+                return css.length;
+            }
+        } else if (c === '/' && css[i + 1] === '*') {
+            i = css.indexOf('*/', i + 2) + 1;
+            if (i === 0) {
+                return css.length;
+            }
+        } else if (c === '(' || (c === '{' && !chars.includes(c))) {
+            depth++;
+        } else if (c === ')' || (c === '}' && depth > 0)) {
+            depth--;
+        } else if (depth === 0 && chars.includes(c)) {
+            return i;
+        }
+    }
+    return css.length;
+}
+
+function parse(css) {
+    const nodes = [];
+    let i = 0;
+    while (i < css.length) {
+        // Keep comments (license) as they are, so they do not end up in selectors
+        const comment = css.slice(i).match(/^\s*(\/\*[\s\S]*?\*\/)/);
+        if (comment) {
+            nodes.push({raw: comment[1]});
+            i += comment[0].length;
+            continue;
+        }
+        const end = findTopLevel(css, i, '{;}');
+        const prelude = css.slice(i, end).trim();
+        if (end >= css.length || css[end] !== '{') {
+            if (prelude) {
+                nodes.push({raw: prelude + ';'});
+            }
+            i = end + 1;
+            continue;
+        }
+        const close = findTopLevel(css, end + 1, '}');
+        const body = css.slice(end + 1, close);
+        if (NESTED_AT_RULES.test(prelude)) {
+            nodes.push({prelude: prelude, children: parse(body)});
+        } else {
+            nodes.push({prelude: prelude, body: body});
+        }
+        i = close + 1;
+    }
+    return nodes;
+}
+
+function splitSelectors(prelude) {
+    const selectors = [];
+    let i = 0;
+    while (i <= prelude.length) {
+        const end = findTopLevel(prelude, i, ',');
+        selectors.push(prelude.slice(i, end).trim());
+        i = end + 1;
+    }
+    return selectors;
+}
+
+function isUsed(selector, words) {
+    // Classes inside :not() do not need to be present
+    const classes = selector.replace(/:not\([^)]*\)/g, '')
+        .match(/\.-?[_a-zA-Z][\w-]*/g) || [];
+    return classes.every(cls => words.has(cls.slice(1)));
+}
+
+function purge(nodes, words) {
+    const result = [];
+    for (const node of nodes) {
+        if (node.raw || node.prelude[0] === '@' && !node.children) {
+            // @charset, @font-face, @keyframes etc.
+            result.push(node);
+        } else if (node.children) {
+            const children = purge(node.children, words);
+            if (children.length) {
+                result.push({prelude: node.prelude, children: children});
+            }
+        } else {
+            const selectors = splitSelectors(node.prelude)
+                .filter(selector => isUsed(selector, words));
+            if (selectors.length) {
+                result.push({prelude: selectors.join(','), body: node.body});
+            }
+        }
+    }
+    return result;
+}
+
+function serialize(nodes) {
+    return nodes.map(node => {
+        if (node.raw) {
+            return node.raw;
+        }
+        const body = node.children ? serialize(node.children) : node.body;
+        return node.prelude + '{' + body + '}';
+    }).join('');
+}
+
+function purgeFile(config, words) {
+    const source = path.join(STATIC_DIR, config.source);
+    const css = fs.readFileSync(source, 'utf8')
+        .replace(/\/\*#\s*sourceMappingURL=.*?\*\//g, '');
+    const purged = serialize(purge(parse(css), words));
+    console.log(config.source + ' -> ' + config.output + ' (' + css.length +
+        ' -> ' + purged.length + ' bytes)');
+    return purged;
+}
+
+function iconCodepoints(css) {
+    const codepoints = new Set();
+    const pattern = /content:\s*["']\\([0-9a-fA-F]+)["']/g;
+    let match;
+    while ((match = pattern.exec(css))) {
+        codepoints.add('U+' + match[1].toUpperCase());
+    }
+    return Array.from(codepoints).sort();
+}
+
+function subsetFont(codepoints) {
+    const output = path.join(STATIC_DIR, ICONS.fontOutput);
+    const result = childProcess.spawnSync('pyftsubset', [
+        path.join(STATIC_DIR, ICONS.font),
+        '--unicodes=' + codepoints.join(','),
+        '--flavor=woff2',
+        '--layout-features=',
+        '--no-hinting',
+        '--output-file=' + output,
+    ], {stdio: 'inherit'});
+    if (result.error || result.status !== 0) {
+        console.warn('pyftsubset is not installed or failed, icons use full font');
+        if (fs.existsSync(output)) {
+            fs.unlinkSync(output);
+        }
+        return false;
+    }
+    console.log(ICONS.font + ' -> ' + ICONS.fontOutput + ' (' +
+        fs.statSync(path.join(STATIC_DIR, ICONS.font)).size + ' -> ' +
+        fs.statSync(output).size + ' bytes, ' + codepoints.length + ' icons)');
+    return true;
+}
+
+function build() {
+    const words = collectWords(SOURCES.concat(process.argv.slice(2)));
+
+    fs.writeFileSync(path.join(STATIC_DIR, BOOTSTRAP.output),
+        purgeFile(BOOTSTRAP, words));
+
+    let icons = purgeFile(ICONS, words);
+    if (subsetFont(iconCodepoints(icons))) {
+        const fontUrl = path.relative(path.dirname(ICONS.output), ICONS.fontOutput);
+        icons = icons.replace(/src:[^;}]*/,
+            'src:url("' + fontUrl + '") format("woff2")');
+    }
+    fs.writeFileSync(path.join(STATIC_DIR, ICONS.output), icons);
+}
+
+build();
@@ -0,0 +1,256 @@
+#!/usr/bin/env node
+/**
+ * Incremental Suit stylesheet builder
+ *
+ * Compiles Suit SCSS entry points and watches scss/ directory for changes.
+ * Keeps @import/@use/@forward dependency graph of all SCSS files, collects
+ * bursts of file system events and recompiles only entry points, which
+ * depend on changed files, with one long-lived Sass compiler.
+ *
+ * Usage:
+ *   node scripts/watch_styles.js [--once] [--style=compressed]
+ *   (or: npm run watch:css)
+ *
+ * Uses sass-embedded when it is installed, otherwise sass. Watching needs
+ * Node.js >= 20 on Linux, where recursive fs.watch() is supported since
+ * then (macOS and Windows: any supported Node.js version), --once works
+ * everywhere.
+ */
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const url = require('url');
+
+const STATIC_DIR = path.join(__dirname, '..', 'suit5', 'static', 'suit5');
+const SCSS_DIR = path.join(STATIC_DIR, 'scss');
+
+const ENTRIES = [
+    {source: 'scss/suit.scss', output: 'css/suit.css'},
+    {source: 'scss/critical.scss', output: 'css/critical.css'},
+    {source: 'scss/vendor/_djangocms.scss', output: 'css/djangocms.css'},
+];
+
+// Wait for editor/git bursts of events to settle
+const DEBOUNCE_MS = 100;
+
+const IMPORT_RULE = /@(?:import|use|forward)\s+([^;]+);/g;
+const QUOTED = /["']([^"']+)["']/g;
+
+function stripComments(scss) {
+    return scss.replace(/\/\*[\s\S]*?\*\//g, '').replace(/(^|[^:])\/\/.*$/gm, '$1');
+}
+
+/**
+ * Resolve Sass import URL to file path, same way as Sass does for
+ * partials, extensions and index files
+ */
+function resolveImport(importUrl, fromFile) {
+    if (/^(sass:|https?:|\/\/)/.test(importUrl) || /\.css$/.test(importUrl)) {
+        return null;
+    }
+    const base = path.resolve(path.dirname(fromFile), importUrl);
+    const dir = path.dirname(base);
+    const name = path.basename(base);
+    const candidates = /\.s[ac]ss$/.test(name) ?
+        [base, path.join(dir, '_' + name)] :
+        ['.scss', '.sass'].reduce((result, ext) => result.concat([
+            path.join(dir, name + ext),
+            path.join(dir, '_' + name + ext),
+            path.join(base, '_index' + ext),
+            path.join(base, 'index' + ext),
+        ]), []);
+    return candidates.find(candidate => fs.existsSync(candidate)) || null;
+}
+
+class DependencyGraph {
+    constructor() {
+        // File path -> Set of directly imported file paths
+        this.imports = new Map();
+    }
+
+    update(file) {
+        if (!fs.existsSync(file)) {
+            this.imports.delete(file);
+            return;
+        }
+        const imports = new Set();
+        const scss = stripComments(fs.readFileSync(file, 'utf8'));
+        let rule, quoted;
+        IMPORT_RULE.lastIndex = 0;
+        while ((rule = IMPORT_RULE.exec(scss))) {
+            QUOTED.lastIndex = 0;
+            while ((quoted = QUOTED.exec(rule[1]))) {
+                const resolved = resolveImport(quoted[1], file);
+                if (resolved) {
+                    imports.add(resolved);
+                }
+            }
+        }
+        this.imports.set(file, imports);
+        for (const imported of imports) {
+            if (!this.imports.has(imported)) {
+                this.update(imported);
+            }
+        }
+    }
+
+    /**
+     * All files which given entry point depends on, including itself
+     */
+    dependencies(entry) {
+        const seen = new Set();
+        const stack = [entry];
+        while (stack.length) {
+            const file = stack.pop();
+            if (seen.has(file)) {
+                continue;
+            }
+            seen.add(file);
+            stack.push(...(this.imports.get(file) || []));
+        }
+        return seen;
+    }
+
+    affected(entries, files) {
+        return entries.filter(entry => {
+            const dependencies = this.dependencies(entry.sourcePath);
+            return files.some(file => dependencies.has(file));
+        });
+    }
+}
+
+async function createCompiler() {
+    let sass;
+    try {
+        sass = require('sass-embedded');
+    } catch (e) {
+        sass = require('sass');
+    }
+    if (typeof sass.initAsyncCompiler === 'function') {
+        return sass.initAsyncCompiler();
+    }
+    // sass < 1.70 compiles in this process anyway
+    return {compileAsync: sass.compileAsync.bind(sass), dispose: () => null};
+}
+
+async function compile(compiler, entry, style) {
+    const started = Date.now();
+    const result = await compiler.compileAsync(entry.sourcePath, {
+        style: style,
+        sourceMap: true,
+        loadPaths: [SCSS_DIR],
+    });
+    const outputDir = path.dirname(entry.outputPath);
+    const mapName = path.basename(entry.outputPath) + '.map';
+    const sourceMap = Object.assign({}, result.sourceMap, {
+        sourceRoot: '',
+        sources: result.sourceMap.sources.map(source => path.relative(
+            outputDir, url.fileURLToPath(source)).split(path.sep).join('/')),
+    });
+    fs.writeFileSync(entry.outputPath,
+        result.css + '\n\n/*# sourceMappingURL=' + mapName + ' */\n');
+    fs.writeFileSync(path.join(outputDir, mapName), JSON.stringify(sourceMap));
+    console.log(entry.source + ' -> ' + entry.output + ' (' +
+        (Date.now() - started) + 'ms)');
+}
+
+async function compileAll(compiler, entries, style) {
+    let ok = true;
+    for (const entry of entries) {
+        try {
+            await compile(compiler, entry, style);
+        } catch (err) {
+            ok = false;
+            console.error(entry.source + ': ' + err.message);
+        }
+    }
+    return ok;
+}
+
+function checkRecursiveWatch() {
+    const major = parseInt(process.versions.node.split('.')[0], 10);
+    if (process.platform === 'linux' && major < 20) {
+        throw new Error('Watching needs Node.js >= 20 on Linux (found ' +
+            process.versions.node + '), use --once or upgrade Node.js');
+    }
+}
+
+function watch(compiler, graph, entries, style) {
+    const changed = new Set();
+    let timer = null;
+    let building = false;
+
+    async function flush() {
+        if (building) {
+            timer = setTimeout(flush, DEBOUNCE_MS);
+            return;
+        }
+        const files = Array.from(changed);
+        changed.clear();
+
+        // Deleted or no longer imported files are only in the old graph
+        const affected = new Set(graph.affected(entries, files));
+        files.forEach(file => graph.update(file));
+        graph.affected(entries, files).forEach(entry => affected.add(entry));
+        if (!affected.size) {
+            return;
+        }
+        building = true;
+        try {
+            await compileAll(compiler, Array.from(affected), style);
+        } finally {
+            building = false;
+        }
+    }
+
+    fs.watch(SCSS_DIR, {recursive: true}, (event, filename) => {
+        if (!filename || !/\.s[ac]ss$/.test(filename)) {
+            return;
+        }
+        changed.add(path.join(SCSS_DIR, filename));
+        clearTimeout(timer);
+        timer = setTimeout(flush, DEBOUNCE_MS);
+    });
+    console.log('Watching ' + path.relative(process.cwd(), SCSS_DIR) +
+        ' for changes...');
+}
+
+async function main() {
+    const args = process.argv.slice(2);
+    const styleArg = args.find(arg => arg.startsWith('--style='));
+    const style = styleArg ? styleArg.split('=')[1] : 'expanded';
+
+    const entries = ENTRIES.map(entry => Object.assign({}, entry, {
+        sourcePath: path.join(STATIC_DIR, entry.source),
+        outputPath: path.join(STATIC_DIR, entry.output),
+    }));
+    const graph = new DependencyGraph();
+    entries.forEach(entry => graph.update(entry.sourcePath));
+
+    const watching = !args.includes('--once');
+    if (watching) {
+        checkRecursiveWatch();
+    }
+    const compiler = await createCompiler();
+    const ok = await compileAll(compiler, entries, style);
+    if (!watching) {
+        await compiler.dispose();
+        process.exitCode = ok ? 0 : 1;
+        return;
+    }
+    watch(compiler, graph, entries, style);
+    process.on('SIGINT', async () => {
+        await compiler.dispose();
+        process.exit(0);
+    });
+}
+
+if (require.main === module) {
+    main().catch(err => {
+        console.error(err);
+        process.exit(1);
+    });
+}
+
+module.exports = {DependencyGraph, resolveImport};
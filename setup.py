@@ -17,7 +17,8 @@ setup(
     author='Naved Rangwala (navedr)',
     author_email='info@djangosuit.com',
     url='http://djangosuit.com',
-    packages=['suit5', 'suit5.templatetags'],
+    packages=['suit5', 'suit5.templatetags', 'suit5.management',
+              'suit5.management.commands'],
     zip_safe=False,
     include_package_data=True,
     classifiers=[
@@ -1,6 +1,6 @@
-import copy
-from django.conf import settings
+from types import MappingProxyType
 from django.contrib.admin import ModelAdmin
+from django.contrib.admin.utils import flatten_fieldsets
 from django.contrib.admin.views.main import ChangeList
 from django.forms import ModelForm
 from django.contrib import admin
@@ -24,15 +24,53 @@ from suit5.compat import ct_admin
 #         return super().formfield_for_dbfield(db_field, request, **kwargs)
 
 
+def sortable_widget(attrs):
+    """
+    Build read-only sortable widget prototype. Form fields deepcopy their
+    widget, which for Django widgets is only a shallow copy of ``attrs``,
+    so prototype can be shared between all forms of inline class
+    """
+    widget = NumberInput()
+    widget.attrs = MappingProxyType(dict(attrs))
+    return widget
+
+
+def sortable_fieldsets(fieldsets, sortable):
+    """
+    Return read-only copy of fieldsets with sortable field placed first in
+    the first fieldset and removed from every other fieldset
+    """
+    result = []
+    for name, options in fieldsets:
+        fields = tuple(field for field in options.get('fields') or ()
+                       if field != sortable)
+        if not result:
+            fields = (sortable,) + fields
+        result.append((name, MappingProxyType(dict(options, fields=fields))))
+    return tuple(result)
+
+
 class SortableModelAdminBase(object):
     """
     Base class for SortableTabularInline and SortableModelAdmin
     """
     sortable = 'order'
+    sortable_widget_attrs = {'class': 'hide input-mini suit-sortable'}
 
     class Media:
         js = ('suit/js/sortables.js',)
 
+    @classmethod
+    def get_sortable_widget(cls):
+        """
+        Return sortable widget prototype, created once per class
+        """
+        widget = cls.__dict__.get('_sortable_widget')
+        if widget is None:
+            widget = sortable_widget(cls.sortable_widget_attrs)
+            cls._sortable_widget = widget
+        return widget
+
 
 class SortableListForm(ModelForm):
     """
@@ -41,8 +79,7 @@ class SortableListForm(ModelForm):
 
     class Meta:
         widgets = {
-            'order': NumberInput(
-                attrs={'class': 'hide input-mini suit-sortable'})
+            'order': SortableModelAdminBase.get_sortable_widget()
         }
 
 
@@ -70,7 +107,7 @@ class SortableTabularInlineBase(SortableModelAdminBase):
 
     def formfield_for_dbfield(self, db_field, **kwargs):
         if db_field.name == self.sortable:
-            kwargs['widget'] = SortableListForm.Meta.widgets['order']
+            kwargs['widget'] = self.get_sortable_widget()
         return super(SortableTabularInlineBase, self).formfield_for_dbfield(
             db_field, **kwargs)
 
@@ -88,52 +125,38 @@ class SortableStackedInlineBase(SortableModelAdminBase):
     """
     Sortable stacked inline
     """
+    sortable_widget_attrs = {
+        'class': 'hide input-mini suit-sortable suit-sortable-stacked',
+        'rowclass': ' suit-sortable-stacked-row',
+    }
+
     def __init__(self, *args, **kwargs):
         super(SortableStackedInlineBase, self).__init__(*args, **kwargs)
         self.ordering = (self.sortable,)
 
     def get_fieldsets(self, *args, **kwargs):
         """
-        Iterate all fieldsets and make sure sortable is in the first fieldset
-        Remove sortable from every other fieldset, if by some reason someone
-        has added it
+        Make sure sortable is the first field of the first fieldset.
+        Declared fieldsets don't depend on request, so they are normalized
+        only once per inline class
         """
         fieldsets = super(SortableStackedInlineBase, self).get_fieldsets(
             *args, **kwargs)
-
-        sortable_added = False
-        for fieldset in fieldsets:
-            for line in fieldset:
-                if not line or not isinstance(line, dict):
-                    continue
-
-                fields = line.get('fields')
-
-                # Some use tuples for fields however they are immutable
-                if isinstance(fields, tuple):
-                    raise AssertionError(
-                        "The fields attribute of your Inline is a tuple. "
-                        "This must be list as we may need to modify it and "
-                        "tuples are immutable."
-                    )
-
-                if self.sortable in fields:
-                    fields.remove(self.sortable)
-
-                # Add sortable field always as first
-                if not sortable_added:
-                    fields.insert(0, self.sortable)
-                    sortable_added = True
-                    break
-
-        return fieldsets
+        if fieldsets is not self.fieldsets:
+            return sortable_fieldsets(fieldsets, self.sortable)
+
+        cls = self.__class__
+        cached = cls.__dict__.get('_sortable_fieldsets')
+        if not cached or cached[0] is not fieldsets \
+                or cached[1] != self.sortable:
+            cached = (fieldsets, self.sortable,
+                      sortable_fieldsets(fieldsets, self.sortable))
+            cls._sortable_fieldsets = cached
+        return cached[2]
 
     def formfield_for_dbfield(self, db_field, **kwargs):
         if db_field.name == self.sortable:
-            kwargs['widget'] = copy.deepcopy(
-                SortableListForm.Meta.widgets['order'])
-            kwargs['widget'].attrs['class'] += ' suit-sortable-stacked'
-            kwargs['widget'].attrs['rowclass'] = ' suit-sortable-stacked-row'
+            kwargs['widget'] = self.get_sortable_widget()
         return super(SortableStackedInlineBase, self).formfield_for_dbfield(
             db_field, **kwargs)
 
@@ -176,8 +199,7 @@ class SortableModelAdmin(SortableModelAdminBase, ModelAdmin):
             form.Meta = SortableListForm.Meta
         if not getattr(form.Meta, 'widgets', None):
             form.Meta.widgets = {}
-        form.Meta.widgets[self.sortable] = SortableListForm.Meta.widgets[
-            'order']
+        form.Meta.widgets[self.sortable] = self.get_sortable_widget()
 
     def get_changelist_form(self, request, **kwargs):
         form = super(SortableModelAdmin, self).get_changelist_form(request,
@@ -200,16 +222,102 @@ class SortableModelAdmin(SortableModelAdminBase, ModelAdmin):
         super(SortableModelAdmin, self).save_model(request, obj, form, change)
 
 
-# Quite aggressive detection and intrusion into Django CMS
-# Didn't found any other solutions though
-if 'cms' in settings.INSTALLED_APPS:
-    try:
-        from cms.admin.forms import PageForm
+LAZY_TAB_PARAM = '_suit_tab'
 
-        PageForm.Meta.widgets = {
-            'publication_date': SuitSplitDateTimeWidget,
-            'publication_end_date': SuitSplitDateTimeWidget,
-        }
-    except ImportError:
-        pass
 
+def suit_tab_names(classes):
+    """
+    Return set of tab names from ``suit-tab-NAME`` CSS classes
+    """
+    if isinstance(classes, str):
+        classes = classes.split()
+    return set(cls[len('suit-tab-'):] for cls in classes or ()
+               if cls.startswith('suit-tab-'))
+
+
+class LazyFormTabsMixin(object):
+    """
+    ModelAdmin mixin, which renders fieldsets, inlines and includes of
+    ``suit_form_lazy_tabs`` only when their tab is opened for the first time.
+    Fields of tabs that were never opened are left out of the form and
+    inline formsets, so saving does not touch them. Add form always renders
+    all tabs, so its required fields are validated.
+    """
+    suit_form_lazy_tabs = ()
+
+    def get_suit_lazy_tabs(self, obj=None):
+        if obj is None:
+            return []
+        tabs = [tab[0] for tab in getattr(self, 'suit_form_tabs', None) or ()]
+        # First tab is shown on page load, so it is never lazy
+        return [tab for tab in tabs[1:] if tab in self.suit_form_lazy_tabs]
+
+    def get_suit_tab_fragment(self, request, obj=None):
+        """
+        Return name of lazy tab requested as HTML fragment, if any
+        """
+        if request.method != 'GET':
+            return None
+        tab = request.GET.get(LAZY_TAB_PARAM)
+        return tab if tab in self.get_suit_lazy_tabs(obj) else None
+
+    def get_suit_loaded_tabs(self, request, obj=None):
+        """
+        Return lazy tabs, which are part of the form in this request
+        """
+        data = request.POST if request.method == 'POST' else request.GET
+        loaded = data.getlist(LAZY_TAB_PARAM)
+        return [tab for tab in self.get_suit_lazy_tabs(obj) if tab in loaded]
+
+    def is_suit_tab_rendered(self, request, obj, classes):
+        tabs = suit_tab_names(classes)
+        fragment = self.get_suit_tab_fragment(request, obj)
+        if fragment:
+            return fragment in tabs
+        unloaded = set(self.get_suit_lazy_tabs(obj)) - \
+            set(self.get_suit_loaded_tabs(request, obj))
+        return not tabs or bool(tabs - unloaded)
+
+    def get_fieldsets(self, request, obj=None):
+        fieldsets = super(LazyFormTabsMixin, self).get_fieldsets(request, obj)
+        if not self.get_suit_lazy_tabs(obj):
+            return fieldsets
+        return [(name, options) for name, options in fieldsets
+                if self.is_suit_tab_rendered(request, obj,
+                                             options.get('classes'))]
+
+    def get_prepopulated_fields(self, request, obj=None):
+        prepopulated = super(LazyFormTabsMixin, self).get_prepopulated_fields(
+            request, obj)
+        if not self.get_suit_lazy_tabs(obj):
+            return prepopulated
+        # Prepopulated field and its dependencies must all be in the form
+        fields = set(flatten_fieldsets(self.get_fieldsets(request, obj)))
+        return dict((field, dependencies) for field, dependencies
+                    in prepopulated.items()
+                    if field in fields and fields.issuperset(dependencies))
+
+    def get_inline_instances(self, request, obj=None):
+        inlines = super(LazyFormTabsMixin, self).get_inline_instances(
+            request, obj)
+        if not self.get_suit_lazy_tabs(obj):
+            return inlines
+        return [inline for inline in inlines if self.is_suit_tab_rendered(
+            request, obj, getattr(inline, 'suit_classes', None))]
+
+    def render_change_form(self, request, context, add=False, change=False,
+                           form_url='', obj=None):
+        lazy_tabs = self.get_suit_lazy_tabs(obj)
+        loaded_tabs = self.get_suit_loaded_tabs(request, obj)
+        fragment = self.get_suit_tab_fragment(request, obj)
+        context.update({
+            'suit_tab': fragment,
+            'suit_lazy_tabs': [(tab, tab in loaded_tabs) for tab in lazy_tabs],
+            'suit_unloaded_tabs': [tab for tab in lazy_tabs
+                                   if tab not in loaded_tabs],
+        })
+        response = super(LazyFormTabsMixin, self).render_change_form(
+            request, context, add, change, form_url, obj)
+        if fragment:
+            response.template_name = 'suit5/change_form_tab.html'
+        return response
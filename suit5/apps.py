@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class SuitConfig(AppConfig):
+    name = 'suit5'
+    verbose_name = 'Django Suit5'
+
+    def ready(self):
+        # Register system checks
+        from suit5 import checks  # noqa
+        from suit5.integrations import setup_admin_defaults, \
+            register_integrations
+
+        setup_admin_defaults()
+        register_integrations()
@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.core.checks import register, Tags, Warning
+from suit5.utils import DJANGO_MAJOR_VERSION
+
+CACHED_LOADER = 'django.template.loaders.cached.Loader'
+
+# Django 4.1+ enables cached loader also with template debug on
+if DJANGO_MAJOR_VERSION >= (4, 1):
+    REMOVE_OPTIONS = "'loaders' option"
+else:
+    REMOVE_OPTIONS = "'loaders' and 'debug' options"
+
+# Any Suit override, to skip engines which do not render Suit admin
+SUIT_TEMPLATE = 'suit5/menu.html'
+
+
+def uses_cached_loader(loaders):
+    for loader in loaders:
+        if isinstance(loader, (tuple, list)):
+            loader = loader[0]
+        if loader == CACHED_LOADER:
+            return True
+    return False
+
+
+@register(Tags.templates)
+def check_cached_template_loader(app_configs, **kwargs):
+    """
+    Suit overrides most of admin templates. Without cached loader they are
+    read and compiled again on every request
+    """
+    if settings.DEBUG:
+        return []
+
+    from django.template import engines, TemplateDoesNotExist
+    from django.template.backends.django import DjangoTemplates
+
+    errors = []
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates) or \
+                uses_cached_loader(engine.engine.loaders):
+            continue
+        try:
+            engine.engine.find_template(SUIT_TEMPLATE)
+        except TemplateDoesNotExist:
+            continue
+        errors.append(Warning(
+            'Suit templates are loaded without cached template loader '
+            'while DEBUG is False.',
+            hint="Wrap OPTIONS['loaders'] of '%s' template engine in '%s' "
+                 "or remove %s, so Django enables it." % (
+                     engine.name, CACHED_LOADER, REMOVE_OPTIONS),
+            id='suit5.W001',
+        ))
+    return errors
@@ -8,6 +8,11 @@ https://github.com/django-debug-toolbar/django-debug-toolbar/blob/master/debug_t
 """
 import django
 
+try:
+    from inspect import getfullargspec as getargspec
+except ImportError:  # Python 2
+    from inspect import getargspec
+
 try:
     from importlib import import_module
 except ImportError:  # python = 2.6
@@ -1,4 +1,3 @@
-from django.contrib.admin import ModelAdmin
 from django.conf import settings
 from . import VERSION
 
@@ -15,6 +14,8 @@ def default_config():
         # form
         'SHOW_REQUIRED_ASTERISK': True,
         'CONFIRM_UNSAVED_CHANGES': True,
+        # 'django' - calendar.js/DateTimeShortcuts.js, 'suit' - lazy native
+        'DATE_PICKER': 'django',
 
         # menu
         'SEARCH_URL': '/admin/auth/user/',
@@ -33,7 +34,16 @@ def default_config():
 
         # misc
         'LIST_PER_PAGE': 20,
-        'ALLOW_THEME_TOGGLE': True
+        # Keep only visible change list rows in DOM above this many rows
+        'LIST_VIRTUAL_ROWS': 300,
+        'ASSET_BUNDLES': False,
+        'PERFORMANCE_MODE': False,
+        # Purged Bootstrap CSS and subsetted icons (npm run build:vendor)
+        'VENDOR_SUBSET': False,
+        'ALLOW_THEME_TOGGLE': True,
+        # Admin adjustments of installed third-party apps, on first request.
+        # Enabled by default as in earlier versions, set () to opt out
+        'INTEGRATIONS': ('cms', 'filer'),
     }
 
 
@@ -49,31 +59,3 @@ def get_config(param=None):
             value = default_config().get(param)
         return value
     return config
-
-# Reverse default actions position
-ModelAdmin.actions_on_top = False
-ModelAdmin.actions_on_bottom = True
-
-# Set global list_per_page
-ModelAdmin.list_per_page = get_config('LIST_PER_PAGE')
-
-def setup_filer():
-    from suit5.widgets import AutosizedTextarea
-    from filer.admin.imageadmin import ImageAdminForm
-    from filer.admin.fileadmin import FileAdminChangeFrom
-    from filer.admin import FolderAdmin
-
-    def ensure_meta_widgets(meta_cls):
-        if not hasattr(meta_cls, 'widgets'):
-            meta_cls.widgets = {}
-
-        meta_cls.widgets['description'] = AutosizedTextarea
-
-    ensure_meta_widgets(ImageAdminForm.Meta)
-    ensure_meta_widgets(FileAdminChangeFrom.Meta)
-    FolderAdmin.actions_on_top = False
-    FolderAdmin.actions_on_bottom = True
-
-
-if 'filer' in settings.INSTALLED_APPS:
-    setup_filer()
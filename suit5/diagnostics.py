@@ -0,0 +1,264 @@
+"""
+Import time and memory footprint of Suit in a Django admin worker
+
+    python -m suit5.diagnostics [--repeat 5] [--top 20] [--json FILE]
+
+Suit modules are imported in fresh interpreters after Django is set up with
+admin and its template tag libraries, so only what Suit adds on top of
+Django admin is reported: import time breakdown (``-X importtime``),
+modules pulled in, resident memory and Python allocations, and template
+tag libraries. Compare ``--json`` output between releases to catch
+regressions, e.g. when new integrations are added.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Imported in child before marker, so they count as Django admin baseline
+BASELINE_MODULES = (
+    'django.contrib.admin.views.main',
+    'django.contrib.admin.templatetags.admin_list',
+    'django.contrib.admin.templatetags.admin_modify',
+    'django.contrib.admin.templatetags.admin_urls',
+    'django.contrib.admin.templatetags.log',
+    'django.template.defaulttags',
+    'django.template.loader_tags',
+    'django.templatetags.i18n',
+    'django.templatetags.static',
+)
+
+# Loaded by admin workers; management commands, panels and tests are not
+SUIT_MODULES = (
+    'suit5',
+    'suit5.apps',
+    'suit5.config',
+    'suit5.admin',
+    'suit5.widgets',
+    'suit5.templatetags.suit_compat',
+    'suit5.templatetags.suit_list',
+    'suit5.templatetags.suit_menu',
+    'suit5.templatetags.suit_tags',
+)
+
+MARKER = 'suit5.diagnostics: baseline ready'
+
+# Runs with -c, so nothing of Suit is imported before the marker. Mode is
+# 'time', 'rss' or 'allocated': tracemalloc adds its own memory to resident
+# size, so they are measured in separate runs
+CHILD = '''
+import json, os, sys, tracemalloc
+mode = sys.argv[1]
+baseline, suit_modules, marker = json.loads(sys.argv[2])
+
+from django.conf import settings
+settings.configure(
+    INSTALLED_APPS=['django.contrib.admin', 'django.contrib.auth',
+                    'django.contrib.contenttypes', 'django.contrib.sessions',
+                    'django.contrib.messages', 'django.contrib.staticfiles'],
+    TEMPLATES=[{'BACKEND': 'django.template.backends.django.DjangoTemplates',
+                'APP_DIRS': True}],
+    DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3',
+                           'NAME': ':memory:'}},
+    STATIC_URL='/static/', SECRET_KEY='suit5-diagnostics')
+import django
+django.setup()
+# -X importtime only reports imports going through __import__, which
+# importlib.import_module() bypasses
+for name in baseline:
+    __import__(name)
+
+
+def rss():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError):
+        return None
+
+
+before = set(sys.modules)
+rss_before = rss()
+if mode == 'allocated':
+    tracemalloc.start()
+sys.stderr.write(marker + '\\n')
+sys.stderr.flush()
+
+failed = {}
+for name in suit_modules:
+    try:
+        __import__(name)
+    except Exception as e:
+        failed[name] = '%s: %s' % (type(e).__name__, e)
+if 'suit5.apps' in sys.modules:
+    from suit5.apps import SuitConfig
+    SuitConfig('suit5', sys.modules['suit5']).ready()
+
+result = {'failed': failed, 'modules': sorted(set(sys.modules) - before)}
+if mode == 'allocated':
+    result['allocated'] = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+elif mode == 'rss':
+    rss_after = rss()
+    result['rss'] = rss_after - rss_before if rss_before else None
+libraries = {}
+for name in suit_modules:
+    register = getattr(sys.modules.get(name), 'register', None)
+    if register is not None:
+        libraries[name.rsplit('.', 1)[1]] = {
+            'tags': sorted(register.tags), 'filters': sorted(register.filters)}
+result['libraries'] = libraries
+sys.stdout.write(json.dumps(result))
+'''
+
+
+def run_child(mode, importtime=False):
+    """
+    Run CHILD in fresh interpreter, return its result and stderr
+    """
+    import suit5
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(suit5.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(
+        [root] + [p for p in [env.get('PYTHONPATH')] if p])
+    env.pop('DJANGO_SETTINGS_MODULE', None)
+    args = [sys.executable] + (['-X', 'importtime'] if importtime else []) + \
+        ['-c', CHILD, mode, json.dumps([BASELINE_MODULES, SUIT_MODULES,
+                                        MARKER])]
+    process = subprocess.run(args, env=env, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, universal_newlines=True)
+    if process.returncode:
+        raise RuntimeError('Diagnostics process failed:\n' + process.stderr)
+    return json.loads(process.stdout), process.stderr
+
+
+def parse_importtime(stderr):
+    """
+    Return [(depth, module, self ms, cumulative ms)] of -X importtime output
+    after baseline marker, in import order
+    """
+    lines = stderr.splitlines()
+    if MARKER in lines:
+        lines = lines[lines.index(MARKER) + 1:]
+    # Module is listed after modules it imported, collect children until
+    # their parent line
+    pending = {}
+    for line in lines:
+        if not line.startswith('import time:') or '[us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # One leading space, then two spaces per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entry = (depth, name.strip(), int(self_us) / 1000.0,
+                 int(cumulative_us) / 1000.0)
+        pending.setdefault(depth, []).append(
+            (entry, pending.pop(depth + 1, [])))
+
+    entries = []
+    stack = list(reversed(pending.get(0, [])))
+    while stack:
+        entry, children = stack.pop()
+        entries.append(entry)
+        stack.extend(reversed(children))
+    return entries
+
+
+def collect(repeat=5):
+    runs = [parse_importtime(run_child('time', importtime=True)[1])
+            for i in range(repeat)]
+    # Fastest run has least noise of other processes
+    imports = min(runs, key=lambda entries: sum(
+        entry[3] for entry in entries if entry[0] == 0))
+    result, stderr = run_child('rss')
+    allocated = run_child('allocated')[0]['allocated']
+
+    import django
+    from suit5 import VERSION
+    return {
+        'meta': {
+            'suit': VERSION,
+            'django': django.get_version(),
+            'python': '%d.%d.%d' % sys.version_info[:3],
+            'platform': sys.platform,
+        },
+        'import_time': sum(entry[3] for entry in imports if entry[0] == 0),
+        'imports': [{'depth': depth, 'module': name, 'self': self_ms,
+                     'cumulative': cumulative_ms}
+                    for depth, name, self_ms, cumulative_ms in imports],
+        'modules': result['modules'],
+        'failed': result['failed'],
+        'rss': result['rss'],
+        'allocated': allocated,
+        'libraries': result['libraries'],
+    }
+
+
+def format_report(report, top=20):
+    meta = report['meta']
+    lines = ['Suit %s, Django %s, Python %s (%s)' % (
+        meta['suit'], meta['django'], meta['python'], meta['platform']), '']
+
+    lines.append('Import time on top of Django admin: %.1f ms' %
+                 report['import_time'])
+    lines.append('%10s %12s  module' % ('self ms', 'cumulative'))
+    slowest = sorted(report['imports'], key=lambda entry: -entry['self'])
+    shown = set(id(entry) for entry in slowest[:top])
+    for entry in report['imports']:
+        if id(entry) in shown or entry['depth'] == 0:
+            lines.append('%10.2f %12.2f  %s%s' % (
+                entry['self'], entry['cumulative'], '  ' * entry['depth'],
+                entry['module']))
+    lines.append('')
+
+    suit = [name for name in report['modules'] if name.split('.')[0] == 'suit5']
+    packages = sorted(set(name.split('.')[0] for name in report['modules'])
+                      - {'suit5'})
+    lines.append('Modules imported: %d (%d Suit, %d other)' % (
+        len(report['modules']), len(suit), len(report['modules']) - len(suit)))
+    if packages:
+        lines.append('  other packages: %s' % ', '.join(packages))
+    for name, error in sorted(report['failed'].items()):
+        lines.append('  failed %s: %s' % (name, error))
+    lines.append('')
+
+    megabyte = 1024.0 * 1024
+    lines.append('Memory per worker: %s resident, %.2f MB Python allocations'
+                 % ('%.2f MB' % (report['rss'] / megabyte)
+                    if report['rss'] is not None else 'unknown',
+                    report['allocated'] / megabyte))
+    lines.append('')
+
+    lines.append('Template tag libraries:')
+    for name, library in sorted(report['libraries'].items()):
+        lines.append('  %s: %d tags, %d filters' % (
+            name, len(library['tags']), len(library['filters'])))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Import time runs, fastest is reported')
+    parser.add_argument('--top', type=int, default=20,
+                        help='Show this many slowest imports')
+    parser.add_argument('--json', metavar='FILE',
+                        help='Write report as JSON to FILE, - for stdout')
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+
+    report = collect(args.repeat)
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+        return
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+    print(format_report(report, args.top))
+
+
+if __name__ == '__main__':
+    main()
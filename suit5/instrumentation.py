@@ -0,0 +1,147 @@
+"""
+Opt-in per-request timing and query counting of Suit template tags.
+
+Enable by adding middleware after AuthenticationMiddleware::
+
+    MIDDLEWARE = [
+        ...
+        'suit5.instrumentation.SuitInstrumentationMiddleware',
+    ]
+
+or ``suit5.panels.SuitPanel`` to ``DEBUG_TOOLBAR_PANELS``. Collected stats
+are sent with ``request_instrumented`` signal, kept in
+``request.suit_instrumentation`` and added to ``Server-Timing`` header of
+responses to staff users.
+"""
+from collections import OrderedDict
+from contextlib import contextmanager, ExitStack
+from contextvars import ContextVar
+from functools import wraps
+from inspect import signature
+from time import perf_counter
+
+from django.db import connections
+from django.dispatch import Signal
+
+# Sent with request, response and stats after instrumented request
+request_instrumented = Signal()
+
+_collector = ContextVar('suit_instrumentation', default=None)
+
+
+class Collector(object):
+    """
+    Wall time, calls and queries per instrumented function of one request
+    """
+
+    def __init__(self):
+        self.stats = OrderedDict()
+        self.stack = []
+
+    def entry(self, name):
+        entry = self.stats.get(name)
+        if entry is None:
+            entry = self.stats[name] = {'calls': 0, 'time': 0.0,
+                                        'queries': 0}
+        return entry
+
+    def start(self, name):
+        self.entry(name)['calls'] += 1
+        self.stack.append((name, perf_counter()))
+
+    def stop(self):
+        name, started = self.stack.pop()
+        self.stats[name]['time'] += (perf_counter() - started) * 1000
+
+    def execute(self, execute, sql, params, many, context):
+        # Query belongs to innermost running function
+        if self.stack:
+            self.stats[self.stack[-1][0]]['queries'] += 1
+        return execute(sql, params, many, context)
+
+
+def instrumented(func):
+    """
+    Record calls of func, when request is instrumented. Otherwise costs
+    one context variable lookup per call
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        collector = _collector.get()
+        if collector is None:
+            return func(*args, **kwargs)
+        collector.start(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            collector.stop()
+
+    # Template libraries read tag arguments with getfullargspec, which does
+    # not follow __wrapped__
+    wrapper.__signature__ = signature(func)
+    return wrapper
+
+
+@contextmanager
+def collect():
+    """
+    Instrument code in block, yield Collector with stats
+    """
+    collector = Collector()
+    token = _collector.set(collector)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(
+                    connection.execute_wrapper(collector.execute))
+            yield collector
+    finally:
+        _collector.reset(token)
+
+
+def server_timing(stats):
+    """
+    Format stats as Server-Timing header value
+    """
+    metrics = ['suit;dur=%.2f;desc="Suit total"' %
+               sum(entry['time'] for entry in stats.values())]
+    for name, entry in stats.items():
+        metrics.append('suit-%s;dur=%.2f;desc="%s x%d, %d queries"' % (
+            name.replace('_', '-'), entry['time'], name, entry['calls'],
+            entry['queries']))
+    return ', '.join(metrics)
+
+
+def instrument_request(request, get_response):
+    """
+    Call get_response(request) instrumented, return response and stats
+    """
+    active = _collector.get()
+    if active is not None:
+        # Both middleware and debug toolbar panel are enabled, outer one
+        # collects and sends signal, stats are shared
+        request.suit_instrumentation = active.stats
+        return get_response(request), active.stats
+    with collect() as collector:
+        response = get_response(request)
+    request.suit_instrumentation = collector.stats
+    request_instrumented.send(sender=Collector, request=request,
+                              response=response, stats=collector.stats)
+    return response, collector.stats
+
+
+class SuitInstrumentationMiddleware(object):
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response, stats = instrument_request(request, self.get_response)
+        user = getattr(request, 'user', None)
+        if stats and user is not None and user.is_staff:
+            header = server_timing(stats)
+            if response.has_header('Server-Timing'):
+                header = response['Server-Timing'] + ', ' + header
+            response['Server-Timing'] = header
+        return response
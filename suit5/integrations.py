@@ -0,0 +1,83 @@
+"""
+Adjustments of Django admin and third-party admin apps. They are applied
+from SuitConfig.ready() instead of on import of Suit modules, and admin
+modules of third-party apps are only imported on first request, so
+management commands and worker startup don't pay for them.
+"""
+from django.apps import apps
+from django.contrib.admin import ModelAdmin
+from django.core.signals import request_started
+from suit5.config import get_config
+
+DISPATCH_UID = 'suit5.integrations'
+
+
+def setup_admin_defaults():
+    # Reverse default actions position
+    ModelAdmin.actions_on_top = False
+    ModelAdmin.actions_on_bottom = True
+
+    # Set global list_per_page
+    ModelAdmin.list_per_page = get_config('LIST_PER_PAGE')
+
+
+def setup_filer():
+    from suit5.widgets import AutosizedTextarea
+    from filer.admin.imageadmin import ImageAdminForm
+    from filer.admin.fileadmin import FileAdminChangeFrom
+    from filer.admin import FolderAdmin
+
+    def ensure_meta_widgets(meta_cls):
+        if not hasattr(meta_cls, 'widgets'):
+            meta_cls.widgets = {}
+
+        meta_cls.widgets['description'] = AutosizedTextarea
+
+    ensure_meta_widgets(ImageAdminForm.Meta)
+    ensure_meta_widgets(FileAdminChangeFrom.Meta)
+    FolderAdmin.actions_on_top = False
+    FolderAdmin.actions_on_bottom = True
+
+
+def setup_cms():
+    # Quite aggressive detection and intrusion into Django CMS
+    # Didn't found any other solutions though
+    from suit5.widgets import SuitSplitDateTimeWidget
+    try:
+        from cms.admin.forms import PageForm
+    except ImportError:
+        return
+
+    PageForm.Meta.widgets = {
+        'publication_date': SuitSplitDateTimeWidget,
+        'publication_end_date': SuitSplitDateTimeWidget,
+    }
+
+
+INTEGRATIONS = {
+    'cms': setup_cms,
+    'filer': setup_filer,
+}
+
+
+def get_integrations():
+    """
+    Setup functions of enabled integrations with installed apps
+    """
+    return [INTEGRATIONS[name] for name in get_config('INTEGRATIONS') or ()
+            if name in INTEGRATIONS and apps.is_installed(name)]
+
+
+def setup_integrations(**kwargs):
+    """
+    Apply enabled integrations now. Connected to request_started until
+    first request, call it directly to use patched admin forms earlier
+    """
+    request_started.disconnect(dispatch_uid=DISPATCH_UID)
+    for setup in get_integrations():
+        setup()
+
+
+def register_integrations():
+    if get_integrations():
+        request_started.connect(setup_integrations, dispatch_uid=DISPATCH_UID)
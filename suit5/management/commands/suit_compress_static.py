@@ -0,0 +1,123 @@
+import gzip
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_EXTENSIONS = ('.css', '.js', '.map', '.json', '.svg', '.ttf',
+                       '.eot', '.html', '.txt')
+MANIFEST_NAME = 'compressed.json'
+
+# Same threshold as WhiteNoise: keep compressed file only if it saves 5%
+MAX_RATIO = 0.95
+
+
+def gzip_compress(data):
+    # mtime=0 keeps output reproducible between builds
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_compress(data):
+    return brotli.compress(data, quality=11)
+
+
+class Command(BaseCommand):
+    help = ('Write precompressed .gz and .br siblings of Suit static files '
+            'in STATIC_ROOT (run after collectstatic), for nginx '
+            'gzip_static/brotli_static and WhiteNoise.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prefix', default='suit5',
+            help='Directory in STATIC_ROOT to compress (default: suit5).')
+        parser.add_argument(
+            '--all', action='store_true',
+            help='Compress all files in STATIC_ROOT.')
+        parser.add_argument(
+            '--min-size', type=int, default=256,
+            help='Skip files smaller than this many bytes (default: 256).')
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Compress files even if up to date siblings exist.')
+
+    def handle(self, *args, **options):
+        static_root = getattr(settings, 'STATIC_ROOT', None)
+        if not static_root:
+            raise CommandError('STATIC_ROOT setting is not set.')
+        root = static_root if options['all'] else \
+            os.path.join(static_root, options['prefix'])
+        if not os.path.isdir(root):
+            raise CommandError('%s does not exist, run collectstatic first.'
+                               % root)
+
+        compressors = [('gz', gzip_compress)]
+        if brotli is not None:
+            compressors.append(('br', brotli_compress))
+        else:
+            self.stderr.write('brotli is not installed, writing .gz only '
+                              '(pip install brotli)')
+
+        manifest = {}
+        for path in self.find_files(root, options['min_size']):
+            entry = self.compress_file(path, compressors, options['force'])
+            manifest[os.path.relpath(path, static_root).replace(os.sep, '/')] \
+                = entry
+
+        manifest_path = os.path.join(root, MANIFEST_NAME)
+        with open(manifest_path, 'w') as f:
+            json.dump({'files': manifest}, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+        self.stdout.write(self.summary(manifest, compressors))
+
+    def find_files(self, root, min_size):
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if not filename.endswith(COMPRESS_EXTENSIONS) or \
+                        filename == MANIFEST_NAME:
+                    continue
+                path = os.path.join(dirpath, filename)
+                if os.path.getsize(path) >= min_size:
+                    yield path
+
+    def compress_file(self, path, compressors, force):
+        """
+        Write siblings of single file, return its manifest entry
+        """
+        mtime = os.path.getmtime(path)
+        entry = {'size': os.path.getsize(path)}
+        data = None
+        for ext, compress in compressors:
+            target = '%s.%s' % (path, ext)
+            if not force and os.path.exists(target) and \
+                    os.path.getmtime(target) >= mtime:
+                entry[ext] = os.path.getsize(target)
+                continue
+            if data is None:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            compressed = compress(data)
+            if len(compressed) > len(data) * MAX_RATIO:
+                if os.path.exists(target):
+                    os.remove(target)
+                continue
+            with open(target, 'wb') as f:
+                f.write(compressed)
+            entry[ext] = len(compressed)
+        return entry
+
+    def summary(self, manifest, compressors):
+        total = sum(entry['size'] for entry in manifest.values())
+        sizes = ', '.join(
+            '%s %d bytes' % (ext, sum(entry.get(ext, entry['size'])
+                                      for entry in manifest.values()))
+            for ext, compress in compressors)
+        return 'Compressed %d files: %d bytes -> %s' % (len(manifest), total,
+                                                        sizes)
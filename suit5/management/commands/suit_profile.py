@@ -0,0 +1,300 @@
+import cProfile
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+from collections import Counter, defaultdict, OrderedDict
+from time import perf_counter
+
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+
+try:
+    from django.core.urlresolvers import reverse
+except ImportError:
+    # For Django >= 2.0
+    from django.urls import reverse
+
+# First matching path fragment wins, so Suit modules go before "suit5/"
+CATEGORIES = (
+    ('suit_menu', 'suit5/templatetags/suit_menu.py'),
+    ('suit_list', 'suit5/templatetags/suit_list.py'),
+    ('suit_tags', 'suit5/templatetags/suit_tags.py'),
+    ('widgets', 'suit5/widgets.py'),
+    ('suit (other)', 'suit5/'),
+    ('django templates', 'django/template/'),
+    ('django db', 'django/db/'),
+    ('django (other)', 'django/'),
+)
+OTHER = 'other'
+
+# Stacks below this share of total time are left out of cProfile flame
+# graphs, which keeps walking the call graph linear
+MIN_STACK_RATIO = 0.001
+
+
+def categorize(filename):
+    filename = filename.replace(os.sep, '/')
+    for name, fragment in CATEGORIES:
+        if fragment in filename:
+            return name
+    return OTHER
+
+
+def short_filename(filename, paths=None):
+    """
+    Filename relative to longest matching sys.path entry
+    """
+    best = ''
+    for path in paths if paths is not None else sys.path:
+        if path and filename.startswith(path) and len(path) > len(best):
+            best = path
+    return filename[len(best):].lstrip(os.sep) if best else filename
+
+
+def format_frame(frame):
+    filename, lineno, name = frame
+    if filename == '~':
+        # Built-in functions in cProfile stats
+        return name
+    return '%s:%d(%s)' % (short_filename(filename), lineno, name)
+
+
+def profile_stacks(stats):
+    """
+    Approximate stacks with milliseconds from cProfile call graph. Self
+    time of function is split between its callers by their cumulative
+    time, recursive calls are folded into the outermost one
+    """
+    callees = defaultdict(dict)
+    roots = []
+    for func, (cc, nc, tt, ct, callers) in stats.items():
+        if not callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+
+    total = sum(stats[root][3] for root in roots)
+    min_time = total * MIN_STACK_RATIO
+    stacks = Counter()
+    pending = [((root,), stats[root][3]) for root in roots]
+    while pending:
+        path, time = pending.pop()
+        cc, nc, tt, ct, callers = stats[path[-1]]
+        ratio = time / ct if ct else 0
+        stacks[path] += tt * ratio * 1000
+        for callee, edge_time in callees[path[-1]].items():
+            time = edge_time * ratio
+            if callee not in path and time >= min_time:
+                pending.append((path + (callee,), time))
+    return stacks
+
+
+class Sampler(object):
+    """
+    Records stack of current thread every interval seconds from another
+    thread, below frame of ``root`` code
+    """
+
+    def __init__(self, interval, root):
+        self.interval = interval
+        self.root = root
+        self.thread_id = threading.get_ident()
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.switch_interval = None
+
+    def start(self):
+        # Let sampling thread take GIL as often as it wants to sample
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.switch_interval, self.interval / 2))
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        sys.setswitchinterval(self.switch_interval)
+
+    def run(self):
+        last = perf_counter()
+        while not self.stopped.wait(self.interval):
+            now = perf_counter()
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and frame.f_code is not self.root:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno,
+                              code.co_name))
+                frame = frame.f_back
+            if frame is not None and stack:
+                self.stacks[tuple(reversed(stack))] += (now - last) * 1000
+            last = now
+
+
+def summarize(stacks):
+    """
+    Milliseconds per category: self time of innermost frames and
+    inclusive time of stacks passing through category
+    """
+    summary = OrderedDict((name, {'self': 0.0, 'inclusive': 0.0})
+                          for name in [c[0] for c in CATEGORIES] + [OTHER])
+    for stack, time in stacks.items():
+        categories = set(categorize(frame[0]) for frame in stack)
+        summary[categorize(stack[-1][0])]['self'] += time
+        for name in categories:
+            summary[name]['inclusive'] += time
+    return summary
+
+
+def url_slug(url):
+    return re.sub(r'[^\w.-]+', '_', url.strip('/')) or 'index'
+
+
+class Command(BaseCommand):
+    help = ('Profile rendering of admin URLs through test client and write '
+            'collapsed stacks for flame graphs and time spent in Suit '
+            'modules, Django and templates.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'urls', nargs='*', metavar='url',
+            help='Admin URLs to profile (default: admin index and change '
+                 'lists of all registered models).')
+        parser.add_argument(
+            '--username',
+            help='User to log in as (default: first active superuser).')
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help='Profiled requests per URL (default: 5).')
+        parser.add_argument(
+            '--sample', type=float, nargs='?', const=1.0, metavar='MS',
+            help='Sample stacks every MS milliseconds (default: 1) instead '
+                 'of cProfile.')
+        parser.add_argument(
+            '--output-dir', default='suit_profile',
+            help='Directory for per-URL .collapsed (and .prof) files and '
+                 'summary.json (default: suit_profile).')
+        parser.add_argument(
+            '--host',
+            help='Host header (default: first ALLOWED_HOSTS entry or '
+                 'localhost).')
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be at least 1.')
+        if options['sample'] is not None and options['sample'] <= 0:
+            raise CommandError('--sample must be positive.')
+        client = Client(HTTP_HOST=options['host'] or self.default_host())
+        client.force_login(self.get_user(options['username']))
+        urls = options['urls'] or self.default_urls()
+        output_dir = options['output_dir']
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir)
+
+        results = OrderedDict()
+        for url in urls:
+            # Warm up template loaders and caches
+            status = self.request(client, url)
+            if status != 200:
+                self.stderr.write('%s returned %d' % (url, status))
+            if options['sample']:
+                stacks = self.sample(client, url, options['repeat'],
+                                     options['sample'] / 1000)
+            else:
+                stacks = self.profile(client, url, options['repeat'],
+                                      os.path.join(output_dir,
+                                                   url_slug(url) + '.prof'))
+            self.write_collapsed(
+                stacks, os.path.join(output_dir, url_slug(url) + '.collapsed'))
+            results[url] = {
+                'status': status,
+                'requests': options['repeat'],
+                'total': sum(stacks.values()),
+                'categories': summarize(stacks),
+            }
+            self.stdout.write(self.format_result(url, results[url]))
+
+        with open(os.path.join(output_dir, 'summary.json'), 'w') as f:
+            json.dump({'mode': 'sample' if options['sample'] else 'cprofile',
+                       'urls': results}, f, indent=2)
+            f.write('\n')
+
+    def default_host(self):
+        for host in getattr(settings, 'ALLOWED_HOSTS', []):
+            if host != '*':
+                return host.lstrip('.')
+        return 'localhost'
+
+    def get_user(self, username):
+        users = get_user_model()._default_manager
+        if username:
+            try:
+                return users.get_by_natural_key(username)
+            except users.model.DoesNotExist:
+                raise CommandError('User "%s" does not exist.' % username)
+        user = users.filter(is_superuser=True, is_active=True) \
+            .order_by('pk').first()
+        if user is None:
+            raise CommandError('No active superuser, use --username.')
+        return user
+
+    def default_urls(self):
+        urls = [reverse('admin:index')]
+        for model in admin.site._registry:
+            urls.append(reverse('admin:%s_%s_changelist' % (
+                model._meta.app_label, model._meta.model_name)))
+        return urls
+
+    def request(self, client, url):
+        return client.get(url).status_code
+
+    def profile(self, client, url, repeat, path):
+        profiler = cProfile.Profile()
+        for i in range(repeat):
+            profiler.runcall(client.get, url)
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(path)
+        return profile_stacks(stats.stats)
+
+    def sample(self, client, url, repeat, interval):
+        sampler = Sampler(interval, self.request.__code__)
+        sampler.start()
+        try:
+            for i in range(repeat):
+                self.request(client, url)
+        finally:
+            sampler.stop()
+        return sampler.stacks
+
+    def write_collapsed(self, stacks, path):
+        # Brendan Gregg's collapsed format, weights in microseconds, for
+        # flamegraph.pl, speedscope and similar tools
+        with open(path, 'w') as f:
+            for stack, time in sorted(stacks.items()):
+                weight = int(round(time * 1000))
+                if weight:
+                    f.write('%s %d\n' % (';'.join(
+                        format_frame(frame) for frame in stack), weight))
+
+    def format_result(self, url, result):
+        total = result['total'] or 1
+        lines = ['%s: %.1f ms per request (%d requests)' % (
+            url, result['total'] / result['requests'], result['requests'])]
+        for name, times in result['categories'].items():
+            if times['inclusive']:
+                lines.append('  %-18s self %8.1f ms %5.1f%%   '
+                             'inclusive %8.1f ms %5.1f%%' % (
+                                 name, times['self'],
+                                 times['self'] * 100 / total,
+                                 times['inclusive'],
+                                 times['inclusive'] * 100 / total))
+        return '\n'.join(lines)
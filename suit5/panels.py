@@ -0,0 +1,37 @@
+"""
+django-debug-toolbar panel with Suit template tag timings and queries::
+
+    DEBUG_TOOLBAR_PANELS = [
+        ...
+        'suit5.panels.SuitPanel',
+    ]
+"""
+from debug_toolbar.panels import Panel
+from django.utils.translation import gettext_lazy as _
+
+from suit5.instrumentation import instrument_request
+
+
+class SuitPanel(Panel):
+    title = _('Suit')
+    template = 'suit5/panels/suit.html'
+
+    @property
+    def nav_subtitle(self):
+        stats = self.get_stats().get('tags') or {}
+        return '%.1f ms, %d queries' % (
+            sum(entry['time'] for entry in stats.values()),
+            sum(entry['queries'] for entry in stats.values()))
+
+    def process_request(self, request):
+        # Works without SuitInstrumentationMiddleware too
+        response, stats = instrument_request(
+            request, super(SuitPanel, self).process_request)
+        return response
+
+    def generate_stats(self, request, response):
+        stats = getattr(request, 'suit_instrumentation', None) or {}
+        self.record_stats({
+            'tags': stats,
+            'rows': [dict(entry, name=name) for name, entry in stats.items()],
+        })
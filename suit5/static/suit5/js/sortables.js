@@ -1,7 +1,7 @@
 /**
  * List sortables
  */
-(function ($) {
+Suit.ready(function ($) {
     $.fn.suit_list_sortable = function () {
         var $inputs = $(this);
         if (!$inputs.length)
@@ -46,12 +46,12 @@
             } else {
                 $('.selected').removeClass('selected');
                 if ($arrow.data('dir') === 'down') {
-                    $next = $row.next();
+                    $next = $row.next(':not(.suit-virtual-spacer)');
                     if ($next.is(':visible') && $next.length) {
                         $row.insertAfter($next).addClass('selected')
                     }
                 } else {
-                    $prev = $row.prev();
+                    $prev = $row.prev(':not(.suit-virtual-spacer)');
                     if ($prev.is(':visible') && $prev.length) {
                         $row.insertBefore($prev).addClass('selected')
                     }
@@ -164,4 +164,9 @@
         $('.suit-sortable').suit_list_sortable();
     });
 
-}(Suit.$));
+    // Sortable inlines of lazy form tabs
+    $(document).on('suit:tab-loaded', function (e) {
+        $(e.target).find('.suit-sortable').suit_list_sortable();
+    });
+
+});
@@ -0,0 +1,128 @@
+/**
+ * Lightweight Suit date/time picker
+ *
+ * Used instead of Django calendar.js/DateTimeShortcuts.js when
+ * SUIT_CONFIG['DATE_PICKER'] = 'suit'. Nothing is done on page load: two
+ * document level listeners prepare a browser native date/time picker for
+ * a field on first focus and open it on add-on icon click.
+ * Requires admin core.js (Date.strftime, String.strptime).
+ */
+(function () {
+    'use strict';
+
+    var WRAPPER = '.suit-date',
+        PICKER_STYLE = 'position:absolute;left:0;bottom:0;width:1px;height:1px;' +
+            'padding:0;border:0;opacity:0;pointer-events:none;';
+
+    function input_format(type) {
+        if (typeof window.get_format === 'function') {
+            return get_format(type === 'time' ? 'TIME_INPUT_FORMATS' : 'DATE_INPUT_FORMATS')[0];
+        }
+        return type === 'time' ? '%H:%M:%S' : '%Y-%m-%d';
+    }
+
+    function pad(value) {
+        return ('0' + value).slice(-2);
+    }
+
+    // Convert field value in Django input format to native picker value
+    function to_native(value, type) {
+        var match, date;
+        value = value.trim();
+        if (!value) {
+            return '';
+        }
+        if (type === 'time') {
+            match = value.match(/^(\d{1,2}):(\d{2})/);
+            return match ? pad(match[1]) + ':' + match[2] : '';
+        }
+        date = value.strptime(input_format(type));
+        if (isNaN(date.getTime())) {
+            return '';
+        }
+        return date.getUTCFullYear() + '-' + pad(date.getUTCMonth() + 1) +
+            '-' + pad(date.getUTCDate());
+    }
+
+    // Convert native picker value back to Django input format
+    function from_native(value, type) {
+        var parts, date;
+        if (type === 'time') {
+            parts = value.split(':');
+            date = new Date();
+            date.setHours(parts[0], parts[1], parts[2] || 0, 0);
+        } else {
+            parts = value.split('-');
+            date = new Date(parts[0], parts[1] - 1, parts[2]);
+        }
+        return date.strftime(input_format(type));
+    }
+
+    function get_picker(input) {
+        if (input.suit_picker) {
+            return input.suit_picker;
+        }
+        var wrapper = input.closest(WRAPPER),
+            picker = document.createElement('input');
+
+        picker.type = wrapper.classList.contains('suit-time') ? 'time' : 'date';
+        picker.tabIndex = -1;
+        picker.className = 'suit-native-picker';
+        picker.setAttribute('aria-hidden', 'true');
+        picker.style.cssText = PICKER_STYLE;
+        if (window.getComputedStyle(wrapper).position === 'static') {
+            wrapper.style.position = 'relative';
+        }
+        picker.addEventListener('change', function () {
+            if (!picker.value) {
+                return;
+            }
+            input.value = from_native(picker.value, picker.type);
+            input.dispatchEvent(new Event('change', {bubbles: true}));
+        });
+        wrapper.appendChild(picker);
+        input.suit_picker = picker;
+        return picker;
+    }
+
+    function find_input(wrapper) {
+        return wrapper.querySelector('input.vDateField, input.vTimeField');
+    }
+
+    document.addEventListener('focusin', function (e) {
+        var target = e.target;
+        if (target.matches && target.matches(WRAPPER + ' input.vDateField, ' +
+                WRAPPER + ' input.vTimeField')) {
+            get_picker(target);
+        }
+    });
+
+    document.addEventListener('click', function (e) {
+        var add_on = e.target.closest && e.target.closest(WRAPPER + ' .add-on');
+        if (!add_on) {
+            return;
+        }
+        var wrapper = add_on.closest(WRAPPER), input = find_input(wrapper);
+
+        // Leave widgets with Django DateTimeShortcuts to suit.js
+        if (!input || wrapper.querySelector('.datetimeshortcuts')) {
+            return;
+        }
+        e.preventDefault();
+
+        var picker = get_picker(input);
+        picker.value = to_native(input.value, picker.type);
+        if (typeof picker.showPicker === 'function') {
+            try {
+                picker.showPicker();
+                return;
+            } catch (err) {
+                // Fall back to focus below
+            }
+        }
+        picker.style.pointerEvents = 'auto';
+        picker.focus();
+        picker.click();
+        picker.style.pointerEvents = 'none';
+    });
+}());
@@ -1,69 +1,132 @@
 /**
- * Determines if a form is dirty by comparing the current value of each element
- * with its default value.
+ * Warns before leaving a form with unsaved changes.
  *
- * @param {Form} form the form to be checked.
- * @return {Boolean} <code>true</code> if the form is dirty, <code>false</code>
- *                   otherwise.
+ * Fields are checked one by one when they change (delegated "input",
+ * "change" and "focusout" listeners), and number of dirty fields is kept up
+ * to date, so leaving the page does not depend on form size or number of
+ * select options. Inputs which Django admin widgets fill in without firing
+ * events (calendar and clock, raw id lookups) are compared again on
+ * leaving, when no dirty field is counted.
+ * Listeners are added with addEventListener and do not replace other
+ * window.onbeforeunload / form.onsubmit handlers.
  *
- * Taken from here: http://stackoverflow.com/a/155812/641263
+ * Field comparison originally taken from here:
+ * http://stackoverflow.com/a/155812/641263
  */
 
 var confirmExitIfModified = (function () {
 
-    function formIsDirty(form) {
-        for (var i = 0; i < form.elements.length; i++) {
-            var element = form.elements[i];
-            var type = element.type;
-            if (type == "checkbox" || type == "radio") {
-                if (element.checked != element.defaultChecked) {
-                    return true;
-                }
-            }
-            else if (type == "hidden" || type == "password" ||
-                type == "text" || type == "textarea") {
-                var cls = element.getAttribute('class');
-                if (!cls) cls = '';
-                if (element.value != element.defaultValue &&
-                    // Fix for select2 multiple
-                    cls.indexOf('select2') == -1 &&
-                    // Skip elements with ignore-changes class
-                    cls.indexOf('ignore-changes') == -1
-                    ) {
+    // Inputs set by Django admin scripts without input/change event
+    var SCRIPT_SET_FIELDS = 'input.vDateField, input.vTimeField, ' +
+        'input.vForeignKeyRawIdAdminField, input.vManyToManyRawIdAdminField';
+
+    function isIgnored(element) {
+        var cls = element.getAttribute('class') || '';
+        // Fix for select2 multiple, skip elements with ignore-changes class
+        return cls.indexOf('select2') != -1 ||
+            cls.indexOf('ignore-changes') != -1;
+    }
+
+    /**
+     * Determines if a single element differs from its default value.
+     */
+    function fieldIsDirty(element) {
+        var type = element.type;
+        if (type == "checkbox" || type == "radio") {
+            return element.checked != element.defaultChecked;
+        }
+        else if (type == "hidden" || type == "password" ||
+            type == "text" || type == "textarea") {
+            return element.value != element.defaultValue && !isIgnored(element);
+        }
+        else if (type == "select-one" || type == "select-multiple") {
+            for (var j = 0; j < element.options.length; j++) {
+                if (element.options[j].selected !=
+                    element.options[j].defaultSelected) {
                     return true;
                 }
             }
-            else if (type == "select-one" || type == "select-multiple") {
-                for (var j = 0; j < element.options.length; j++) {
-                    if (element.options[j].selected !=
-                        element.options[j].defaultSelected) {
-                        return true;
-                    }
-                }
-            }
         }
         return false;
     }
 
-    var submit = false;
     return function (form_id, message) {
-        var form = document.forms[form_id]
-        if (form) {
-            form.onsubmit = function (e) {
-                e = e || window.event;
-                submit = true
-            };
+        var submit = false,
+            dirty_count = 0;
+
+        function getForm() {
+            return document.forms[form_id];
+        }
+
+        function update(element) {
+            var dirty = fieldIsDirty(element);
+            if (dirty != !!element.suitDirty) {
+                element.suitDirty = dirty;
+                dirty_count += dirty ? 1 : -1;
+            }
+        }
+
+        function updateScriptSet(form) {
+            var fields = form.querySelectorAll(SCRIPT_SET_FIELDS);
+            for (var i = 0; i < fields.length; i++) {
+                update(fields[i]);
+            }
+        }
+
+        function onChange(e) {
+            var element = e.target,
+                form = getForm();
+            if (!form || element.form !== form) {
+                return;
+            }
+            // Checking one radio button unchecks others in same group
+            if (element.type == "radio" && element.name) {
+                var group = form.elements[element.name];
+                if (group && group.length) {
+                    for (var i = 0; i < group.length; i++) {
+                        update(group[i]);
+                    }
+                    return;
+                }
+            }
+            update(element);
         }
-        window.onbeforeunload = function (e) {
-            e = e || window.event;
-            if (!submit && formIsDirty(form)) {
-                // For IE and Firefox
-                if (e) {
-                    e.returnValue = message;
+
+        document.addEventListener('input', onChange);
+        document.addEventListener('change', onChange);
+        // Value may have been set by script without input/change event
+        document.addEventListener('focusout', onChange);
+
+        document.addEventListener('reset', function (e) {
+            var form = getForm();
+            if (e.target === form) {
+                for (var i = 0; i < form.elements.length; i++) {
+                    form.elements[i].suitDirty = false;
                 }
-                // For Safari
+                dirty_count = 0;
+            }
+        });
+
+        document.addEventListener('submit', function (e) {
+            if (e.target === getForm()) {
+                submit = true;
+            }
+        });
+
+        window.addEventListener('beforeunload', function (e) {
+            var form = getForm();
+            if (submit || !form) {
+                return;
+            }
+            if (dirty_count == 0) {
+                updateScriptSet(form);
+            }
+            if (dirty_count > 0) {
+                e.preventDefault();
+                // For older Chrome, Firefox and Safari
+                e.returnValue = message;
                 return message;
             }
-        };
+        });
     };
 })();
@@ -0,0 +1,22 @@
+/**
+ * Suit jQuery namespace
+ *
+ * Moves jQuery, when it is loaded, to Suit.$ and runs callbacks queued with
+ * Suit.ready() while jQuery was still loading (deferred scripts in
+ * PERFORMANCE_MODE).
+ */
+var Suit = window.Suit || {};
+// jQuery is optional, suit_jquery block may be emptied
+Suit.$ = window.jQuery ? jQuery.noConflict() : null;
+if (!window.$ && Suit.$) {
+    window.$ = Suit.$;
+}
+Suit.ready = function (fn) {
+    fn(Suit.$);
+};
+(function (queue) {
+    for (var i = 0; i < queue.length; i++) {
+        Suit.ready(queue[i]);
+    }
+}(Suit.queue || []));
+Suit.queue = [];
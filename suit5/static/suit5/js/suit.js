@@ -1,4 +1,16 @@
-(function ($) {
+/**
+ * Django Suit5 core
+ *
+ * Plain JavaScript, does not require jQuery. Behaviour is attached with a few
+ * document level delegated listeners, so it costs nothing per element on
+ * large change lists and also works for elements added later (inline rows).
+ * When Suit jQuery is loaded, functions are also available as jQuery plugins
+ * ($.fn.suit_fixed, $.fn.suit_form_tabs, ...) for backwards compatibility.
+ */
+(function (window, document) {
+    'use strict';
+
+    var Suit = window.Suit = window.Suit || {};
 
     // Register callbacks to perform after inline has been added
     Suit.after_inline = function () {
@@ -20,164 +32,317 @@
     }();
 
     // Backwards compatiblity
-    SuitAfterInline = Suit.after_inline;
+    window.SuitAfterInline = Suit.after_inline;
 
     /**
-     * Fixed submit buttons.
+     * Call handler for events on elements matching selector, including
+     * elements added after page load
      */
-    $.fn.suit_fixed = function () {
-        $(this).each(function () {
-            // extra_offset: 70 (60 Footer height + 10 top offset)
-            var $fixed_item = $(this), pos = $fixed_item.offset(), extra_offset = 70;
-            $(window).on('scroll.sl resize.sl load.sl', function (e) {
-                var $win = $(this), scroll_top = $win.scrollTop();
-                if ($fixed_item.height() < $win.height() &&
-                    scroll_top > (pos.top - 10) &&
-                    $fixed_item.height() < $win.height()) {
-                    !$fixed_item.hasClass('fixed') && $fixed_item.addClass('fixed');
-                    var max_top = Math.min(10, $(document).height() - $fixed_item.height() - scroll_top - extra_offset);
-                    $fixed_item.css('top', max_top + 'px');
-                }
-                else if (scroll_top <= (pos.top - 10) &&
-                    $fixed_item.hasClass('fixed')) {
-                    $fixed_item.removeClass('fixed');
-                }
-            });
-
-            $(window).trigger('scroll.sl');
+    function delegate(type, selector, handler) {
+        document.addEventListener(type, function (e) {
+            var target = e.target.closest && e.target.closest(selector);
+            if (target) {
+                handler.call(target, e, target);
+            }
         });
-    };
+    }
 
+    function on_ready(fn) {
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', fn);
+        } else {
+            fn();
+        }
+    }
+
+    function each(elements, fn) {
+        if (!elements) {
+            return;
+        }
+        if (typeof elements === 'string') {
+            elements = document.querySelectorAll(elements);
+        } else if (elements.nodeType) {
+            elements = [elements];
+        }
+        Array.prototype.forEach.call(elements, fn);
+    }
+
+    function selected_option(select) {
+        return select.options[select.selectedIndex] || null;
+    }
 
     /**
-     * Search filters - submit only changed fields
+     * Fixed submit buttons. Positioned by CSS position: sticky, so scrolling
+     * does not run any JavaScript. ResizeObserver enables it only while item
+     * fits in window, IntersectionObserver toggles "fixed" class while stuck.
      */
-    $.fn.suit_search_filters = function () {
-        $(this).change(function () {
-            var $field = $(this);
-            var $option = $field.find('option:selected');
-            var select_name = $option.data('name');
-            if (select_name) {
-                $field.attr('name', select_name);
-            } else {
-                $field.removeAttr('name');
+    var sticky_items = [];
+
+    function update_sticky(el) {
+        el.classList.toggle('suit-sticky', el.offsetHeight < window.innerHeight);
+    }
+
+    function watch_stuck(el) {
+        // Zero height element at original item position, hidden behind
+        // top offset (10px) once item is stuck
+        var sentinel = document.createElement('div');
+        sentinel.className = 'suit-sticky-sentinel';
+        sentinel.setAttribute('aria-hidden', 'true');
+        el.parentNode.insertBefore(sentinel, el);
+        new window.IntersectionObserver(function (entries) {
+            entries.forEach(function (entry) {
+                var root_top = entry.rootBounds ? entry.rootBounds.top : 10;
+                el.classList.toggle('fixed', !entry.isIntersecting &&
+                    entry.boundingClientRect.top < root_top);
+            });
+        }, {rootMargin: '-10px 0px 0px 0px'}).observe(sentinel);
+    }
+
+    Suit.fixed = function (elements) {
+        each(elements, function (el) {
+            if (el.suit_fixed) {
+                return;
             }
-            // Handle additional values for date filters
-            var additional = $option.data('additional');
-            if (additional) {
-                var hidden_id = $field.data('name') + '_add';
-                var $hidden = $('#' + hidden_id);
-                if (!$hidden.length) {
-                    $hidden = $('<input/>').attr('type', 'hidden').attr('id', hidden_id);
-                    $field.after($hidden);
-                }
-                additional = additional.split('=');
-                $hidden.attr('name', additional[0]).val(additional[1])
+            el.suit_fixed = true;
+            sticky_items.push(el);
+            update_sticky(el);
+            if (window.ResizeObserver) {
+                new window.ResizeObserver(function () {
+                    update_sticky(el);
+                }).observe(el);
+            }
+            if (window.IntersectionObserver) {
+                watch_stuck(el);
             }
         });
-        $(this).trigger('change');
+        if (sticky_items.length && !Suit.fixed.listening) {
+            Suit.fixed.listening = true;
+            window.addEventListener('resize', function () {
+                sticky_items.forEach(update_sticky);
+            });
+        }
     };
 
     /**
-     * Linked select - shows link to related item after Select
+     * Search filters - submit only changed fields
      */
-    $.fn.suit_linked_select = function () {
+    Suit.search_filter = function (field) {
+        var option = selected_option(field);
+        var select_name = option && option.getAttribute('data-name');
+        if (select_name) {
+            field.setAttribute('name', select_name);
+        } else {
+            field.removeAttribute('name');
+        }
+        // Handle additional values for date filters
+        var additional = option && option.getAttribute('data-additional');
+        if (additional) {
+            var hidden_id = field.getAttribute('data-name') + '_add';
+            var hidden = document.getElementById(hidden_id);
+            if (!hidden) {
+                hidden = document.createElement('input');
+                hidden.type = 'hidden';
+                hidden.id = hidden_id;
+                field.parentNode.insertBefore(hidden, field.nextSibling);
+            }
+            additional = additional.split('=');
+            hidden.name = additional[0];
+            hidden.value = additional[1];
+        }
+    };
 
-        var get_link_name = function ($select) {
-            var text = $select.find('option:selected').text();
-            return text && $select.val() ? text + '' : '';
-        };
+    delegate('change', '.search-filter', function () {
+        Suit.search_filter(this);
+    });
 
-        var get_url = function ($add_link, $select) {
-            var value = $select.val();
-            return $add_link.attr('href').split('?')[0] + '../' + value + '/';
-        };
+    /**
+     * Linked select - shows link to related item after Select
+     */
+    Suit.linked_select = function (select) {
+        var add_link = select.nextElementSibling;
+        if (!add_link || !add_link.classList.contains('add-another')) {
+            return;
+        }
+        var link = add_link.nextElementSibling;
+        if (!link || link.tagName !== 'A') {
+            link = document.createElement('a');
+            link.className = 'linked-select-link';
+            add_link.parentNode.insertBefore(link, add_link.nextSibling);
+            add_link.insertAdjacentHTML('afterend', ' &nbsp; ');
+        }
+        var option = selected_option(select);
+        link.textContent = option && select.value ? option.text : '';
+        link.setAttribute('href', add_link.getAttribute('href').split('?')[0] +
+            '../' + select.value + '/');
+    };
 
-        var add_link = function ($select) {
-            var $add_link = $select.next();
-            if ($add_link.hasClass('add-another')) {
-                var $link = $add_link.next('a');
-                if (!$link.length) {
-                    $link = $('<a/>').addClass('linked-select-link');
-                    $add_link.after($link).after(' &nbsp; ');
-                }
-                $link.text(get_link_name($select));
-                $link.attr('href', get_url($add_link, $select));
-            }
-        };
+    delegate('change', '.linked-select', function () {
+        Suit.linked_select(this);
+    });
 
-        $(this).each(function () {
-            add_link($(this));
+    /**
+     * Content tabs
+     */
+    function tab_contents(prefix, link) {
+        return document.querySelectorAll('.' + prefix + '-' +
+            link.getAttribute('href').replace('#', ''));
+    }
+
+    function show_tab(tabs, link) {
+        var prefix = tabs.getAttribute('data-tab-prefix');
+        each(link.parentNode.parentNode.querySelectorAll('.active'), function (el) {
+            el.classList.remove('active');
         });
-
-        $(document).on('change', this.selector, function () {
-            add_link($(this));
+        link.parentNode.classList.add('active');
+        each('.' + prefix, function (el) {
+            el.classList.remove('show');
+            el.classList.add('d-none');
         });
-    };
+        each(tab_contents(prefix, link), function (el) {
+            el.classList.remove('d-none');
+            el.classList.add('show');
+            if (el.hasAttribute('data-suit-lazy-tab')) {
+                load_tab(el);
+            }
+        });
+    }
 
     /**
-     * Content tabs
+     * Lazy tabs - fetch tab content rendered by LazyFormTabsMixin
      */
-    $.fn.suit_form_tabs = function () {
+    function run_scripts(container) {
+        var scripts = Array.prototype.slice.call(container.querySelectorAll('script'));
+        return scripts.reduce(function (previous, old_script) {
+            return previous.then(function () {
+                var src = old_script.getAttribute('src');
+                if (src && document.querySelectorAll('script[src="' + src + '"]').length > 1) {
+                    // Media already loaded by change form
+                    return;
+                }
+                return new Promise(function (resolve) {
+                    var script = document.createElement('script');
+                    Array.prototype.forEach.call(old_script.attributes, function (attr) {
+                        script.setAttribute(attr.name, attr.value);
+                    });
+                    if (src) {
+                        script.onload = script.onerror = resolve;
+                    } else {
+                        script.text = old_script.text;
+                    }
+                    old_script.parentNode.replaceChild(script, old_script);
+                    if (!src) {
+                        resolve();
+                    }
+                });
+            });
+        }, Promise.resolve());
+    }
 
-        var $tabs = $(this);
-        var tab_prefix = $tabs.data('tab-prefix');
-        if (!tab_prefix)
+    function load_tab(el) {
+        if (el.suit_loading) {
             return;
-
-        var $tab_links = $tabs.find('a');
-
-        function tab_contents($link) {
-            return $('.' + tab_prefix + '-' + $link.attr('href').replace('#', ''));
         }
-
-        function activate_tabs() {
-            // Init tab by error, by url hash or init first tab
-            if (window.location.hash) {
-                var found_error;
-                $tab_links.each(function () {
-                    var $link = $(this);
-                    if (tab_contents($link).find('.error').length != 0) {
-                        $link.addClass('error');
-                        $link.trigger('click');
-                        found_error = true;
-                    }
+        el.suit_loading = true;
+        el.classList.add('suit-tab-loading');
+        var url = new URL(window.location.href);
+        url.hash = '';
+        url.searchParams.set('_suit_tab', el.getAttribute('data-suit-lazy-tab'));
+        window.fetch(url.toString(), {credentials: 'same-origin'}).then(function (response) {
+            if (!response.ok) {
+                throw new Error(response.statusText);
+            }
+            return response.text();
+        }).then(function (html) {
+            el.removeAttribute('data-suit-lazy-tab');
+            el.innerHTML = html;
+            return run_scripts(el);
+        }).then(function () {
+            // Django calendar/clock shortcuts are initialized only on page load
+            if (window.DateTimeShortcuts && el.querySelector('.vDateField, .vTimeField')) {
+                each('.datetimeshortcuts', function (shortcuts) {
+                    shortcuts.parentNode.removeChild(shortcuts);
                 });
-                !found_error && $($tabs).find('a[href=\\' + window.location.hash + ']').click();
-            } else {
-                $tab_links.first().trigger('click');
+                window.DateTimeShortcuts.init();
             }
+            el.dispatchEvent(new CustomEvent('suit:tab-loaded', {bubbles: true}));
+        }).catch(function (err) {
+            el.textContent = err.message;
+        }).then(function () {
+            el.suit_loading = false;
+            el.classList.remove('suit-tab-loading');
+        });
+    }
+
+    Suit.form_tabs = function (tabs) {
+        if (!tabs || !tabs.getAttribute('data-tab-prefix')) {
+            return;
+        }
+        tabs.suit_tabs = true;
+        var prefix = tabs.getAttribute('data-tab-prefix'),
+            links = Array.prototype.slice.call(tabs.querySelectorAll('a'));
+        if (!links.length) {
+            return;
         }
 
-        $tab_links.click(function () {
-            var $link = $(this);
-            $link.parent().parent().find('.active').removeClass('active');
-            $link.parent().addClass('active');
-            $('.' + tab_prefix).removeClass('show').addClass('d-none');
-            tab_contents($link).removeClass('d-none').addClass('show')
+        // Init tab by error, by url hash or init first tab
+        var found = false;
+        links.forEach(function (link) {
+            var has_error = Array.prototype.some.call(tab_contents(prefix, link), function (el) {
+                return el.querySelector('.error');
+            });
+            if (has_error) {
+                link.classList.add('error');
+                show_tab(tabs, link);
+                found = true;
+            }
         });
-
-        activate_tabs();
+        if (!found && window.location.hash) {
+            links.forEach(function (link) {
+                if (link.getAttribute('href') === window.location.hash) {
+                    show_tab(tabs, link);
+                    found = true;
+                }
+            });
+        }
+        if (!found) {
+            show_tab(tabs, links[0]);
+        }
     };
 
+    delegate('click', '[data-tab-prefix] a', function (e, link) {
+        var tabs = link.closest('[data-tab-prefix]');
+        if (tabs.suit_tabs) {
+            show_tab(tabs, link);
+        }
+    });
+
     /**
      * Avoids double-submit issues in the change_form.
      */
-    $.fn.suit_form_debounce = function () {
-        var $form = $(this),
-            $saveButtons = $form.find('.submit-row button'),
-            submitting = false;
+    Suit.form_debounce = function (form) {
+        if (!form || form.suit_debounce) {
+            return;
+        }
+        form.suit_debounce = true;
+        var submitting = false;
 
-        $form.submit(function () {
+        form.addEventListener('submit', function (e) {
             if (submitting) {
-                return false;
+                e.preventDefault();
+                e.stopPropagation();
+                return;
             }
 
             submitting = true;
-            $saveButtons.addClass('disabled');
+            var buttons = form.querySelectorAll('.submit-row button');
+            each(buttons, function (button) {
+                button.classList.add('disabled');
+            });
 
             setTimeout(function () {
-                $saveButtons.removeClass('disabled');
+                each(buttons, function (button) {
+                    button.classList.remove('disabled');
+                });
                 submitting = false;
             }, 5000);
         });
@@ -186,93 +351,241 @@
     /**
      * Make Suit date/time widget icons trigger Django's calendar/clock
      */
-    $.fn.suit_date_widget = function () {
-        $(this).on('click', '.suit-date .add-on, .suit-time .add-on', function (e) {
-            e.preventDefault();
-            e.stopPropagation();
-            var $addOn = $(this);
-            var $wrapper = $addOn.closest('.suit-date, .suit-time');
-
-            // Find the Django-added calendar/clock link
-            var $shortcutsSpan = $wrapper.find('.datetimeshortcuts');
-            if ($shortcutsSpan.length) {
-                // Click the icon link (last anchor in shortcuts span)
-                var $iconLink = $shortcutsSpan.find('a:last');
-                if ($iconLink.length) {
-                    $iconLink[0].click();
-                }
-            }
-        });
-    };
+    delegate('click', '.suit-date .add-on, .suit-time .add-on', function (e, add_on) {
+        // Find the Django-added calendar/clock link
+        var shortcuts = add_on.closest('.suit-date, .suit-time').querySelector('.datetimeshortcuts');
+        if (!shortcuts) {
+            return;
+        }
+        e.preventDefault();
+        e.stopPropagation();
+        // Click the icon link (last anchor in shortcuts span)
+        var icon_links = shortcuts.querySelectorAll('a');
+        if (icon_links.length) {
+            icon_links[icon_links.length - 1].click();
+        }
+    });
 
     /**
      * Offcanvas - close when clicking nav links (mobile navigation)
      */
-    $.fn.suit_offcanvas_nav = function () {
-        var $offcanvas = $(this);
-        var offcanvasEl = $offcanvas[0];
-        if (!offcanvasEl) return;
-
-        // Get Bootstrap offcanvas instance
-        var bsOffcanvas = bootstrap.Offcanvas.getOrCreateInstance(offcanvasEl);
-
-        // Close offcanvas when clicking a nav link (not a collapse toggle)
-        $offcanvas.on('click', '.nav-link:not([data-bs-toggle="collapse"])', function () {
-            bsOffcanvas.hide();
-        });
-    };
+    delegate('click', '#sidebarOffcanvas .nav-link:not([data-bs-toggle="collapse"])', function () {
+        if (window.bootstrap) {
+            window.bootstrap.Offcanvas.getOrCreateInstance(
+                document.getElementById('sidebarOffcanvas')).hide();
+        }
+    });
 
     /**
      * Initialize nav collapse state - expand only menu containing active link
      */
-    $.fn.suit_nav_collapse_init = function () {
-        $(this).each(function () {
-            var $nav = $(this);
-
-            // Collapse all menus first
-            $nav.find('[data-bs-toggle="collapse"]').each(function () {
-                var $toggle = $(this);
-                var targetId = $toggle.attr('href') || $toggle.data('bs-target');
-                if (!targetId) return;
-
-                var $target = $(targetId);
-
-                // Check if this submenu contains an active link
-                var hasActiveLink = $target.find('.nav-link.active').length > 0;
-
-                if (hasActiveLink) {
-                    // Expand this menu
-                    $target.addClass('show');
-                    $toggle.attr('aria-expanded', 'true');
-                } else {
-                    // Collapse this menu
-                    $target.removeClass('show');
-                    $toggle.attr('aria-expanded', 'false');
+    Suit.nav_collapse_init = function (navs) {
+        each(navs, function (nav) {
+            each(nav.querySelectorAll('[data-bs-toggle="collapse"]'), function (toggle) {
+                var target_id = toggle.getAttribute('href') || toggle.getAttribute('data-bs-target');
+                var target = null;
+                if (target_id) {
+                    try {
+                        target = document.querySelector(target_id);
+                    } catch (err) {
+                        // Not a valid selector
+                    }
+                }
+                if (!target) {
+                    return;
                 }
+                // Expand only submenu, which contains an active link
+                var expanded = !!target.querySelector('.nav-link.active');
+                target.classList.toggle('show', expanded);
+                toggle.setAttribute('aria-expanded', expanded ? 'true' : 'false');
             });
         });
     };
 
-    $(function () {
+    /**
+     * Virtual change list - keeps only rows near viewport in DOM for long
+     * result lists. Other rows are detached, but kept with their state
+     * (action checkboxes, list_editable inputs), and all rows are put back
+     * in order right before form is submitted.
+     */
+    var VIRTUAL_OVERSCAN = 30;
+
+    function spacer_row(columns) {
+        var row = document.createElement('tr'),
+            cell = document.createElement('td');
+        row.className = 'suit-virtual-spacer';
+        row.setAttribute('aria-hidden', 'true');
+        cell.colSpan = columns;
+        cell.style.padding = '0';
+        cell.style.border = '0';
+        row.appendChild(cell);
+        return row;
+    }
+
+    Suit.virtual_list = function (table) {
+        if (!table || table.suit_virtual || table.classList.contains('table-mptt') ||
+                table.querySelector('.errorlist')) {
+            return;
+        }
+        var threshold = parseInt(table.getAttribute('data-suit-virtual-rows'), 10),
+            tbody = table.tBodies[0],
+            rows = tbody ? Array.prototype.slice.call(tbody.rows) : [];
+        if (!threshold || rows.length <= threshold) {
+            return;
+        }
+        table.suit_virtual = true;
+
+        var columns = rows[0].cells.length,
+            top = spacer_row(columns),
+            parity = spacer_row(columns),
+            bottom = spacer_row(columns),
+            row_height = tbody.offsetHeight / rows.length || 30,
+            start = 0,
+            end = rows.length,
+            pending = false;
+
+        parity.style.display = 'none';
+
+        // Read back rendered rows, their order may have changed (sortables)
+        function sync() {
+            var rendered = Array.prototype.filter.call(tbody.rows, function (row) {
+                return row.className.indexOf('suit-virtual-spacer') === -1;
+            });
+            Array.prototype.splice.apply(rows, [start, end - start].concat(rendered));
+        }
+
+        function set_height(spacer, count) {
+            spacer.style.display = count ? '' : 'none';
+            spacer.firstChild.style.height = count * row_height + 'px';
+        }
+
+        function render() {
+            pending = false;
+            if (!table.suit_virtual) {
+                return;
+            }
+            var offset = -tbody.getBoundingClientRect().top,
+                visible = Math.ceil(window.innerHeight / row_height),
+                first = Math.floor(offset / row_height) - VIRTUAL_OVERSCAN;
+            first = Math.max(0, Math.min(first, rows.length - visible - 2 * VIRTUAL_OVERSCAN));
+            var last = Math.min(rows.length, first + visible + 2 * VIRTUAL_OVERSCAN);
+            if (first === start && last === end) {
+                return;
+            }
+            sync();
+            start = first;
+            end = last;
+
+            var fragment = document.createDocumentFragment();
+            fragment.appendChild(top);
+            // Keep odd/even rows of .table-striped
+            if (start % 2 === 0) {
+                fragment.appendChild(parity);
+            }
+            for (var i = start; i < end; i++) {
+                fragment.appendChild(rows[i]);
+            }
+            fragment.appendChild(bottom);
+            set_height(top, start);
+            set_height(bottom, rows.length - end);
+            tbody.textContent = '';
+            tbody.appendChild(fragment);
+        }
+
+        function request_render() {
+            if (!pending) {
+                pending = true;
+                window.requestAnimationFrame(render);
+            }
+        }
+
+        // Put all rows back, so they are submitted and numbered by sortables
+        function restore() {
+            if (!table.suit_virtual) {
+                return;
+            }
+            sync();
+            table.suit_virtual = false;
+            var fragment = document.createDocumentFragment();
+            rows.forEach(function (row) {
+                fragment.appendChild(row);
+            });
+            tbody.textContent = '';
+            tbody.appendChild(fragment);
+        }
+
+        var form = table.closest('form');
+        if (form) {
+            // Capture phase runs before other submit handlers
+            form.addEventListener('submit', restore, true);
+        }
+        window.addEventListener('scroll', request_render, {passive: true});
+        window.addEventListener('resize', request_render);
+        render();
+    };
+
+    on_ready(function () {
 
         // Fixed submit buttons
-        $('.inner-right-column').suit_fixed();
+        Suit.fixed('.inner-right-column');
 
         // Show link to related item after Select
-        $('.linked-select').suit_linked_select();
+        each('.linked-select', Suit.linked_select);
 
         // Handle change list filter null values
-        $('.search-filter').suit_search_filters();
-
-        // Make date/time widget icons clickable
-        $(document).suit_date_widget();
-
-        // Mobile offcanvas navigation
-        $('#sidebarOffcanvas').suit_offcanvas_nav();
+        each('.search-filter', Suit.search_filter);
 
         // Initialize nav collapse state - expand only active menu
-        $('.left-nav').suit_nav_collapse_init();
+        Suit.nav_collapse_init('.left-nav');
 
     });
 
-}(Suit.$));
+    // After admin actions.js has collected action checkboxes on load
+    window.addEventListener('load', function () {
+        setTimeout(function () {
+            Suit.virtual_list(document.getElementById('result_list'));
+        });
+    });
+
+    // jQuery plugins for backwards compatibility
+    var $ = Suit.$;
+    if ($ && $.fn) {
+        $.fn.suit_fixed = function () {
+            Suit.fixed(this.get());
+            return this;
+        };
+        $.fn.suit_search_filters = function () {
+            this.each(function () {
+                Suit.search_filter(this);
+            });
+            return this;
+        };
+        $.fn.suit_linked_select = function () {
+            this.each(function () {
+                Suit.linked_select(this);
+            });
+            return this;
+        };
+        $.fn.suit_form_tabs = function () {
+            this.each(function () {
+                Suit.form_tabs(this);
+            });
+            return this;
+        };
+        $.fn.suit_form_debounce = function () {
+            this.each(function () {
+                Suit.form_debounce(this);
+            });
+            return this;
+        };
+        $.fn.suit_nav_collapse_init = function () {
+            Suit.nav_collapse_init(this.get());
+            return this;
+        };
+        // Date widget and offcanvas navigation are delegated already
+        $.fn.suit_date_widget = $.fn.suit_offcanvas_nav = function () {
+            return this;
+        };
+    }
+
+}(window, document));
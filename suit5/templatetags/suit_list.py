@@ -1,12 +1,13 @@
 from copy import copy
-from inspect import getargspec
+from functools import lru_cache
 from django import template
 from django.template.loader import get_template
 from django.utils.safestring import mark_safe
 from django.contrib.admin.templatetags.admin_list import result_list
 from django.contrib.admin.views.main import ALL_VAR, PAGE_VAR
 from django.utils.html import escape
-from suit5.compat import tpl_context_class
+from suit5.compat import tpl_context_class, getargspec
+from suit5.instrumentation import instrumented
 
 try:
     # Python 3.
@@ -65,6 +66,7 @@ def paginator_info(cl):
 
 
 @register.inclusion_tag('admin/pagination.html')
+@instrumented
 def pagination(cl):
     """
     Generates the series of links to the pages in a paginated list.
@@ -116,6 +118,7 @@ def pagination(cl):
 
 
 @register.simple_tag
+@instrumented
 def suit_list_filter_select(cl, spec):
     tpl = get_template(spec.template)
     choices = list(spec.choices(cl))
@@ -159,6 +162,7 @@ def suit_list_filter_select(cl, spec):
 
 
 @register.filter
+@instrumented
 def headers_handler(result_headers, cl):
     """
     Adds field name to css class, so we can style specific columns
@@ -198,7 +202,17 @@ def result_list_with_context(context, cl):
     return res
 
 
+@lru_cache(maxsize=None)
+def takes_request(func):
+    """
+    Whether suit_row_attributes accepts request argument. Inspected once per
+    function instead of on every row
+    """
+    return 'request' in getargspec(func)[0]
+
+
 @register.simple_tag(takes_context=True)
+@instrumented
 def result_row_attrs(context, cl, row_index):
     """
     Returns row attributes based on object instance
@@ -214,8 +228,8 @@ def result_row_attrs(context, cl, row_index):
     instance = cl.result_list[row_index]
 
     # Backwards compatibility for suit_row_attributes without request argument
-    args = getargspec(suit_row_attributes)
-    if 'request' in args[0]:
+    if takes_request(getattr(suit_row_attributes, '__func__',
+                             suit_row_attributes)):
         new_attrs = suit_row_attributes(instance, context['request'])
     else:
         new_attrs = suit_row_attributes(instance)
@@ -237,6 +251,7 @@ def result_row_attrs(context, cl, row_index):
 
 
 @register.filter
+@instrumented
 def cells_handler(results, cl):
     """
     Changes result cell attributes based on object instance and field name
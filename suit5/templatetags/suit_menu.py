@@ -20,6 +20,7 @@ import re
 import warnings
 from suit5.config import get_config
 from suit5 import utils
+from suit5.instrumentation import instrumented
 
 register = template.Library()
 
@@ -32,6 +33,7 @@ else:
 
 
 @simple_tag(takes_context=True)
+@instrumented
 def get_menu(context, request):
     """
     :type request: HttpRequest
@@ -1,11 +1,20 @@
 import itertools
+import json
+import os
+import posixpath
+import re
+from functools import lru_cache
 from django import template
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
 from django.db.models import ForeignKey
 from django.template.defaulttags import NowNode
+from django.template.base import Variable
+from django.templatetags.static import static
+from django.utils.html import conditional_escape
 from django.utils.safestring import mark_safe
 from suit5.config import get_config
 from suit5 import utils
+from suit5.instrumentation import instrumented
 
 try:
     from django.core.urlresolvers import NoReverseMatch, reverse
@@ -45,6 +54,7 @@ def suit_time(parser, token):
 
 
 @register.filter
+@instrumented
 def field_contents_foreign_linked(admin_field):
     """Return the .contents attribute of the admin_field, and if it
     is a foreign key, wrap it in a link to the admin page for that
@@ -85,14 +95,133 @@ def admin_url(obj):
     return reverse("admin:%s_%s_change" % info, args=[obj.pk])
 
 
+BUNDLES_DIR = 'suit5/dist/'
+BUNDLES_MANIFEST = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'static', 'suit5', 'dist', 'manifest.json')
+
+_bundles_manifest = None
+
+
+def get_bundles_manifest():
+    """
+    Load manifest of content-hashed bundles built by
+    scripts/build_bundles.js. Loaded only once per process
+    """
+    global _bundles_manifest
+    if _bundles_manifest is None:
+        try:
+            with open(BUNDLES_MANIFEST) as f:
+                _bundles_manifest = json.load(f)
+        except (IOError, ValueError) as e:
+            raise ImproperlyConfigured(
+                'Django Suit5 asset bundles manifest could not be loaded '
+                '(%s). Run "npm run build:bundles" or disable ASSET_BUNDLES '
+                'config.' % e)
+    return _bundles_manifest
+
+
 @register.simple_tag
-def suit_bc(*args):
-    return utils.value_by_version(args)
+def suit_bundle_url(name):
+    """
+    Return static url of content-hashed bundle, e.g. 'suit.css' or 'suit.js'
+    """
+    try:
+        return static(BUNDLES_DIR + get_bundles_manifest()[name])
+    except KeyError:
+        raise ImproperlyConfigured(
+            'Django Suit5 asset bundle "%s" not found in manifest' % name)
 
 
-@simple_tag
-def suit_bc_value(*args):
-    return utils.value_by_version(args)
+CRITICAL_CSS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'static', 'suit5', 'css', 'critical.css')
+CSS_URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+
+_critical_css = None
+
+
+def rebase_css_urls(css, path):
+    """
+    Replace url(...) relative to static path of stylesheet by static urls,
+    so stylesheet can be inlined in any page
+    """
+    def replace(match):
+        url = match.group(2)
+        if re.match(r'^(data:|https?:|/|#)', url):
+            return match.group(0)
+        return 'url("%s")' % static(
+            posixpath.normpath(posixpath.join(posixpath.dirname(path), url)))
+    return CSS_URL.sub(replace, css)
+
+
+@register.simple_tag
+def suit_critical_css():
+    """
+    Inline critical CSS compiled from scss/critical.scss. Loaded only once
+    per process
+    """
+    global _critical_css
+    if _critical_css is None:
+        try:
+            with open(CRITICAL_CSS) as f:
+                css = f.read()
+        except IOError as e:
+            raise ImproperlyConfigured(
+                'Django Suit5 critical CSS could not be loaded (%s). Run '
+                '"npm run build:critical" or disable PERFORMANCE_MODE config.' % e)
+        css = re.sub(r'/\*# sourceMappingURL=.*?\*/', '', css).strip()
+        css = rebase_css_urls(css, 'suit5/css/critical.css')
+        _critical_css = mark_safe('<style type="text/css">%s</style>' % css)
+    return _critical_css
+
+
+class VersionValueNode(template.Node):
+    """
+    Value for current Django version, chosen when template is parsed
+    """
+
+    def __init__(self, value, target_var=None):
+        self.target_var = target_var
+        self.constant = not value.filters and not (
+            isinstance(value.var, Variable) and value.var.lookups)
+        # Literals are resolved once, variables on render
+        self.value = value.resolve({}) if self.constant else value
+
+    def render(self, context):
+        value = self.value if self.constant else self.value.resolve(context)
+        if self.target_var:
+            context[self.target_var] = value
+            return ''
+        if context.autoescape:
+            value = conditional_escape(value)
+        return value
+
+
+def parse_version_value(parser, token):
+    """
+    {% suit_bc 1.5 'x' 1.6 'y' %} renders value of current Django version or
+    the last one, {% suit_bc_value ... as var %} stores it in var
+    """
+    bits = token.split_contents()
+    tag_name, args = bits[0], bits[1:]
+    target_var = None
+    if len(args) >= 2 and args[-2] == 'as':
+        target_var = args[-1]
+        args = args[:-2]
+    if not args or len(args) % 2:
+        raise template.TemplateSyntaxError(
+            "'%s' takes pairs of Django version and value, e.g. "
+            "{%% %s 1.5 'x' 1.6 'y' %%}" % (tag_name, tag_name))
+    versions = [version.strip('"\'') for version in args[0::2]]
+    values = args[1::2]
+    value = dict(zip(versions, values)).get(
+        utils.DJANGO_MAJOR_VERSION_STRING, values[-1])
+    return VersionValueNode(parser.compile_filter(value), target_var)
+
+
+suit_bc = register.tag('suit_bc', parse_version_value)
+suit_bc_value = register.tag('suit_bc_value', parse_version_value)
 
 
 @simple_tag
@@ -134,7 +263,9 @@ def django_version_gte(string):
     return django_version >= str_to_version(string)
 
 
+@lru_cache(maxsize=None)
 def str_to_version(string):
+    # Filters get the same few literals from templates, in inline loops
     return tuple([int(s) for s in string.split('.')])
 
 
@@ -10,10 +10,21 @@ from suit5.tests.templatetags.suit_menu import SuitMenuTestCase, \
     SuitMenuAdminCustomURLTestCase
 from suit5.tests.templatetags.suit_tags import SuitTagsTestCase
 from suit5.tests.templatetags.suit_list import SuitListTestCase
-from suit5.tests.templates.form_tabs import FormTabsTestCase
+from suit5.tests.templates.form_tabs import FormTabsTestCase, \
+    LazyFormTabsTestCase, LazyFormTabsViewTestCase
+from suit5.tests.templates.base import BaseTemplateTestCase
 from suit5.tests.config import ConfigTestCase, ConfigWithModelsTestCase
 from suit5.tests.widgets import WidgetsTestCase
 from suit5.tests.utils import UtilsTestCase
+from suit5.tests.sortables import SortablesTestCase, \
+    SortableFieldsetsTestCase
+from suit5.tests.compress_static import CompressStaticTestCase
+from suit5.tests.instrumentation import InstrumentationTestCase
+from suit5.tests.query_budgets import QueryBudgetTestCase
+from suit5.tests.suit_profile import SuitProfileTestCase
+from suit5.tests.checks import ChecksTestCase
+from suit5.tests.integrations import IntegrationsTestCase
+from suit5.tests.diagnostics import DiagnosticsTestCase
 
 try:
     # Django 1.7+
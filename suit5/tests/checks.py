@@ -0,0 +1,51 @@
+from django.test import SimpleTestCase, override_settings
+from suit5.checks import check_cached_template_loader
+from suit5.utils import DJANGO_MAJOR_VERSION
+
+LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+
+def templates(**options):
+    return [{
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': 'loaders' not in options,
+        'OPTIONS': options,
+    }]
+
+
+class ChecksTestCase(SimpleTestCase):
+    def check_ids(self):
+        return [error.id for error in check_cached_template_loader(None)]
+
+    @override_settings(DEBUG=False, TEMPLATES=templates(loaders=LOADERS))
+    def test_warns_without_cached_loader(self):
+        self.assertEqual(self.check_ids(), ['suit5.W001'])
+
+    @override_settings(DEBUG=False, TEMPLATES=templates(debug=True))
+    def test_template_debug(self):
+        # Django 4.1+ enables cached loader also with template debug on
+        self.assertEqual(self.check_ids(), [] if DJANGO_MAJOR_VERSION >= (4, 1)
+                         else ['suit5.W001'])
+
+    @override_settings(DEBUG=False, TEMPLATES=templates(loaders=[
+        ('django.template.loaders.cached.Loader', LOADERS)]))
+    def test_cached_loader(self):
+        self.assertEqual(self.check_ids(), [])
+
+    @override_settings(DEBUG=False, TEMPLATES=templates())
+    def test_default_loaders(self):
+        # Django enables cached loader when template debug is off
+        self.assertEqual(self.check_ids(), [])
+
+    @override_settings(DEBUG=True, TEMPLATES=templates(loaders=LOADERS))
+    def test_debug(self):
+        self.assertEqual(self.check_ids(), [])
+
+    @override_settings(DEBUG=False, TEMPLATES=templates(
+        loaders=['django.template.loaders.filesystem.Loader']))
+    def test_engine_without_suit_templates(self):
+        self.assertEqual(self.check_ids(), [])
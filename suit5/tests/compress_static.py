@@ -0,0 +1,66 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+
+class CompressStaticTestCase(TestCase):
+    def setUp(self):
+        self.static_root = tempfile.mkdtemp()
+        self.css_dir = os.path.join(self.static_root, 'suit5', 'css')
+        os.makedirs(self.css_dir)
+        self.css = b'.header { color: white; }\n' * 100
+        self.write('suit5/css/suit.css', self.css)
+        self.write('suit5/css/tiny.css', b'a{}')
+        self.write('suit5/img/logo.png', b'\x89PNG' * 100)
+        self.write('admin/css/base.css', self.css)
+
+    def tearDown(self):
+        shutil.rmtree(self.static_root)
+
+    def write(self, name, data):
+        path = os.path.join(self.static_root, name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    def path(self, name):
+        return os.path.join(self.static_root, name)
+
+    def compress(self, *args):
+        with self.settings(STATIC_ROOT=self.static_root):
+            call_command('suit_compress_static', *args, stdout=StringIO(),
+                         stderr=StringIO())
+
+    def test_writes_gzip_siblings(self):
+        self.compress()
+        with gzip.open(self.path('suit5/css/suit.css.gz')) as f:
+            self.assertEqual(f.read(), self.css)
+        self.assertFalse(os.path.exists(self.path('suit5/css/tiny.css.gz')))
+        self.assertFalse(os.path.exists(self.path('suit5/img/logo.png.gz')))
+        self.assertFalse(os.path.exists(self.path('admin/css/base.css.gz')))
+
+    def test_manifest(self):
+        self.compress()
+        with open(self.path('suit5/compressed.json')) as f:
+            manifest = json.load(f)['files']
+        self.assertEqual(list(manifest), ['suit5/css/suit.css'])
+        entry = manifest['suit5/css/suit.css']
+        self.assertEqual(entry['size'], len(self.css))
+        self.assertEqual(entry['gz'],
+                         os.path.getsize(self.path('suit5/css/suit.css.gz')))
+
+    def test_all(self):
+        self.compress('--all')
+        self.assertTrue(os.path.exists(self.path('admin/css/base.css.gz')))
+
+    def test_missing_static_root(self):
+        with self.settings(STATIC_ROOT=None):
+            self.assertRaises(CommandError, call_command,
+                              'suit_compress_static')
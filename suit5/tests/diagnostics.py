@@ -0,0 +1,53 @@
+import sys
+from contextlib import redirect_stderr
+from io import StringIO
+
+from django.test import SimpleTestCase
+from suit5.diagnostics import collect, format_report, main, \
+    parse_importtime, run_child, MARKER
+
+IMPORTTIME = '''import time: self [us] | cumulative | imported package
+import time:       100 |        100 | django.baseline
+%s
+import time:        20 |         20 |     _contextvars
+import time:        10 |         30 |   contextvars
+import time:        40 |         70 | suit5.instrumentation
+import time:         5 |          5 | suit5.compat
+import time:        50 |        125 | suit5.templatetags.suit_menu
+''' % MARKER
+
+
+class DiagnosticsTestCase(SimpleTestCase):
+    def test_parse_importtime(self):
+        self.assertEqual(parse_importtime(IMPORTTIME), [
+            (0, 'suit5.instrumentation', 0.04, 0.07),
+            (1, 'contextvars', 0.01, 0.03),
+            (2, '_contextvars', 0.02, 0.02),
+            (0, 'suit5.compat', 0.005, 0.005),
+            (0, 'suit5.templatetags.suit_menu', 0.05, 0.125),
+        ])
+
+    def test_collect(self):
+        report = collect(repeat=1)
+        self.assertGreater(report['import_time'], 0)
+        self.assertIn('suit5.admin', report['modules'])
+        self.assertNotIn('django.contrib.admin', report['modules'])
+        self.assertIn('get_menu', report['libraries']['suit_menu']['tags'])
+        self.assertGreater(report['allocated'], 0)
+        if sys.platform.startswith('linux'):
+            self.assertGreater(report['rss'], 0)
+        output = format_report(report)
+        self.assertIn('suit5.admin', output)
+        self.assertIn('Template tag libraries', output)
+
+    def test_rss_is_measured_without_tracemalloc(self):
+        result = run_child('rss')[0]
+        self.assertNotIn('allocated', result)
+        self.assertIn('rss', result)
+        result = run_child('allocated')[0]
+        self.assertNotIn('rss', result)
+        self.assertGreater(result['allocated'], 0)
+
+    def test_invalid_repeat(self):
+        with self.assertRaises(SystemExit), redirect_stderr(StringIO()):
+            main(['--repeat', '0'])
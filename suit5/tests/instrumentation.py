@@ -0,0 +1,70 @@
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+from suit5.instrumentation import collect, instrumented, server_timing, \
+    instrument_request, request_instrumented, SuitInstrumentationMiddleware
+from suit5.tests.mixins import UserTestCaseMixin
+
+try:
+    from django.core.urlresolvers import reverse
+except ImportError:
+    # For Django >= 2.0
+    from django.urls import reverse
+
+
+@instrumented
+def count_users():
+    return User.objects.count()
+
+
+class InstrumentationTestCase(UserTestCaseMixin):
+    def test_not_collected_outside_of_request(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(count_users(), 0)
+
+    def test_collect(self):
+        with collect() as collector:
+            count_users()
+            count_users()
+            User.objects.count()
+        self.assertEqual(list(collector.stats), ['count_users'])
+        self.assertEqual(collector.stats['count_users']['calls'], 2)
+        self.assertEqual(collector.stats['count_users']['queries'], 2)
+        self.assertGreater(collector.stats['count_users']['time'], 0)
+
+    def test_server_timing(self):
+        header = server_timing({'get_menu': {'calls': 1, 'time': 1.5,
+                                             'queries': 2}})
+        self.assertEqual(header, 'suit;dur=1.50;desc="Suit total", '
+                                 'suit-get-menu;dur=1.50;'
+                                 'desc="get_menu x1, 2 queries"')
+
+    def test_middleware(self):
+        received = []
+
+        def receiver(sender, request, response, stats, **kwargs):
+            received.append(stats)
+
+        self.login_superuser()
+        request = RequestFactory().get('/')
+        request.user = self.superuser
+        middleware = SuitInstrumentationMiddleware(
+            lambda request: self.client.get(reverse('admin:index')))
+        request_instrumented.connect(receiver)
+        try:
+            response = middleware(request)
+        finally:
+            request_instrumented.disconnect(receiver)
+        self.assertIn('get_menu', request.suit_instrumentation)
+        self.assertEqual(received, [request.suit_instrumentation])
+        self.assertIn('suit-get-menu;dur=', response['Server-Timing'])
+
+    def test_nested_instrumentation(self):
+        # Middleware before debug toolbar, which instruments request again
+        request = RequestFactory().get('/')
+        with collect() as collector:
+            response, stats = instrument_request(
+                request, lambda request: count_users())
+        self.assertEqual(response, 0)
+        self.assertIs(stats, collector.stats)
+        self.assertIs(request.suit_instrumentation, collector.stats)
+        self.assertEqual(stats['count_users']['calls'], 1)
@@ -0,0 +1,101 @@
+import sys
+from importlib.abc import Loader, MetaPathFinder
+from importlib.util import spec_from_loader
+from unittest import mock
+
+from django.apps import apps
+from django.core.signals import request_started
+from django.test import TestCase, override_settings
+from suit5 import integrations
+
+
+def stub_form():
+    return type('StubForm', (object,), {'Meta': type('Meta', (object,), {})})
+
+
+# Admin modules of cms and filer used by integrations, with stub contents
+STUBS = {
+    'cms': {},
+    'cms.admin': {},
+    'cms.admin.forms': {'PageForm': stub_form},
+    'filer': {},
+    'filer.admin': {'FolderAdmin': lambda: type('FolderAdmin', (object,), {})},
+    'filer.admin.imageadmin': {'ImageAdminForm': stub_form},
+    'filer.admin.fileadmin': {'FileAdminChangeFrom': stub_form},
+}
+
+
+class StubFinder(MetaPathFinder, Loader):
+    """
+    Imports stub cms and filer modules, so test can tell when they are
+    imported
+    """
+
+    def find_spec(self, name, path=None, target=None):
+        if name in STUBS:
+            is_package = any(other.startswith(name + '.') for other in STUBS)
+            return spec_from_loader(name, self, is_package=is_package)
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        for attr, factory in STUBS[module.__name__].items():
+            setattr(module, attr, factory())
+
+
+class IntegrationsTestCase(TestCase):
+    def setUp(self):
+        self.calls = []
+        self.saved_INTEGRATIONS = integrations.INTEGRATIONS
+        integrations.INTEGRATIONS = {
+            'django.contrib.auth': lambda: self.calls.append('auth'),
+            'not_installed': lambda: self.calls.append('not_installed'),
+        }
+
+    def tearDown(self):
+        integrations.INTEGRATIONS = self.saved_INTEGRATIONS
+        request_started.disconnect(dispatch_uid=integrations.DISPATCH_UID)
+
+    @override_settings(SUIT_CONFIG={
+        'INTEGRATIONS': ('django.contrib.auth', 'not_installed')})
+    def test_applied_once_on_first_request(self):
+        integrations.register_integrations()
+        self.assertEqual(self.calls, [])
+        request_started.send(sender=self.__class__)
+        request_started.send(sender=self.__class__)
+        self.assertEqual(self.calls, ['auth'])
+
+    @override_settings(SUIT_CONFIG={'INTEGRATIONS': ()})
+    def test_disabled(self):
+        integrations.register_integrations()
+        request_started.send(sender=self.__class__)
+        self.assertEqual(self.calls, [])
+
+    def test_third_party_admin_imported_on_first_request(self):
+        integrations.INTEGRATIONS = self.saved_INTEGRATIONS
+        finder = StubFinder()
+        sys.meta_path.insert(0, finder)
+        installed = mock.patch.object(
+            apps, 'is_installed',
+            lambda name: name in ('cms', 'filer') or name in [
+                app.name for app in apps.get_app_configs()])
+        try:
+            with installed:
+                import suit5.admin  # noqa
+                import suit5.config  # noqa
+                apps.get_app_config('suit5').ready()
+                self.assertEqual(integrations.get_integrations(), [
+                    integrations.setup_cms, integrations.setup_filer])
+                self.assertEqual(
+                    [name for name in STUBS if name in sys.modules], [])
+
+                request_started.send(sender=self.__class__)
+                from cms.admin.forms import PageForm
+                from filer.admin import FolderAdmin
+                self.assertIn('publication_date', PageForm.Meta.widgets)
+                self.assertFalse(FolderAdmin.actions_on_top)
+        finally:
+            sys.meta_path.remove(finder)
+            for name in STUBS:
+                sys.modules.pop(name, None)
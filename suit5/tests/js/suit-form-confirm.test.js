@@ -0,0 +1,145 @@
+/**
+ * Tests of suit-form-confirm.js with minimal fake DOM
+ *
+ *   node --test suit5/tests/js/*.test.js   (or: npm run test:js)
+ */
+'use strict';
+
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const test = require('node:test');
+const vm = require('vm');
+
+const SCRIPT = path.join(__dirname, '..', '..', 'static', 'suit5', 'js',
+    'suit-form-confirm.js');
+
+function eventTarget() {
+    const listeners = {};
+    return {
+        addEventListener(type, listener) {
+            (listeners[type] = listeners[type] || []).push(listener);
+        },
+        dispatch(type, event) {
+            (listeners[type] || []).forEach(listener => listener(event));
+            return event;
+        },
+    };
+}
+
+function setup() {
+    const document = eventTarget();
+    const window = eventTarget();
+    const form = {
+        elements: [],
+        // Only "input.CLASS, ..." selectors are supported
+        querySelectorAll(selectors) {
+            const classes = selectors.split(',')
+                .map(selector => selector.trim().replace(/^input\./, ''));
+            return this.elements.filter(element => element.tagName == 'INPUT' &&
+                classes.some(cls => element.className.split(' ').includes(cls)));
+        },
+    };
+    document.forms = {book_form: form};
+
+    function field(name, attrs) {
+        const element = Object.assign({
+            name: name, form: form, tagName: 'INPUT', className: '',
+        }, attrs);
+        element.getAttribute = attr => attr == 'class' ? element.className : '';
+        form.elements.push(element);
+        form.elements[name] = element;
+        return element;
+    }
+
+    function unload() {
+        return window.dispatch('beforeunload', {
+            prevented: false,
+            preventDefault() {
+                this.prevented = true;
+            },
+        }).prevented;
+    }
+
+    const context = {document: document, window: window};
+    vm.runInNewContext(fs.readFileSync(SCRIPT, 'utf8') +
+        '\nconfirmExitIfModified("book_form", "Unsaved");', context);
+    return {document, form, field, unload};
+}
+
+test('unchanged form does not warn', () => {
+    const page = setup();
+    page.field('name', {type: 'text', value: 'a', defaultValue: 'a'});
+    assert.strictEqual(page.unload(), false);
+});
+
+test('field changed with input event warns', () => {
+    const page = setup();
+    const name = page.field('name', {type: 'text', value: 'a', defaultValue: 'a'});
+    name.value = 'b';
+    page.document.dispatch('input', {target: name});
+    assert.strictEqual(page.unload(), true);
+
+    name.value = 'a';
+    page.document.dispatch('input', {target: name});
+    assert.strictEqual(page.unload(), false);
+});
+
+test('value set by script without event warns', () => {
+    // Like DateTimeShortcuts calendar, "Today" link or raw id lookup
+    const page = setup();
+    page.field('name', {type: 'text', value: 'a', defaultValue: 'a'});
+    const date = page.field('date', {type: 'text', value: '', defaultValue: '',
+        className: 'vDateField'});
+    const author = page.field('author', {type: 'text', value: '', defaultValue: '',
+        className: 'vForeignKeyRawIdAdminField'});
+    date.value = '2024-01-31';
+    assert.strictEqual(page.unload(), true);
+
+    date.value = '';
+    author.value = '3';
+    assert.strictEqual(page.unload(), true);
+});
+
+test('leaving unchanged form does not read select options', () => {
+    const page = setup();
+    let reads = 0;
+    const options = [];
+    for (let i = 0; i < 1000; i++) {
+        options.push({
+            get selected() {
+                reads++;
+                return i == 0;
+            },
+            get defaultSelected() {
+                reads++;
+                return i == 0;
+            },
+        });
+    }
+    page.field('country', {type: 'select-one', tagName: 'SELECT',
+        options: options});
+    page.field('date', {type: 'text', value: '', defaultValue: '',
+        className: 'vDateField'});
+    assert.strictEqual(page.unload(), false);
+    assert.strictEqual(reads, 0);
+});
+
+test('value set by script is counted on focusout', () => {
+    const page = setup();
+    const date = page.field('date', {type: 'text', value: '', defaultValue: '',
+        className: 'vDateField'});
+    date.value = '2024-01-31';
+    page.document.dispatch('focusout', {target: date});
+    // Counted field is not compared again on leaving
+    page.form.elements = [];
+    assert.strictEqual(page.unload(), true);
+});
+
+test('submitted form does not warn', () => {
+    const page = setup();
+    const name = page.field('name', {type: 'text', value: 'a', defaultValue: 'a'});
+    name.value = 'b';
+    page.document.dispatch('submit', {target: page.form});
+    assert.strictEqual(page.unload(), false);
+});
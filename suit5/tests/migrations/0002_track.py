@@ -0,0 +1,24 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tests', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Track',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64)),
+                ('order', models.PositiveIntegerField()),
+                ('album', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='Album')),
+            ],
+            options={
+                'ordering': ('order',),
+            },
+        ),
+    ]
@@ -2,7 +2,9 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.management import CommandError
 from django.core.management import call_command
+from django.db import connections, DEFAULT_DB_ALIAS
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from random import randint
 
 # Django 1.7 compatiblity
@@ -76,3 +78,48 @@ class ModelsTestCaseMixin(TestCase):
         settings.INSTALLED_APPS = self.saved_INSTALLED_APPS
         settings.DEBUG = self.saved_DEBUG
         super(ModelsTestCaseMixin, self)._post_teardown()
+
+
+class _AssertMaxQueriesContext(CaptureQueriesContext):
+    def __init__(self, test_case, budget, connection):
+        self.test_case = test_case
+        self.budget = budget
+        super(_AssertMaxQueriesContext, self).__init__(connection)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super(_AssertMaxQueriesContext, self).__exit__(exc_type, exc_value,
+                                                       traceback)
+        if exc_type is not None:
+            return
+        executed = len(self)
+        if executed > self.budget:
+            self.test_case.fail('%d queries executed, budget is %d\n%s' % (
+                executed, self.budget,
+                '\n'.join('%d. %s' % (i, query['sql']) for i, query in
+                          enumerate(self.captured_queries, start=1))))
+
+
+class QueryBudgetTestCaseMixin(object):
+    """
+    Query budgets of admin pages and template tags. Budgets are upper
+    limits, so N+1 queries fail tests, while saved queries do not
+    """
+    query_budgets = {}
+
+    def assertMaxQueries(self, budget, func=None, *args, **kwargs):
+        """
+        Like assertNumQueries, but allows fewer queries than budget
+        """
+        using = kwargs.pop('using', DEFAULT_DB_ALIAS)
+        context = _AssertMaxQueriesContext(self, budget, connections[using])
+        if func is None:
+            return context
+        with context:
+            return func(*args, **kwargs)
+
+    def assertQueryBudget(self, name, func=None, *args, **kwargs):
+        """
+        Check func against budget from query_budgets by name
+        """
+        return self.assertMaxQueries(self.query_budgets[name], func,
+                                     *args, **kwargs)
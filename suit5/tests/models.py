@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib import admin
+from suit5.admin import SortableTabularInline
 
 
 def test_app_label():
@@ -30,6 +31,18 @@ class Album(models.Model):
         return self.name
 
 
+class Track(models.Model):
+    album = models.ForeignKey(Album, on_delete=models.CASCADE)
+    name = models.CharField(max_length=64)
+    order = models.PositiveIntegerField()
+
+    def __unicode__(self):
+        return self.name
+
+    class Meta:
+        ordering = ('order',)
+
+
 class BookAdmin(admin.ModelAdmin):
     list_filter = ('id', 'name',)
     list_display = ('id', 'name',)
@@ -44,7 +57,14 @@ class BookAdmin(admin.ModelAdmin):
                 'data': obj.pk}
 
 
+class TrackInline(SortableTabularInline):
+    model = Track
+    extra = 1
+
+
 class AlbumAdmin(admin.ModelAdmin):
+    inlines = (TrackInline,)
+
     def suit_row_attributes(self, obj):
         """No request defined to test backward-compatibility"""
         return {'class': 'suit_row_album_attr_class-%s' % obj.name,
@@ -0,0 +1,84 @@
+from django.conf import settings
+from suit5.templatetags.suit_menu import get_menu
+from suit5.tests.mixins import UserTestCaseMixin, ModelsTestCaseMixin, \
+    QueryBudgetTestCaseMixin
+from suit5.tests.models import Album, Book, Track, test_app_label
+
+try:
+    from django.core.urlresolvers import reverse
+except ImportError:
+    # For Django >= 2.0
+    from django.urls import reverse
+
+app_label = test_app_label()
+
+
+class QueryBudgetTestCase(QueryBudgetTestCaseMixin, UserTestCaseMixin,
+                          ModelsTestCaseMixin):
+    """
+    Baseline query budgets of Suit admin pages. Budgets include session and
+    user queries of logged in superuser. Pages are checked with few and
+    many rows, so queries per row fail
+    """
+    query_budgets = {
+        # Session, user, recent actions
+        'index': 3,
+        # Two counts, rows and distinct values of two list filters
+        'changelist': 7,
+        # Savepoints of atomic view, object, inline rows, content type
+        'change_form': 7,
+        # Menu is built from app_list of context
+        'menu': 0,
+    }
+
+    def setUp(self):
+        self.login_superuser()
+        self.saved_SUIT_CONFIG = getattr(settings, 'SUIT_CONFIG', {})
+
+    def tearDown(self):
+        settings.SUIT_CONFIG = self.saved_SUIT_CONFIG
+
+    def get_page(self, url):
+        self.get_response(url)
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_index(self):
+        with self.assertQueryBudget('index'):
+            self.get_page(reverse('admin:index'))
+
+    def test_changelist_with_filters_and_attributes(self):
+        url = reverse('admin:%s_book_changelist' % app_label)
+        for count in (5, 50):
+            Book.objects.bulk_create([Book(name='Book %d' % i)
+                                      for i in range(count)])
+            with self.assertQueryBudget('changelist'):
+                self.get_page(url)
+            self.assertContains(self.response, 'suit_row_attr_class-')
+            self.assertContains(self.response, 'suit_cell_attr_class-')
+
+    def test_change_form_with_sortable_inlines(self):
+        album = Album.objects.create(name='Album')
+        url = reverse('admin:%s_album_change' % app_label, args=(album.pk,))
+        for count in (2, 20):
+            Track.objects.bulk_create([
+                Track(album=album, name='Track %d' % i, order=i)
+                for i in range(count)])
+            with self.assertQueryBudget('change_form'):
+                self.get_page(url)
+            self.assertContains(self.response, 'suit-sortable')
+
+    def test_menu(self):
+        self.get_page(reverse('admin:index'))
+        context = self.response.context[-1]
+        request = self.response._request
+        with self.assertQueryBudget('menu'):
+            get_menu(context, request)
+
+        settings.SUIT_CONFIG = {'MENU': [
+            app_label,
+            {'app': 'auth', 'models': ('user', 'group')},
+            {'label': 'Books', 'url': '%s.book' % app_label,
+             'models': ('%s.book' % app_label, '%s.album' % app_label)},
+        ]}
+        with self.assertQueryBudget('menu'):
+            get_menu(context, request)
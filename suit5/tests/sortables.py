@@ -0,0 +1,93 @@
+import copy
+from django.test import TestCase
+from suit5.admin import SortableModelAdminBase, SortableTabularInline, \
+    SortableStackedInline, SortableStackedInlineBase, SortableListForm, \
+    sortable_fieldsets
+
+
+class SortablesTestCase(TestCase):
+    def test_sortable_widget_prototype_is_cached_per_class(self):
+        widget = SortableTabularInline.get_sortable_widget()
+        self.assertIs(widget, SortableTabularInline.get_sortable_widget())
+        self.assertIsNot(widget, SortableStackedInline.get_sortable_widget())
+
+    def test_sortable_widget_prototype_is_not_inherited(self):
+        class CustomInline(SortableStackedInline):
+            sortable_widget_attrs = {'class': 'custom'}
+
+        widget = CustomInline.get_sortable_widget()
+        self.assertEqual(widget.attrs['class'], 'custom')
+        self.assertNotEqual(
+            SortableStackedInline.get_sortable_widget().attrs['class'],
+            'custom')
+
+    def test_sortable_widget_attrs(self):
+        self.assertEqual(
+            SortableListForm.Meta.widgets['order'].attrs['class'],
+            'hide input-mini suit-sortable')
+        attrs = SortableStackedInline.get_sortable_widget().attrs
+        self.assertEqual(
+            attrs['class'],
+            'hide input-mini suit-sortable suit-sortable-stacked')
+        self.assertEqual(attrs['rowclass'], ' suit-sortable-stacked-row')
+
+    def test_sortable_widget_prototype_is_immutable(self):
+        widget = SortableModelAdminBase.get_sortable_widget()
+        with self.assertRaises(TypeError):
+            widget.attrs['class'] = 'changed'
+
+    def test_sortable_widget_copy(self):
+        widget = SortableStackedInline.get_sortable_widget()
+        widget_copy = copy.deepcopy(widget)
+        widget_copy.attrs['min'] = 0
+        self.assertEqual(widget_copy.attrs['class'], widget.attrs['class'])
+        self.assertNotIn('min', widget.attrs)
+
+
+class FieldsetsMock(object):
+    fieldsets = None
+
+    def __init__(self, fields=None):
+        self.fields = fields
+
+    def get_fieldsets(self, request, obj=None):
+        return self.fieldsets or [(None, {'fields': list(self.fields)})]
+
+
+class SortableStackedMock(SortableStackedInlineBase, FieldsetsMock):
+    fieldsets = (
+        (None, {'fields': ('name', 'order')}),
+        ('Other', {'fields': ['order', 'code'], 'classes': ('collapse',)}),
+    )
+
+
+class SortableFieldsetsTestCase(TestCase):
+    def test_sortable_fieldsets(self):
+        fieldsets = sortable_fieldsets(SortableStackedMock.fieldsets, 'order')
+        self.assertEqual(fieldsets[0][1]['fields'], ('order', 'name'))
+        self.assertEqual(fieldsets[1][1]['fields'], ('code',))
+        self.assertEqual(fieldsets[1][1]['classes'], ('collapse',))
+
+    def test_sortable_fieldsets_does_not_modify_declared(self):
+        fields = ['order', 'code']
+        fieldsets = [(None, {'fields': fields})]
+        sortable_fieldsets(fieldsets, 'order')
+        sortable_fieldsets(fieldsets, 'order')
+        self.assertEqual(fields, ['order', 'code'])
+
+    def test_declared_fieldsets_are_cached(self):
+        inline = SortableStackedMock()
+        fieldsets = inline.get_fieldsets(None)
+        self.assertIs(fieldsets, inline.get_fieldsets(None))
+        self.assertIs(fieldsets, SortableStackedMock().get_fieldsets(None))
+        with self.assertRaises(TypeError):
+            fieldsets[0][1]['fields'] = ()
+
+    def test_fieldsets_from_fields(self):
+        class SortableFieldsMock(SortableStackedInlineBase, FieldsetsMock):
+            pass
+
+        inline = SortableFieldsMock(fields=('name', 'order'))
+        fieldsets = inline.get_fieldsets(None)
+        self.assertEqual(fieldsets[0][1]['fields'], ('order', 'name'))
+        self.assertIsNot(fieldsets, inline.get_fieldsets(None))
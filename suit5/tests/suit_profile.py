@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from suit5.management.commands.suit_profile import categorize, \
+    profile_stacks, summarize, url_slug
+from suit5.tests.mixins import UserTestCaseMixin
+
+try:
+    from django.core.urlresolvers import reverse
+except ImportError:
+    # For Django >= 2.0
+    from django.urls import reverse
+
+
+class SuitProfileTestCase(UserTestCaseMixin):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.superuser = self.create_superuser()
+        self.url = reverse('admin:auth_user_changelist')
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def profile(self, *args):
+        stdout = StringIO()
+        call_command('suit_profile', self.url, '--repeat', '2',
+                     '--output-dir', self.output_dir, *args,
+                     stdout=stdout, stderr=StringIO())
+        with open(os.path.join(self.output_dir, 'summary.json')) as f:
+            return stdout.getvalue(), json.load(f)
+
+    def read_collapsed(self):
+        path = os.path.join(self.output_dir, url_slug(self.url) + '.collapsed')
+        with open(path) as f:
+            return f.read().splitlines()
+
+    def test_cprofile(self):
+        output, summary = self.profile()
+        self.assertEqual(summary['mode'], 'cprofile')
+        result = summary['urls'][self.url]
+        self.assertEqual(result['status'], 200)
+        self.assertGreater(result['categories']['suit_menu']['inclusive'], 0)
+        self.assertGreater(result['categories']['django templates']['self'],
+                           0)
+        self.assertIn('suit_menu', output)
+        self.assertTrue(os.path.exists(os.path.join(
+            self.output_dir, url_slug(self.url) + '.prof')))
+        lines = self.read_collapsed()
+        self.assertTrue(any('suit5/templatetags/suit_menu.py' in line and
+                            '(get_menu)' in line for line in lines))
+        for line in lines:
+            stack, weight = line.rsplit(' ', 1)
+            self.assertGreater(int(weight), 0)
+
+    def test_sample(self):
+        output, summary = self.profile('--sample', '0.5')
+        self.assertEqual(summary['mode'], 'sample')
+        self.assertGreater(summary['urls'][self.url]['total'], 0)
+        self.assertTrue(self.read_collapsed())
+
+    def test_unknown_user(self):
+        with self.assertRaises(CommandError):
+            self.profile('--username', 'nobody')
+
+    def test_invalid_options(self):
+        for args in (('--repeat', '0'), ('--sample', '0')):
+            with self.assertRaises(CommandError):
+                self.profile(*args)
+
+    def test_categorize(self):
+        self.assertEqual(categorize('/lib/suit5/templatetags/suit_list.py'),
+                         'suit_list')
+        self.assertEqual(categorize('/lib/suit5/admin.py'), 'suit (other)')
+        self.assertEqual(categorize('/lib/django/template/base.py'),
+                         'django templates')
+        self.assertEqual(categorize('/lib/json/decoder.py'), 'other')
+
+    def test_profile_stacks(self):
+        root = ('/lib/django/views.py', 1, 'view')
+        menu = ('/lib/suit5/templatetags/suit_menu.py', 1, 'get_menu')
+        render = ('/lib/django/template/base.py', 1, 'render')
+        stats = {
+            root: (1, 1, 0.001, 0.010, {}),
+            menu: (1, 1, 0.002, 0.004, {root: (1, 1, 0.002, 0.004)}),
+            render: (2, 2, 0.005, 0.005, {root: (1, 1, 0.003, 0.003),
+                                          menu: (1, 1, 0.002, 0.002)}),
+        }
+        stacks = profile_stacks(stats)
+        self.assertAlmostEqual(stacks[(root,)], 1)
+        self.assertAlmostEqual(stacks[(root, menu)], 2)
+        self.assertAlmostEqual(stacks[(root, render)], 3)
+        self.assertAlmostEqual(stacks[(root, menu, render)], 2)
+
+        summary = summarize(stacks)
+        self.assertAlmostEqual(summary['suit_menu']['self'], 2)
+        self.assertAlmostEqual(summary['suit_menu']['inclusive'], 4)
+        self.assertAlmostEqual(summary['django templates']['self'], 5)
@@ -0,0 +1,44 @@
+from django.templatetags.static import static
+from suit5.tests.mixins import UserTestCaseMixin
+
+
+class BaseTemplateTestCase(UserTestCaseMixin):
+    def setUp(self):
+        self.login_superuser()
+
+    def test_scripts_are_not_deferred_by_default(self):
+        self.get_response()
+        self.assertContains(self.response, '<script src="%s"></script>' %
+                            static('suit5/js/jquery-3.7.1.min.js'))
+        self.assertNotContains(self.response, 'suit-namespace.js')
+        self.assertContains(self.response,
+                            '$: window.jQuery ? jQuery.noConflict() : null')
+        self.assertNotContains(self.response, 'rel="preload"')
+
+    def test_performance_mode(self):
+        with self.settings(SUIT_CONFIG={'PERFORMANCE_MODE': True}):
+            self.get_response()
+        self.assertContains(self.response, '<script defer src="%s"></script>' %
+                            static('suit5/js/jquery-3.7.1.min.js'))
+        self.assertContains(self.response, '<script defer src="%s"></script>' %
+                            static('suit5/js/suit-namespace.js'))
+        self.assertContains(self.response, '<script defer src="%s"></script>' %
+                            static('suit5/js/suit.js'))
+        self.assertContains(self.response, 'Suit.queue.push(fn)')
+        self.assertContains(self.response, 'media="print" onload="this.media=\'all\'"')
+        self.assertContains(self.response, '<link rel="preload" href="%s' %
+                            static('suit5/icons/fonts/bootstrap-icons.woff2'))
+        self.assertTemplateUsed(self.response, 'suit5/critical_css.html')
+        self.assertContains(self.response, '<style type="text/css">:root{')
+        self.assertContains(self.response, 'url("%s")' %
+                            static('suit5/img/bg_left_white.gif'))
+
+    def test_vendor_subset(self):
+        with self.settings(SUIT_CONFIG={'VENDOR_SUBSET': True}):
+            self.get_response()
+        self.assertContains(self.response,
+                            static('suit5/bootstrap5/css/bootstrap.purged.min.css'))
+        self.assertContains(self.response,
+                            static('suit5/icons/bootstrap-icons.subset.css'))
+        self.assertNotContains(self.response,
+                               static('suit5/icons/bootstrap-icons.min.css'))
@@ -1,7 +1,10 @@
 from django.contrib import admin
+from django.test import TestCase, RequestFactory, override_settings
 from django.utils.translation import ugettext
+from suit5.admin import LazyFormTabsMixin, suit_tab_names
 from suit5.tests.mixins import ModelsTestCaseMixin, UserTestCaseMixin
-from suit5.tests.models import Book, BookAdmin, test_app_label
+from suit5.tests.models import Album, Book, BookAdmin, Track, \
+    test_app_label
 
 try:
     from django.core.urlresolvers import reverse
@@ -47,3 +50,152 @@ class FormTabsTestCase(ModelsTestCaseMixin, UserTestCaseMixin):
         self.assertTemplateUsed(self.response, suit_form_include)
         self.assertContains(self.response,
                             '<div class="suit-include suit-tab suit-tab-tab1">')
+
+
+class InlineMock(object):
+    def __init__(self, suit_classes=None):
+        self.suit_classes = suit_classes
+
+
+class ModelAdminMock(object):
+    fieldsets = (
+        (None, {'fields': ['name'], 'classes': ('suit-tab', 'suit-tab-general')}),
+        ('Cities', {'fields': ['city'], 'classes': ('suit-tab', 'suit-tab-cities')}),
+        ('Notes', {'fields': ['notes']}),
+    )
+    inlines = (InlineMock('suit-tab suit-tab-cities'), InlineMock())
+
+    def get_fieldsets(self, request, obj=None):
+        return self.fieldsets
+
+    def get_inline_instances(self, request, obj=None):
+        return list(self.inlines)
+
+
+class LazyTabsAdminMock(LazyFormTabsMixin, ModelAdminMock):
+    suit_form_tabs = (('general', 'General'), ('cities', 'Cities'))
+    suit_form_lazy_tabs = ('general', 'cities')
+
+
+class LazyFormTabsTestCase(TestCase):
+    def setUp(self):
+        self.model_admin = LazyTabsAdminMock()
+        self.factory = RequestFactory()
+        self.obj = object()
+
+    def fieldset_names(self, request, obj=None):
+        return [name for name, options in
+                self.model_admin.get_fieldsets(request, obj)]
+
+    def fragment(self, request):
+        return self.model_admin.get_suit_tab_fragment(request, self.obj)
+
+    def inline_instances(self, request):
+        return self.model_admin.get_inline_instances(request, self.obj)
+
+    def test_suit_tab_names(self):
+        self.assertEqual(suit_tab_names('suit-tab suit-tab-cities'),
+                         set(['cities']))
+        self.assertEqual(suit_tab_names(('suit-tab', 'suit-tab-a',
+                                         'suit-tab-b')), set(['a', 'b']))
+        self.assertEqual(suit_tab_names(None), set())
+
+    def test_first_tab_is_not_lazy(self):
+        self.assertEqual(self.model_admin.get_suit_lazy_tabs(self.obj),
+                         ['cities'])
+
+    def test_add_form_is_not_lazy(self):
+        self.assertEqual(self.model_admin.get_suit_lazy_tabs(), [])
+        request = self.factory.get('/', {'_suit_tab': 'cities'})
+        self.assertIsNone(self.model_admin.get_suit_tab_fragment(request))
+        self.assertEqual(self.fieldset_names(request),
+                         [None, 'Cities', 'Notes'])
+        self.assertEqual(len(self.model_admin.get_inline_instances(request)),
+                         2)
+
+    def test_lazy_tab_is_not_rendered(self):
+        request = self.factory.get('/')
+        self.assertEqual(self.fieldset_names(request, self.obj),
+                         [None, 'Notes'])
+        self.assertEqual(self.inline_instances(request),
+                         [ModelAdminMock.inlines[1]])
+        self.assertIsNone(self.fragment(request))
+
+    def test_lazy_tab_fragment(self):
+        request = self.factory.get('/', {'_suit_tab': 'cities'})
+        self.assertEqual(self.fragment(request), 'cities')
+        self.assertEqual(self.fieldset_names(request, self.obj), ['Cities'])
+        self.assertEqual(self.inline_instances(request),
+                         [ModelAdminMock.inlines[0]])
+
+    def test_loaded_lazy_tab_is_saved(self):
+        request = self.factory.post('/', {'_suit_tab': 'cities'})
+        self.assertIsNone(self.fragment(request))
+        self.assertEqual(self.fieldset_names(request, self.obj),
+                         [None, 'Cities', 'Notes'])
+        self.assertEqual(len(self.inline_instances(request)), 2)
+
+    def test_unknown_tab_is_ignored(self):
+        request = self.factory.get('/', {'_suit_tab': 'general'})
+        self.assertIsNone(self.fragment(request))
+        self.assertEqual(self.fieldset_names(request, self.obj),
+                         [None, 'Notes'])
+
+
+@override_settings(ROOT_URLCONF='suit5.tests.urls.lazy_tabs')
+class LazyFormTabsViewTestCase(UserTestCaseMixin):
+    def setUp(self):
+        self.login_superuser()
+        album = Album.objects.create(name='Album')
+        self.track = Track.objects.create(album=album, name='Intro', order=1)
+        self.url = reverse('lazy_tabs:%s_track_change' % app_label,
+                           args=[self.track.pk])
+
+    def test_lazy_tab_is_not_rendered(self):
+        self.get_response(self.url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertContains(self.response, 'name="order"')
+        self.assertNotContains(self.response, 'name="name"')
+        # Prepopulated field of lazy tab is not in the form
+        self.assertEqual(
+            self.response.context['adminform'].prepopulated_fields, [])
+
+    def test_lazy_tab_fragment(self):
+        self.response = self.client.get(self.url, {'_suit_tab': 'details'})
+        self.assertEqual(self.response.status_code, 200)
+        self.assertTemplateUsed(self.response, 'suit5/change_form_tab.html')
+        self.assertNotContains(self.response, '<html')
+        self.assertContains(self.response, 'name="name"')
+        self.assertContains(self.response,
+                            'name="_suit_tab" value="details"')
+        self.assertNotContains(self.response, 'name="order"')
+
+    def test_unloaded_tab_is_not_saved(self):
+        self.response = self.client.post(self.url, {
+            'album': self.track.album_id, 'order': 2})
+        self.assertEqual(self.response.status_code, 302)
+        track = Track.objects.get(pk=self.track.pk)
+        self.assertEqual(track.order, 2)
+        self.assertEqual(track.name, 'Intro')
+
+    def test_loaded_tab_is_saved(self):
+        self.response = self.client.post(self.url, {
+            'album': self.track.album_id, 'order': 2, 'name': 'Outro',
+            '_suit_tab': 'details'})
+        self.assertEqual(self.response.status_code, 302)
+        self.assertEqual(Track.objects.get(pk=self.track.pk).name, 'Outro')
+
+    def test_add_form_renders_all_tabs(self):
+        self.get_response(reverse('lazy_tabs:%s_track_add' % app_label))
+        self.assertEqual(self.response.status_code, 200)
+        self.assertContains(self.response, 'name="order"')
+        self.assertContains(self.response, 'name="name"')
+
+    def test_add_form_validates_lazy_tab(self):
+        self.response = self.client.post(
+            reverse('lazy_tabs:%s_track_add' % app_label),
+            {'album': self.track.album_id, 'order': 2})
+        self.assertEqual(self.response.status_code, 200)
+        self.assertFormError(self.response, 'adminform', 'name',
+                             'This field is required.')
+        self.assertEqual(Track.objects.count(), 1)
@@ -2,9 +2,9 @@ from django.contrib.admin import ModelAdmin
 from django.contrib.admin.templatetags.admin_list import result_list
 from suit5.templatetags.suit_list import paginator_number, paginator_info, \
     pagination, suit_list_filter_select, headers_handler, dict_to_attrs, \
-    result_row_attrs, cells_handler
+    result_row_attrs, cells_handler, takes_request
 from suit5.tests.mixins import UserTestCaseMixin, ModelsTestCaseMixin
-from suit5.tests.models import Album, Book, test_app_label
+from suit5.tests.models import Album, Book, BookAdmin, test_app_label
 
 try:
     from django.core.urlresolvers import reverse
@@ -107,6 +107,14 @@ class SuitListTestCase(UserTestCaseMixin, ModelsTestCaseMixin):
         self.assertTrue('data="2"' in result)
         self.assertTrue('class="row2 sky"' in result)
 
+    def test_suit_list_result_row_attrs_inspects_once(self):
+        takes_request.cache_clear()
+        self.assertFalse(takes_request(ModelAdminMock.suit_row_attributes))
+        self.assertTrue(takes_request(BookAdmin.suit_row_attributes))
+        result_row_attrs({'request': 'dummy'}, ChangeListMock(), 1)
+        result_row_attrs({'request': 'dummy'}, ChangeListMock(), 2)
+        self.assertEqual(takes_request.cache_info().hits, 2)
+
     def test_suit_list_result_row_attrs_by_response(self):
         Book.objects.all().delete()
         for x in range(2):
@@ -172,3 +180,9 @@ class SuitListTestCase(UserTestCaseMixin, ModelsTestCaseMixin):
         self.assertTrue(
             'class="suit_cell_attr_class-name-sky-1' in result_cells[0][-1])
         self.assertTrue(' data="1"' in result_cells[0][-1])
+
+    def test_suit_list_virtual_rows(self):
+        self.assertContains(self.response, 'data-suit-virtual-rows="300"')
+        with self.settings(SUIT_CONFIG={'LIST_VIRTUAL_ROWS': 0}):
+            self.get_changelist()
+        self.assertNotContains(self.response, 'data-suit-virtual-rows')
@@ -4,7 +4,10 @@ from django.test import TestCase
 from django.utils.encoding import python_2_unicode_compatible
 from suit5 import utils
 from suit5.templatetags.suit_tags import suit_conf, suit_date, suit_time, \
-    admin_url, field_contents_foreign_linked, suit_bc, suit_bc_value
+    admin_url, field_contents_foreign_linked, suit_bundle_url, \
+    get_bundles_manifest, rebase_css_urls, VersionValueNode
+from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template, TemplateSyntaxError
 from django.db import models
 from django.contrib import admin
 from django.contrib.admin.helpers import AdminReadonlyField
@@ -93,10 +96,54 @@ class SuitTagsTestCase(TestCase):
         ro_field.model_admin.linked_readonly_fields = ('country',)
         assert admin_url(country) in field_contents_foreign_linked(ro_field)
 
+    def render(self, template, **context):
+        return Template('{% load suit_tags %}' + template).render(
+            Context(context))
+
     def test_suit_bc(self):
-        args = [utils.django_major_version(), 'a']
-        self.assertEqual(utils.value_by_version(args), suit_bc(*args))
+        version = utils.DJANGO_MAJOR_VERSION_STRING
+        self.assertEqual(self.render(
+            "{%% suit_bc 0.1 'old' %s 'current' 0.2 'last' %%}" % version),
+            'current')
+        self.assertEqual(self.render(
+            "{%% suit_bc 0.1 'old' '%s' x 0.2 'last' %%}" % version,
+            x='<b>'), '&lt;b&gt;')
+        self.assertEqual(self.render("{% suit_bc 0.1 'old' 0.2 'last' %}"),
+                         'last')
 
     def test_suit_bc_value(self):
-        args = [utils.django_major_version(), 'a']
-        self.assertEqual(utils.value_by_version(args), suit_bc_value(*args))
+        version = utils.DJANGO_MAJOR_VERSION_STRING
+        self.assertEqual(self.render(
+            "{%% suit_bc_value 0.1 'old' %s 'current' as var %%}[{{ var }}]"
+            % version), '[current]')
+
+    def test_suit_bc_resolved_on_parse(self):
+        template = Template("{% load suit_tags %}"
+                            "{% suit_bc 0.1 'old' 0.2 'last' %}")
+        node = template.nodelist.get_nodes_by_type(VersionValueNode)[0]
+        self.assertTrue(node.constant)
+        self.assertEqual(node.value, 'last')
+
+    def test_suit_bc_syntax_error(self):
+        with self.assertRaises(TemplateSyntaxError):
+            self.render("{% suit_bc 0.1 %}")
+        with self.assertRaises(TemplateSyntaxError):
+            self.render("{% suit_bc as var %}")
+
+    def test_suit_bundle_url(self):
+        manifest = get_bundles_manifest()
+        for name in ('suit.css', 'suit.js'):
+            url = suit_bundle_url(name)
+            self.assertTrue(url.endswith('suit5/dist/%s' % manifest[name]))
+
+    def test_suit_bundle_url_unknown(self):
+        self.assertRaises(ImproperlyConfigured, suit_bundle_url, 'x.css')
+
+    def test_rebase_css_urls(self):
+        css = ('a{background:url(../img/a.gif)}b{background:url("b.png")}'
+               'i{background:url(data:image/gif;base64,R0)}')
+        self.assertEqual(
+            rebase_css_urls(css, 'suit5/css/critical.css'),
+            'a{background:url("/static/suit5/img/a.gif")}'
+            'b{background:url("/static/suit5/css/b.png")}'
+            'i{background:url(data:image/gif;base64,R0)}')
@@ -0,0 +1,24 @@
+from django.contrib import admin
+from django.urls import re_path
+from suit5.admin import LazyFormTabsMixin
+from suit5.tests.models import Track
+
+
+class LazyTabsTrackAdmin(LazyFormTabsMixin, admin.ModelAdmin):
+    fieldsets = (
+        (None, {'fields': ['album', 'order'],
+                'classes': ('suit-tab', 'suit-tab-general')}),
+        ('Details', {'fields': ['name'],
+                     'classes': ('suit-tab', 'suit-tab-details')}),
+    )
+    prepopulated_fields = {'name': ('order',)}
+    suit_form_tabs = (('general', 'General'), ('details', 'Details'))
+    suit_form_lazy_tabs = ('details',)
+
+
+site = admin.AdminSite(name='lazy_tabs')
+site.register(Track, LazyTabsTrackAdmin)
+
+urlpatterns = [
+    re_path(r'^admin/', site.urls),
+]
@@ -18,5 +18,11 @@ class UtilsTestCase(TestCase):
         args = [utils.django_major_version(), 'a']
         self.assertEqual(utils.value_by_version(args), 'a')
 
+    def test_value_by_version_string(self):
+        args = [utils.DJANGO_MAJOR_VERSION_STRING, 'a', '0.1', 'b']
+        self.assertEqual(utils.value_by_version(args), 'a')
+        self.assertEqual(utils.value_by_version(['0.1', 'b', '0.2', 'c']),
+                         'c')
+
     def test_str_to_version(self):
         return self.assertEqual(str_to_version('1.10.2'), (1, 10, 2))
@@ -3,7 +3,7 @@ from suit5.widgets import LinkedSelect, HTML5Input, EnclosedInput, \
     NumberInput, SuitDateWidget, SuitTimeWidget, SuitSplitDateTimeWidget, \
     AutosizedTextarea
 from django.utils.translation import ugettext as _
-from django.contrib.admin.templatetags.admin_static import static
+from django.templatetags.static import static
 from suit5 import utils
 
 django_version = utils.django_major_version()
@@ -55,6 +55,13 @@ class WidgetsTestCase(TestCase):
         result = ('<em>p</em>', '<em>a</em>')
         self.assertHTMLEqual(output, self.get_enclosed_widget_html(result))
 
+    def test_EnclosedInput_render_keeps_widget_state(self):
+        inp = EnclosedInput(prepend='p', append='icon-leaf')
+        output = self.render_enclosed_widget(inp)
+        self.assertEqual(output, self.render_enclosed_widget(inp))
+        self.assertEqual(inp.prepend, 'p')
+        self.assertEqual(inp.append, 'icon-leaf')
+
     def test_SuitDateWidget(self):
         sdw = SuitDateWidget()
         self.assertTrue('vDateField' in sdw.attrs['class'])
@@ -124,15 +131,14 @@ class WidgetsTestCase(TestCase):
             output)
 
     def get_SuitSplitDateTimeWidget_output(self):
+        dwo = self.get_SuitDateWidget_output().replace('sdw', 'sdw_0')
+        two = self.get_SuitTimeWidget_output().replace('sdw', 'sdw_1')
         if django_version < (1, 11):
-            dwo = self.get_SuitDateWidget_output().replace('sdw', 'sdw_0')
-            two = self.get_SuitTimeWidget_output().replace('sdw', 'sdw_1')
             return '<div class="datetime">%s %s</div>' % (dwo, two)
         else:
-            return '<div class="datetime"><input type="text" name="sdw_0" ' \
-                   'class="vDateField input-small " size="10" placeholder="Date" ' \
-                   '/><input type="text" name="sdw_1" class="vTimeField input-small " ' \
-                   'size="8" placeholder="Time" /></div>'
+            # Subwidgets of empty value are rendered without value attribute
+            return '<div class="datetime">%s%s</div>' % (
+                dwo.replace(' value=""', ''), two.replace(' value=""', ''))
 
     def test_SuitSplitDateTimeWidget(self):
         ssdtw = SuitSplitDateTimeWidget()
@@ -141,6 +147,19 @@ class WidgetsTestCase(TestCase):
             self.get_SuitSplitDateTimeWidget_output(),
             output)
 
+    def test_date_widgets_django_picker_media(self):
+        with self.settings(SUIT_CONFIG={'DATE_PICKER': 'django'}):
+            media = str(SuitSplitDateTimeWidget().media)
+        self.assertTrue('DateTimeShortcuts.js' in media)
+        self.assertFalse('suit-datepicker.js' in media)
+
+    def test_date_widgets_suit_picker_media(self):
+        with self.settings(SUIT_CONFIG={'DATE_PICKER': 'suit'}):
+            for widget in (SuitDateWidget(), SuitTimeWidget(),
+                           SuitSplitDateTimeWidget()):
+                self.assertEqual(widget.media._js,
+                                 ['suit5/js/suit-datepicker.js'])
+
     def test_AutosizedTextarea(self):
         txt = AutosizedTextarea()
         self.assertTrue('autosize' in txt.attrs['class'])
@@ -156,12 +175,14 @@ class WidgetsTestCase(TestCase):
         txt = AutosizedTextarea()
         self.assertHTMLEqual(txt.render('txt', ''), (
             '<textarea class="autosize " cols="40" name="txt" '
-            'rows="2">\r\n</textarea><script type="text/javascript">Suit.$('
-            '\'#id_txt\').autosize();</script>'))
+            'rows="2">\r\n</textarea>'))
 
     def test_AutosizedTextarea_media(self):
         txt = AutosizedTextarea()
-        js_url = static('suit/js/jquery.autosize-min.js')
+        js_url = static('suit5/js/jquery.autosize-min.js')
         self.assertHTMLEqual(str(txt.media),
                              '<script type="text/javascript" src="%s"></script>'
                              % js_url)
+
+    def test_AutosizedTextarea_media_is_shared(self):
+        self.assertIs(AutosizedTextarea().media, AutosizedTextarea().media)
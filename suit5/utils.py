@@ -1,8 +1,12 @@
 from django import VERSION
 
+# Resolved once, version dependent template tags use them on every render
+DJANGO_MAJOR_VERSION = VERSION[:2]
+DJANGO_MAJOR_VERSION_STRING = '.'.join(str(v) for v in DJANGO_MAJOR_VERSION)
+
 
 def django_major_version():
-    return VERSION[:2]
+    return DJANGO_MAJOR_VERSION
 
 
 def value_by_version(args):
@@ -11,8 +15,7 @@ def value_by_version(args):
     Return latest value if version not found
     """
     version_map = args_to_dict(args)
-    major_version = '.'.join(str(v) for v in django_major_version())
-    return version_map.get(major_version,
+    return version_map.get(DJANGO_MAJOR_VERSION_STRING,
                            list(version_map.values())[-1])
 
 
@@ -3,11 +3,8 @@ from django.forms import TextInput, Select, Textarea
 from django.utils.safestring import mark_safe
 from django import forms
 from django.utils.translation import ugettext as _
-from django.contrib.admin.templatetags.admin_static import static
 
-from suit5 import utils
-
-django_version = utils.django_major_version()
+from suit5.config import get_config
 
 
 class NumberInput(TextInput):
@@ -44,6 +41,7 @@ class EnclosedInput(TextInput):
     """
     Widget for bootstrap appended/prepended inputs
     """
+    template_name = 'suit5/widgets/enclosed_input.html'
 
     def __init__(self, attrs=None, prepend=None, append=None):
         """
@@ -53,6 +51,17 @@ class EnclosedInput(TextInput):
         self.append = append
         super(EnclosedInput, self).__init__(attrs=attrs)
 
+        # Add-on html doesn't depend on value, build it once
+        div_classes = []
+        self.prepend_html = self.append_html = ''
+        if prepend:
+            div_classes.append('input-prepend')
+            self.prepend_html = mark_safe(self.enclose_value(prepend))
+        if append:
+            div_classes.append('input-append')
+            self.append_html = mark_safe(self.enclose_value(append))
+        self.enclosed_classes = ' '.join(div_classes)
+
     def enclose_value(self, value):
         """
         If value doesn't starts with html open sign "<", enclose in add-on tag
@@ -63,24 +72,14 @@ class EnclosedInput(TextInput):
             value = '<i class="%s"></i>' % value
         return '<span class="add-on">%s</span>' % value
 
-    def render(self, name, value, attrs=None, renderer=None):
-        if django_version < (2, 0):
-            output = super(EnclosedInput, self).render(name, value, attrs)
-        else:
-            output = super(EnclosedInput, self).render(name, value, attrs, renderer)
-
-        div_classes = []
-        if self.prepend:
-            div_classes.append('input-prepend')
-            self.prepend = self.enclose_value(self.prepend)
-            output = ''.join((self.prepend, output))
-        if self.append:
-            div_classes.append('input-append')
-            self.append = self.enclose_value(self.append)
-            output = ''.join((output, self.append))
-
-        return mark_safe(
-            '<div class="%s">%s</div>' % (' '.join(div_classes), output))
+    def get_context(self, name, value, attrs):
+        context = super(EnclosedInput, self).get_context(name, value, attrs)
+        context['widget'].update({
+            'prepend': self.prepend_html,
+            'append': self.append_html,
+            'enclosed_classes': self.enclosed_classes,
+        })
+        return context
 
 
 class AutosizedTextarea(Textarea):
@@ -88,81 +87,66 @@ class AutosizedTextarea(Textarea):
     Autosized Textarea - textarea height dynamically grows based on user input
     """
 
+    # Plugin script also initializes every autosize textarea on page load
+    # and in added inline rows, so no inline <script> per widget is needed
+    media = forms.Media(js=("suit5/js/jquery.autosize-min.js",))
+
     def __init__(self, attrs=None):
         new_attrs = _make_attrs(attrs, {"rows": 2}, "autosize")
         super(AutosizedTextarea, self).__init__(new_attrs)
 
-    @property
-    def media(self):
-        return forms.Media(js=[static("suit/js/jquery.autosize-min.js")])
-
-    def render(self, name, value, attrs=None, renderer=None):
-        if django_version < (2, 0):
-            output = super(AutosizedTextarea, self).render(name, value, attrs)
-        else:
-            output = super(AutosizedTextarea, self).render(name, value, attrs, renderer)
-
-        output += mark_safe(
-            "<script type=\"text/javascript\">Suit.$('#id_%s').autosize();</script>"
-            % name)
-        return output
-
 
 #
 # Original date widgets with addition html
 #
+suit_date_picker_media = forms.Media(js=("suit5/js/suit-datepicker.js",))
+
+
+def date_picker_media():
+    """
+    Return Suit date picker media, if enabled instead of Django
+    calendar.js and DateTimeShortcuts.js
+    """
+    if get_config('DATE_PICKER') == 'suit':
+        return suit_date_picker_media
+
+
 class SuitDateWidget(AdminDateWidget):
+    template_name = 'suit5/widgets/date.html'
+
     def __init__(self, attrs=None, format=None):
         defaults = {'placeholder': _('Date:')[:-1]}
         new_attrs = _make_attrs(attrs, defaults, "vDateField input-small")
         super(SuitDateWidget, self).__init__(attrs=new_attrs, format=format)
 
-    def render(self, name, value, attrs=None, renderer=None):
-        if django_version < (1, 11):
-            output = super(SuitDateWidget, self).render(name, value, attrs)
-        else:
-            output = super(SuitDateWidget, self).render(name, value, attrs, renderer)
-        return mark_safe(
-            '<div class="input-append suit-date">%s<span '
-            'class="add-on"><i class="icon-calendar"></i></span></div>' %
-            output)
+    @property
+    def media(self):
+        return date_picker_media() or super(SuitDateWidget, self).media
 
 
 class SuitTimeWidget(AdminTimeWidget):
+    template_name = 'suit5/widgets/time.html'
+
     def __init__(self, attrs=None, format=None):
         defaults = {'placeholder': _('Time:')[:-1]}
         new_attrs = _make_attrs(attrs, defaults, "vTimeField input-small")
         super(SuitTimeWidget, self).__init__(attrs=new_attrs, format=format)
 
-    def render(self, name, value, attrs=None, renderer=None):
-        if django_version < (2, 0):
-            output = super(SuitTimeWidget, self).render(name, value, attrs)
-        else:
-            output = super(SuitTimeWidget, self).render(name, value, attrs, renderer)
-        return mark_safe(
-            '<div class="input-append suit-date suit-time">%s<span '
-            'class="add-on"><i class="icon-time"></i></span></div>' %
-            output)
+    @property
+    def media(self):
+        return date_picker_media() or super(SuitTimeWidget, self).media
 
 
 class SuitSplitDateTimeWidget(forms.SplitDateTimeWidget):
     """
     A SplitDateTime Widget that has some admin-specific styling.
     """
+    template_name = 'suit5/widgets/split_datetime.html'
 
     def __init__(self, attrs=None):
         widgets = [SuitDateWidget, SuitTimeWidget]
         forms.MultiWidget.__init__(self, widgets, attrs)
 
-    if django_version < (1, 11):
-        def format_output(self, rendered_widgets):
-            out_tpl = '<div class="datetime">%s %s</div>'
-            return mark_safe(out_tpl % (rendered_widgets[0], rendered_widgets[1]))
-    else:
-        def render(self, name, value, attrs=None, renderer=None):
-            output = super(SuitSplitDateTimeWidget, self).render(name, value, attrs, renderer)
-            return mark_safe('<div class="datetime">%s</div>' % output)
-
 
 def _make_attrs(attrs, defaults=None, classes=None):
     result = defaults.copy() if defaults else {}